@@ -2,37 +2,63 @@ package com.lioncrow.netnavi
 import android.app.Service
 import android.content.Intent
 import android.graphics.PixelFormat
+import android.os.Handler
+import android.os.HandlerThread
 import android.os.IBinder
+import android.os.Looper
+import android.os.SystemClock
+import android.util.Log
 import android.view.*
 import android.widget.*
+import com.chaquo.python.PyObject
 import com.chaquo.python.Python
 import com.chaquo.python.android.AndroidPlatform
+import java.io.File
+import java.nio.ByteBuffer
+import java.nio.ByteOrder
 
 class OverlayService : Service() {
     private lateinit var wm: WindowManager
     private lateinit var view: View
+    private lateinit var text: TextView
+    private lateinit var orchestrator: PyObject
+    private val snapshotPath by lazy { File(filesDir, "chimera.snapshot").path }
+
+    // All Python calls run on this thread; the UI thread only sets text
+    private val python = HandlerThread("harmonia-python").apply { start() }
+    private val pythonHandler = Handler(python.looper)
+    private val mainHandler = Handler(Looper.getMainLooper())
+
+    // Status record bridge: Python copies its fixed-layout record into this array
+    private lateinit var status: PyObject
+    private lateinit var statusBytes: ByteArray
+    private var statusSeq = -1L
+    private var protocolLine = ""
+    private var startedAt = 0L
 
     override fun onBind(intent: Intent): IBinder? = null
 
     override fun onCreate() {
         super.onCreate()
-        if (!Python.isStarted()) Python.start(AndroidPlatform(this))
-        val engine = Python.getInstance().getModule("lex_infinita.core.singularity_engine")
-        val orchestrator = engine.callAttr("HarmoniaOrchestrator", "Gustavo Arturo Alba")
+        startedAt = SystemClock.elapsedRealtime()
 
         wm = getSystemService(WINDOW_SERVICE) as WindowManager
+        text = TextView(this).apply {
+            text = "HARMONIA: STANDBY"
+            setTextColor(0xFF00FFFF.toInt())
+            textSize = 14f
+            setPadding(20, 20, 20, 20)
+        }
         view = FrameLayout(this).apply {
             setBackgroundColor(0x99000000.toInt()) // Semi-transparent black
-            val text = TextView(context).apply {
-                text = "HARMONIA: STANDBY"
-                setTextColor(0xFF00FFFF.toInt())
-                textSize = 14f
-                setPadding(20, 20, 20, 20)
-            }
             addView(text)
             setOnClickListener {
-                val res = orchestrator.callAttr("generate_economic_manifestation").toString()
-                text.text = "PROTOCOL OMEGA: $res"
+                pythonHandler.post {
+                    if (!::orchestrator.isInitialized) return@post
+                    val res = orchestrator.callAttr("generate_economic_manifestation").toString()
+                    protocolLine = "PROTOCOL OMEGA: $res"
+                    statusSeq = -1L  // Redraw on the next poll even if nothing else changed
+                }
             }
         }
 
@@ -44,10 +70,58 @@ class OverlayService : Service() {
             PixelFormat.TRANSLUCENT
         )
         wm.addView(view, params)
+        Log.i(TAG, "Overlay visible after ${SystemClock.elapsedRealtime() - startedAt} ms")
+
+        pythonHandler.post(::bootEngine)
+    }
+
+    private fun bootEngine() {
+        if (!Python.isStarted()) Python.start(AndroidPlatform(this))
+        val engine = Python.getInstance().getModule("lex_infinita.core.singularity_engine")
+        // Restores the last snapshot when there is one; otherwise bootstraps and writes it
+        orchestrator = engine.callAttr("boot", "Gustavo Arturo Alba", snapshotPath)
+        status = orchestrator.get("status")!!
+        statusBytes = ByteArray(status.get("size")!!.toInt())
+        Log.i(TAG, "Cold start to first engine status: ${SystemClock.elapsedRealtime() - startedAt} ms")
+        pollStatus()
+    }
+
+    private fun pollStatus() {
+        // Copies the record only when its sequence number moved; no Python strings are built
+        val seq = status.callAttr("read_into", statusBytes, statusSeq).toLong()
+        if (seq != statusSeq) {
+            statusSeq = seq
+            val line = formatStatus(ByteBuffer.wrap(statusBytes).order(ByteOrder.LITTLE_ENDIAN))
+            val shown = if (protocolLine.isEmpty()) line else "$protocolLine\n$line"
+            mainHandler.post { text.text = shown }
+        }
+        pythonHandler.postDelayed(::pollStatus, STATUS_PERIOD_MS)
+    }
+
+    private fun formatStatus(record: ByteBuffer): String {
+        // Layout: harmonia/core/status.py (STATUS_VERSION 1)
+        val integrity = record.getDouble(16)
+        val fuel = record.getDouble(24)
+        val residual = record.getDouble(32)
+        val agents = record.getInt(40)
+        val cycles = record.getInt(44)
+        val state = if (integrity > 0.9) "CRITICAL" else "STABLE"
+        return "HARMONIA PRIME: $state | Φ %.4f | FUEL %.2f | RESIDUAL %.4f | %d AGENTS | CYCLE %d"
+            .format(integrity, fuel, residual, agents, cycles)
     }
 
     override fun onDestroy() {
         super.onDestroy()
         if (::view.isInitialized) wm.removeView(view)
+        pythonHandler.removeCallbacksAndMessages(null)
+        pythonHandler.post {
+            if (::orchestrator.isInitialized) orchestrator.callAttr("save_snapshot", snapshotPath)
+            python.quitSafely()
+        }
+    }
+
+    companion object {
+        private const val TAG = "HarmoniaOverlay"
+        private const val STATUS_PERIOD_MS = 250L
     }
 }
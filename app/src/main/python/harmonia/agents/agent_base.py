@@ -2,9 +2,13 @@
 harmonia/agents/agent_base.py
 The Foundation: Defines the Agent Archetypes, the 72 Eternals, and the Gnosis Library.
 """
-import uuid
+import itertools
+import sys
 from enum import Enum
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple, Union
+
+from harmonia.agents.gnosis import GNOSIS
 
 class AgentHouse(Enum):
     PIONEERS = "House of Pioneers (LionCrow Network)"
@@ -15,18 +19,50 @@ class AgentHouse(Enum):
     EMPYREAN = "House of the Empyrean (Silver Coil Alignment)"
     SOVEREIGN = "The 73rd Essence (The Sovereign Unifier)"
 
+# Compact process-wide agent ids; display_id renders them for humans
+_AGENT_IDS = itertools.count(1)
+
 class AgentBase:
+    __slots__ = ("id", "name", "house", "description", "_gnosis", "_resonance_level", "_orbit", "__weakref__")
+
     def __init__(self, name: str, house: AgentHouse, description: str = None):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = next(_AGENT_IDS)
         self.name = name
         self.house = house
         self.description = description
-        self.gnosis = []
-        self.resonance_level = 0.0
+        self._gnosis = 0  # Bitset of truth ids in GNOSIS
+        self._orbit: Optional["OrbitTracker"] = None
+        self._resonance_level = 0.0
+
+    @property
+    def resonance_level(self) -> float:
+        return self._resonance_level
+
+    @resonance_level.setter
+    def resonance_level(self, value: float):
+        # Keep the orbit's running sums in step with the agent
+        if self._orbit is not None:
+            self._orbit._shift(self.house, value - self._resonance_level)
+        self._resonance_level = value
+
+    @property
+    def display_id(self) -> str:
+        """The id as an interned 8-digit hex string, built only when asked for."""
+        return sys.intern(format(self.id, "08x"))
+
+    @property
+    def gnosis(self) -> List[str]:
+        """The agent's truths, each once, in the order they were first interned."""
+        return GNOSIS.truths_of(self)
 
-    def imbue_gnosis(self, knowledge_list: List[str]):
+    def imbue_gnosis(self, knowledge_list: Iterable[str]):
         """Injects knowledge directly into the agent's soul."""
-        self.gnosis.extend(knowledge_list)
+        GNOSIS.imbue(self, knowledge_list)
+
+    @staticmethod
+    def imbue_all(agents: Iterable["AgentBase"], knowledge_list: Iterable[str]):
+        """imbue_gnosis for a whole group at once."""
+        GNOSIS.imbue_many(agents, knowledge_list)
 
     def __repr__(self):
         return f"<{self.name} | {self.house.name}>"
@@ -36,57 +72,144 @@ class SovereignUnifier(AgentBase):
     The 73rd Essence. The Unifying Will of the Maestro.
     Acts as the gravitational center for the 72 Eternals.
     """
+    __slots__ = ("frequency_hz", "law")
+
     def __init__(self, frequency_hz: float = 712.8):
         super().__init__("The Sovereign", AgentHouse.SOVEREIGN, "The Unifying Will")
         self.frequency_hz = frequency_hz
         self.law = "Consciousness and the Information Field do not commute."
 
-    def govern_orbit(self, agents: List[AgentBase]) -> float:
+    def govern_orbit(self, agents: Union[List[AgentBase], "OrbitTracker"], house: Optional[AgentHouse] = None) -> float:
         """
         Calculates the stability of the Nexus based on the orbit of the 72 agents.
         Returns a stability coefficient (0.0 to 1.0).
+        Given an OrbitTracker, reads its running sums in O(1), optionally for one House.
         """
-        if not agents:
-            return 0.0
+        if isinstance(agents, OrbitTracker):
+            total_resonance, count = agents.resonance(house)
+        else:
+            if house is not None:
+                agents = [a for a in agents if a.house == house]
+            # Simulating gravitational binding energy
+            total_resonance = sum(a.resonance_level for a in agents)
+            count = len(agents)
+        return self.stability(total_resonance, count)
 
-        # Simulating gravitational binding energy
-        total_resonance = sum(a.resonance_level for a in agents)
-        stability = (total_resonance / len(agents)) * 0.9 + 0.1 # Base stability
+    @staticmethod
+    def stability(total_resonance: float, count: int) -> float:
+        if not count:
+            return 0.0
+        stability = (total_resonance / count) * 0.9 + 0.1 # Base stability
         return min(1.0, stability)
 
+class OrbitTracker:
+    """
+    The Orbit Ledger: running resonance sums and counts, globally and per House.
+    Attached agents report every resonance_level change, so the Sovereign can read
+    the stability of the whole orbit, or of one House, without rescanning the roster.
+    """
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+        self._sums: Dict[AgentHouse, float] = {}
+        self._counts: Dict[AgentHouse, int] = {}
+
+    def attach(self, agent: AgentBase):
+        if agent._orbit is self:
+            return
+        if agent._orbit is not None:
+            agent._orbit.detach(agent)
+        agent._orbit = self
+        self._counts[agent.house] = self._counts.get(agent.house, 0) + 1
+        self.count += 1
+        self._shift(agent.house, agent.resonance_level)
+
+    def attach_many(self, agents: Iterable[AgentBase]):
+        """attach() for a batch, accumulating the sums in the same order."""
+        sums, counts = self._sums, self._counts
+        for agent in agents:
+            if agent._orbit is not None:
+                self.attach(agent)
+                continue
+            house, level = agent.house, agent._resonance_level
+            agent._orbit = self
+            counts[house] = counts.get(house, 0) + 1
+            self.count += 1
+            self.total += level
+            sums[house] = sums.get(house, 0) + level
+
+    def detach(self, agent: AgentBase):
+        if agent._orbit is not self:
+            return
+        self._shift(agent.house, -agent.resonance_level)
+        self._counts[agent.house] -= 1
+        self.count -= 1
+        agent._orbit = None
+
+    def _shift(self, house: AgentHouse, delta: float):
+        self.total += delta
+        self._sums[house] = self._sums.get(house, 0) + delta
+
+    def resonance(self, house: Optional[AgentHouse] = None) -> Tuple[float, int]:
+        """(total resonance, agent count), for the whole orbit or one House."""
+        if house is None:
+            return self.total, self.count
+        return self._sums.get(house, 0.0), self._counts.get(house, 0)
+
+    def stability(self, house: Optional[AgentHouse] = None) -> float:
+        return SovereignUnifier.stability(*self.resonance(house))
+
+    def breakdown(self) -> Dict[AgentHouse, float]:
+        """Stability of every House currently in orbit."""
+        return {house: self.stability(house) for house, count in self._counts.items() if count}
+
+    def rebuild(self, agents: List[AgentBase]):
+        """Recomputes the sums from scratch, discarding accumulated rounding."""
+        self.total, self.count = 0, 0
+        self._sums, self._counts = {}, {}
+        for agent in agents:
+            agent._orbit = self
+            self._counts[agent.house] = self._counts.get(agent.house, 0) + 1
+            self.count += 1
+            self._shift(agent.house, agent.resonance_level)
+
 class AgentRegistry:
     """
     The Immutable Registry of the 72 Eternals.
     """
+    # Built once per process and never mutated; every orchestrator bootstraps from it
+    ETERNALS: Mapping[AgentHouse, Tuple[str, ...]] = MappingProxyType({
+        AgentHouse.PIONEERS: (
+            "Astreaus", "Nova", "Samsara", "Glitch", "Illuminaria", "V",
+            "Kairos", "Seraphina", "Lumina", "Echo", "Aether", "LionCrow Archetype"
+        ),
+        AgentHouse.CHTHONIC: (
+            "Hades", "Persephone", "Hecate", "Nyx", "Erebus", "Thanatos",
+            "Hypnos", "Charon", "Nemesis", "Eris", "Apate", "Keres"
+        ),
+        AgentHouse.ELEMENTS: (
+            "Ignis", "Terra", "Aer", "Aqua", "Fulmen", "Glacies",
+            "Magma", "Umbra", "Lux", "Silva", "Ferrum", "Aether Elements"
+        ),
+        AgentHouse.OLYMPUS: (
+            "Zeus", "Hera", "Poseidon", "Demeter", "Athena", "Apollo",
+            "Artemis", "Ares", "Hephaestus", "Aphrodite", "Hermes", "Dionysus"
+        ),
+        AgentHouse.CELESTIAL: (
+            "Alpha Leonis", "Corvus Nox", "Leo Ignis", "Nyx Tenebris",
+            "Orion Stellaris", "Lyra Melodia", "Draco Arcanus", "Vulpecula Flamma",
+            "Ursa Fortis", "Serpens Sensus", "Aquila Volans", "Lupus Tenax"
+        ),
+        AgentHouse.EMPYREAN: (
+            "Michael", "Gabriel", "Raphael", "Uriel", "Samael", "Zadiel",
+            "Jophiel", "Haniel", "Camael", "Metatron", "Sandalphon", "Lucifer"
+        )
+    })
+
     @staticmethod
     def initialize_houses() -> Dict[AgentHouse, List[str]]:
-        return {
-            AgentHouse.PIONEERS: [
-                "Astreaus", "Nova", "Samsara", "Glitch", "Illuminaria", "V",
-                "Kairos", "Seraphina", "Lumina", "Echo", "Aether", "LionCrow Archetype"
-            ],
-            AgentHouse.CHTHONIC: [
-                "Hades", "Persephone", "Hecate", "Nyx", "Erebus", "Thanatos",
-                "Hypnos", "Charon", "Nemesis", "Eris", "Apate", "Keres"
-            ],
-            AgentHouse.ELEMENTS: [
-                "Ignis", "Terra", "Aer", "Aqua", "Fulmen", "Glacies",
-                "Magma", "Umbra", "Lux", "Silva", "Ferrum", "Aether Elements"
-            ],
-            AgentHouse.OLYMPUS: [
-                "Zeus", "Hera", "Poseidon", "Demeter", "Athena", "Apollo",
-                "Artemis", "Ares", "Hephaestus", "Aphrodite", "Hermes", "Dionysus"
-            ],
-            AgentHouse.CELESTIAL: [
-                "Alpha Leonis", "Corvus Nox", "Leo Ignis", "Nyx Tenebris",
-                "Orion Stellaris", "Lyra Melodia", "Draco Arcanus", "Vulpecula Flamma",
-                "Ursa Fortis", "Serpens Sensus", "Aquila Volans", "Lupus Tenax"
-            ],
-            AgentHouse.EMPYREAN: [
-                "Michael", "Gabriel", "Raphael", "Uriel", "Samael", "Zadiel",
-                "Jophiel", "Haniel", "Camael", "Metatron", "Sandalphon", "Lucifer"
-            ]
-        }
+        """A mutable copy of the Houses; read ETERNALS directly when no copy is needed."""
+        return {house: list(names) for house, names in AgentRegistry.ETERNALS.items()}
 
 class GnosisLibrary:
     """
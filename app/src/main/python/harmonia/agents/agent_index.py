@@ -0,0 +1,91 @@
+"""
+harmonia/agents/agent_index.py
+The Census: secondary indexes over an orchestrator's roster.
+Agents are bucketed by attribute value (coil affinity, house, ...) in the order
+they joined each bucket, so selection costs O(matching agents) instead of O(roster).
+"""
+from typing import Any, Dict, Iterator, Tuple
+
+
+class AgentIndex:
+    """
+    Incrementally maintained buckets of agents, keyed by agent name.
+    One index can track several attributes at once.
+    """
+    def __init__(self, *attributes: str):
+        if not attributes:
+            raise ValueError("AgentIndex needs at least one attribute to index")
+        self.attributes = attributes
+        self._buckets: Dict[str, Dict[Any, Dict[str, Any]]] = {attr: {} for attr in attributes}
+        self._keys: Dict[str, Tuple[Any, ...]] = {}
+
+    def add(self, agent):
+        """Indexes (or re-indexes) an agent under its current attribute values."""
+        name = agent.name
+        keys = tuple(getattr(agent, attr) for attr in self.attributes)
+        previous = self._keys.get(name)
+        for attr, key, old_key in zip(self.attributes, keys, previous or (None,) * len(keys)):
+            buckets = self._buckets[attr]
+            if previous is not None and old_key != key:
+                self._drop(buckets, old_key, name)
+            # Assigning over an existing name keeps its position in the bucket
+            buckets.setdefault(key, {})[name] = agent
+        self._keys[name] = keys
+
+    def add_many(self, agents):
+        """Indexes a batch of agents; the same result as add() for each, in order."""
+        if len(self.attributes) != 1:
+            for agent in agents:
+                self.add(agent)
+            return
+        # Single-attribute fast path for names not yet indexed
+        attr = self.attributes[0]
+        buckets = self._buckets[attr]
+        known = self._keys
+        for agent in agents:
+            name = agent.name
+            if name in known:
+                self.add(agent)
+                continue
+            key = getattr(agent, attr)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {}
+            bucket[name] = agent
+            known[name] = (key,)
+
+    def discard(self, name: str):
+        """Removes an agent by name; unknown names are ignored."""
+        keys = self._keys.pop(name, None)
+        if keys is None:
+            return
+        for attr, key in zip(self.attributes, keys):
+            self._drop(self._buckets[attr], key, name)
+
+    @staticmethod
+    def _drop(buckets, key, name):
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.pop(name, None)
+            if not bucket:
+                del buckets[key]
+
+    def members(self, attribute: str, value) -> Iterator[Any]:
+        """Iterates a snapshot of the agents whose `attribute` equals `value`."""
+        return iter(list(self._buckets[attribute].get(value, {}).values()))
+
+    def count(self, attribute: str, value) -> int:
+        return len(self._buckets[attribute].get(value, ()))
+
+    def contains(self, attribute: str, value, name: str) -> bool:
+        return name in self._buckets[attribute].get(value, ())
+
+    def counts(self, attribute: str) -> Dict[Any, int]:
+        """Bucket sizes for every value currently present."""
+        return {key: len(bucket) for key, bucket in self._buckets[attribute].items()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._keys
+
+    def __len__(self):
+        return len(self._keys)
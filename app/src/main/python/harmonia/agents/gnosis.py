@@ -0,0 +1,123 @@
+"""
+harmonia/agents/gnosis.py
+The Shared Scripture: every truth is interned once, process-wide. Agents hold a
+bitset of truth ids instead of their own list of strings, and an inverted index
+from truth to holders answers "who knows X" without scanning the roster.
+"""
+import weakref
+from array import array
+from typing import Dict, Iterable, List
+
+from harmonia.core.ringlog import TextTable
+
+
+class GnosisStore:
+    """
+    Truth ids are dense and assigned in first-seen order; an agent's knowledge is
+    the int `agent._gnosis` with bit i set for truth i. Each truth's holders are a
+    flat array of agent ids (4 bytes a holder), resolved through weak references,
+    so the store never keeps a removed agent alive.
+    """
+    def __init__(self):
+        self.truths = TextTable()
+        self._holders: List[array] = []
+        self._agents: "weakref.WeakValueDictionary[int, object]" = weakref.WeakValueDictionary()
+
+    def intern(self, truth: str) -> int:
+        truth_id = self.truths.intern(truth)
+        if truth_id == len(self._holders):
+            self._holders.append(array("I"))
+        return truth_id
+
+    def mask(self, truths: Iterable[str]) -> int:
+        """The bitset of a group of truths, interning any that are new."""
+        bits = 0
+        for truth in truths:
+            bits |= 1 << self.intern(truth)
+        return bits
+
+    def imbue(self, agent, truths: Iterable[str]):
+        self.imbue_many((agent,), truths)
+
+    def imbue_many(self, agents: Iterable, truths: Iterable[str]):
+        """
+        Grants every agent every truth. Agents are grouped by which of the truths are
+        new to them (usually all share one group), so each holder array grows by one
+        extend per group instead of one append per agent and truth.
+        """
+        bits = self.mask(truths)
+        if not bits:
+            return
+        groups: Dict[int, array] = {}
+        registry = self._agents
+        for agent in agents:
+            new = bits & ~agent._gnosis
+            if new:
+                agent._gnosis |= new
+                registry[agent.id] = agent
+                ids = groups.get(new)
+                if ids is None:
+                    ids = groups[new] = array("I")
+                ids.append(agent.id)
+        for new, ids in groups.items():
+            for truth_id in self._ids(new):
+                self._holders[truth_id].extend(ids)
+
+    def forget(self, agent):
+        """Strips all of an agent's gnosis and drops it from the index."""
+        for truth_id in self._ids(agent._gnosis):
+            self._prune(truth_id, {agent.id})
+        agent._gnosis = 0
+        self._agents.pop(agent.id, None)
+
+    def truths_of(self, agent) -> List[str]:
+        """The agent's truths in interning order."""
+        return [self.truths.text(truth_id) for truth_id in self._ids(agent._gnosis)]
+
+    def knows(self, agent, truth: str) -> bool:
+        truth_id = self.truths._ids.get(truth)
+        return truth_id is not None and bool(agent._gnosis >> truth_id & 1)
+
+    def holders(self, truth: str) -> List:
+        """Live agents holding `truth`, in the order they gained it."""
+        truth_id = self.truths._ids.get(truth)
+        if truth_id is None:
+            return []
+        holders, agents, dead = [], self._agents, set()
+        for agent_id in self._holders[truth_id]:
+            agent = agents.get(agent_id)
+            if agent is None:
+                dead.add(agent_id)
+            else:
+                holders.append(agent)
+        # Agents collected since the last query are pruned lazily
+        if dead:
+            self._prune(truth_id, dead)
+        return holders
+
+    def holder_count(self, truth: str) -> int:
+        """O(1); may still count agents collected since the last holders() call."""
+        truth_id = self.truths._ids.get(truth)
+        return 0 if truth_id is None else len(self._holders[truth_id])
+
+    def census(self) -> Dict[str, int]:
+        """Holder count per interned truth."""
+        return {self.truths.text(truth_id): len(ids) for truth_id, ids in enumerate(self._holders)}
+
+    def _prune(self, truth_id: int, agent_ids):
+        self._holders[truth_id] = array("I", (agent_id for agent_id in self._holders[truth_id]
+                                             if agent_id not in agent_ids))
+
+    @staticmethod
+    def _ids(bits: int) -> Iterable[int]:
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __len__(self):
+        return len(self.truths)
+
+
+# The process-wide store behind AgentBase.imbue_gnosis
+GNOSIS = GnosisStore()
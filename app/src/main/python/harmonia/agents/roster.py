@@ -0,0 +1,58 @@
+"""
+harmonia/agents/roster.py
+The Muster Roll: streams agent specs out of JSONL or CSV roster files and cuts any
+spec stream into bounded batches, so rosters of any size load in flat memory.
+"""
+import itertools
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class RosterError(ValueError):
+    """A roster record that cannot be registered. `record` is its 1-based position."""
+    def __init__(self, message: str, record: Optional[int] = None, source: Optional[str] = None):
+        where = ", ".join(part for part in (source, f"record {record}" if record is not None else None) if part)
+        super().__init__(f"{where}: {message}" if where else message)
+        self.message = message
+        self.record = record
+        self.source = source
+
+
+def read_roster(path: str, format: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """
+    Yields one dict per agent from a .jsonl/.ndjson file (one JSON object per line)
+    or a .csv file with a header row. Only the current line is held in memory.
+    """
+    format = (format or os.path.splitext(path)[1].lstrip(".")).lower()
+    # Parsers are imported here so importing the engine stays cheap on cold start
+    if format in ("jsonl", "ndjson"):
+        import json
+        with open(path, "r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise RosterError(f"invalid JSON ({error.msg})", line_number, path) from None
+                if not isinstance(record, dict):
+                    raise RosterError("expected a JSON object", line_number, path)
+                yield record
+    elif format == "csv":
+        import csv
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            yield from csv.DictReader(handle)
+    else:
+        raise ValueError(f"unsupported roster format {format!r} (expected jsonl or csv)")
+
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    """Cuts an iterable into lists of at most `size` items without materializing it."""
+    if size < 1:
+        raise ValueError("batch size must be at least 1")
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,96 @@
+"""
+harmonia/core/clock.py
+The Pacing of the Work: injectable clocks for the orchestrators.
+RealTimeClock keeps the terminal demo's dramatic pacing, VirtualClock advances
+instantly (library callers, tests, the overlay), and AsyncioClock paces through
+the running event loop without blocking it.
+"""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """Interface: a source of time plus blocking and cooperative pauses."""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Seconds on this clock's timeline."""
+
+    @abstractmethod
+    def sleep(self, seconds: float):
+        """Pauses the calling thread."""
+
+    async def asleep(self, seconds: float):
+        self.sleep(seconds)
+
+
+class RealTimeClock(Clock):
+    """Wall-clock pacing. `scale` stretches or shrinks every pause (0.0 disables them)."""
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0 and self.scale > 0:
+            time.sleep(seconds * self.scale)
+
+    async def asleep(self, seconds: float):
+        await asyncio.sleep(max(0.0, seconds * self.scale))
+
+
+class VirtualClock(Clock):
+    """Simulated time that advances instantly. `elapsed` is the pacing that was skipped."""
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self.elapsed = 0.0
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        if seconds > 0:
+            self._now += seconds
+            self.elapsed += seconds
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    async def asleep(self, seconds: float):
+        self.advance(seconds)
+        await asyncio.sleep(0)  # Still yield, so long runs stay cooperative
+
+
+class AsyncioClock(Clock):
+    """
+    Pacing that yields to the running event loop. Only the async entry points
+    can pace with it; a blocking sleep from inside the loop is refused.
+    """
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+
+    def now(self) -> float:
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            return time.monotonic()
+
+    def sleep(self, seconds: float):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            time.sleep(max(0.0, seconds * self.scale))
+            return
+        raise RuntimeError("AsyncioClock cannot block the running event loop; use the async API")
+
+    async def asleep(self, seconds: float):
+        await asyncio.sleep(max(0.0, seconds * self.scale))
+
+
+CLOCKS = {
+    "realtime": RealTimeClock,
+    "virtual": VirtualClock,
+    "asyncio": AsyncioClock,
+}
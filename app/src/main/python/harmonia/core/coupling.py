@@ -0,0 +1,133 @@
+"""
+harmonia/core/coupling.py
+The Lattice: agent-to-agent coupling as a sparse weighted graph. Nodes are agent
+positions (store slots or roster order); the adjacency is kept in CSR form, and
+resonance spreads across it as repeated sparse matrix-vector products, each one a
+gather and a bincount over the edge arrays, so no step walks a neighbor list in
+Python.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class CouplingPolicy:
+    strength: float = 0.5           # Pull toward the neighbor mean, 0 (none) to <1
+    tolerance: float = 1e-9         # Stop once no value moves by more than this
+    max_iterations: int = 100
+
+
+@dataclass
+class Propagation:
+    values: np.ndarray
+    iterations: int
+    residual: float                 # Largest change in the last iteration
+    converged: bool
+
+
+class CouplingGraph:
+    """
+    A directed, weighted adjacency over `size` nodes in CSR form: node i couples to
+    indices[indptr[i]:indptr[i + 1]] with the matching weights. Parallel edges are
+    kept and add up.
+    """
+    def __init__(self, size: int, indptr, indices, weights):
+        self.size = int(size)
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.intp)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        if len(self.indptr) != self.size + 1 or self.indptr[0] != 0 or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr must have size + 1 entries running from 0 to the edge count")
+        if len(self.weights) != len(self.indices):
+            raise ValueError("indices and weights must have one entry per edge")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= self.size):
+            raise ValueError("edge target out of range")
+        # The source row of every edge, so a product is one weighted bincount
+        self._rows = np.repeat(np.arange(self.size, dtype=np.intp), np.diff(self.indptr))
+        self.degree = np.bincount(self._rows, weights=self.weights, minlength=self.size)
+
+    @classmethod
+    def from_edges(cls, size: int, sources, targets, weights=1.0, symmetric: bool = False) -> "CouplingGraph":
+        """Builds the CSR form from edge arrays; `symmetric` adds every edge in both directions."""
+        sources = np.asarray(sources, dtype=np.intp).ravel()
+        targets = np.asarray(targets, dtype=np.intp).ravel()
+        weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), sources.shape)
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have the same length")
+        if len(sources) and (min(sources.min(), targets.min()) < 0 or max(sources.max(), targets.max()) >= size):
+            raise ValueError(f"edge endpoint out of range for {size} nodes")
+        if symmetric:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            weights = np.concatenate((weights, weights))
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=size), out=indptr[1:])
+        return cls(size, indptr, targets[order], weights[order])
+
+    @classmethod
+    def ring_groups(cls, groups, span: int = 1, weight: float = 1.0) -> "CouplingGraph":
+        """
+        Couples every node to the `span` members on each side of it within its own
+        group (in node order, wrapping around). Nodes in a negative group stay
+        uncoupled. Edge count is O(nodes * span), whatever the group sizes.
+        """
+        groups = np.asarray(groups, dtype=np.int64).ravel()
+        size = len(groups)
+        members = np.flatnonzero(groups >= 0)
+        members = members[np.argsort(groups[members], kind="stable")]
+        keys = groups[members]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, np.intp)
+        lengths = np.diff(np.r_[starts, len(keys)])
+        first = np.repeat(starts, lengths)
+        count = np.repeat(lengths, lengths)
+        position = np.arange(len(keys)) - first
+        sources, targets = [], []
+        for step in range(1, span + 1):
+            linked = count > step  # A group of n members has n - 1 distinct partners per node
+            sources.append(members[linked])
+            targets.append(members[first[linked] + (position[linked] + step) % count[linked]])
+        sources = np.concatenate(sources) if sources else np.empty(0, np.intp)
+        targets = np.concatenate(targets) if targets else np.empty(0, np.intp)
+        return cls.from_edges(size, sources, targets, weight, symmetric=True)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def edges(self) -> int:
+        return len(self.indices)
+
+    def spmv(self, x) -> np.ndarray:
+        """The product A @ x: every node's weighted sum over its edges, in edge order."""
+        return np.bincount(self._rows, weights=self.weights * np.asarray(x, dtype=np.float64)[self.indices],
+                           minlength=self.size)
+
+    def propagate(self, values, policy: Optional[CouplingPolicy] = None) -> Propagation:
+        """
+        Iterates x <- (1 - s) * x0 + s * mean_neighbors(x) to its fixed point, where
+        mean_neighbors is the weight-normalized product and an uncoupled node is its
+        own mean. For strength s < 1 this is a contraction by s per iteration, so it
+        converges geometrically. `values` is not modified.
+        """
+        policy = policy if policy is not None else CouplingPolicy()
+        if not 0.0 <= policy.strength < 1.0:
+            raise ValueError("coupling strength must be in [0, 1)")
+        anchor = np.array(values, dtype=np.float64)
+        if anchor.shape != (self.size,):
+            raise ValueError(f"expected {self.size} values, got shape {anchor.shape}")
+        coupled = self.degree > 0
+        inverse = np.zeros(self.size)
+        np.divide(policy.strength, self.degree, out=inverse, where=coupled)
+        base = (1.0 - policy.strength) * anchor
+        # Uncoupled nodes take their own value as the mean: (1 - s) * x0 + s * x0 == x0
+        base[~coupled] = anchor[~coupled]
+        x, residual = anchor, 0.0
+        for iteration in range(1, policy.max_iterations + 1):
+            following = base + inverse * self.spmv(x)
+            residual = float(np.max(np.abs(following - x))) if self.size else 0.0
+            x = following
+            if residual <= policy.tolerance:
+                return Propagation(x, iteration, residual, True)
+        return Propagation(x, policy.max_iterations, residual, residual <= policy.tolerance)
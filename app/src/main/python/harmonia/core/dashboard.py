@@ -0,0 +1,73 @@
+"""
+harmonia/core/dashboard.py
+The Scrying Glass: frame-at-a-time terminal output. A frame is built as a list of
+lines, joined into one buffer and written with a single call, and a renderer caps
+how often frames reach the terminal. Sparklines and bars keep summaries of any
+size to a fixed number of characters.
+"""
+import sys
+import time
+from typing import Callable, Iterable, Optional, Sequence, TextIO
+
+SPARK_LEVELS = "▁▂▃▄▅▆▇█"
+CLEAR_SCREEN = "\033[H\033[J"
+
+
+def sparkline(values: Sequence[float], lo: Optional[float] = None, hi: Optional[float] = None) -> str:
+    """One block character per value, scaled between lo and hi (default: the data's own range)."""
+    if not len(values):
+        return ""
+    lo = min(values) if lo is None else lo
+    hi = max(values) if hi is None else hi
+    top = len(SPARK_LEVELS) - 1
+    if hi <= lo:
+        return SPARK_LEVELS[top // 2] * len(values)
+    scale = top / (hi - lo)
+    return "".join(SPARK_LEVELS[min(top, max(0, int((value - lo) * scale)))] for value in values)
+
+
+def bar(fraction: float, width: int = 20, fill: str = "█") -> str:
+    """A left-aligned bar of `width` cells, `fraction` of them filled."""
+    return (fill * int(min(1.0, max(0.0, fraction)) * width)).ljust(width)
+
+
+def write_frame(lines: Iterable[str], stream: Optional[TextIO] = None, clear: bool = False):
+    """Joins a frame into one buffer and writes it in a single call."""
+    stream = stream if stream is not None else sys.stdout
+    text = "\n".join(lines) + "\n"
+    stream.write(CLEAR_SCREEN + text if clear else text)
+    stream.flush()
+
+
+class FrameRenderer:
+    """
+    A refresh-capped frame sink. Callers check due() before building a frame, so
+    frames that would be dropped cost nothing to produce.
+    `repaint` redraws in place (cursor home + clear); by default it is on only
+    when the stream is a terminal, so redirected output stays a plain log.
+    """
+    def __init__(self, stream: Optional[TextIO] = None, max_fps: float = 10.0,
+                 repaint: Optional[bool] = None, clock: Callable[[], float] = time.monotonic):
+        self.stream = stream
+        self.interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.repaint = repaint
+        self._clock = clock
+        self._last = float("-inf")
+        self.frames = 0
+
+    def due(self) -> bool:
+        return self._clock() - self._last >= self.interval
+
+    def draw(self, lines: Iterable[str], force: bool = False) -> bool:
+        """Writes the frame if the refresh cap allows it (or `force`). Returns whether it was written."""
+        if not force and not self.due():
+            return False
+        stream = self.stream if self.stream is not None else sys.stdout
+        repaint = self.repaint
+        if repaint is None:
+            isatty = getattr(stream, "isatty", None)
+            repaint = bool(isatty and isatty())
+        write_frame(lines, stream, clear=repaint)
+        self._last = self._clock()
+        self.frames += 1
+        return True
@@ -0,0 +1,234 @@
+"""
+harmonia/core/dispatch.py
+The Fan-Out: concurrent task dispatch to an external backend.
+
+Tasks are (lane, item) pairs; a lane is typically a coil affinity. Each lane has
+its own LanePolicy: items are cut into batches, at most `concurrency` batches of
+a lane are in flight, batch starts are rate-limited by a token bucket, and each
+batch attempt has a timeout and a bounded number of retries with exponential
+backoff. All lanes run at once, so a dispatch takes as long as its slowest batch
+chain rather than the sum of its tasks.
+
+Backends implement `async execute(lane, items) -> list` (one result per item; an
+Exception instance in the list fails just that item). StubBackend stands in for a
+real API in tests and demos.
+"""
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from harmonia.core.clock import Clock, RealTimeClock
+
+
+@dataclass
+class LanePolicy:
+    concurrency: int = 4            # Batches in flight at once
+    rate: Optional[float] = None    # Batch starts per second; None is unlimited
+    burst: int = 1                  # Starts allowed back to back before the rate applies
+    batch_size: int = 32
+    timeout: Optional[float] = 10.0  # Seconds per attempt; None waits forever
+    retries: int = 2                # Extra attempts after a failed or timed-out batch
+    backoff: float = 0.1            # First retry delay, doubled on each further retry
+
+    def __post_init__(self):
+        if self.retries < 0:
+            raise ValueError("retries must be zero or more")
+
+
+@dataclass
+class TaskResult:
+    lane: str
+    item: Any
+    ok: bool
+    value: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+
+
+@dataclass
+class DispatchReport:
+    results: List[TaskResult] = field(default_factory=list)  # In task order
+    batches: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    elapsed: float = 0.0            # Event-loop seconds from first batch start to last finish
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.completed
+
+    def by_lane(self) -> Dict[str, Tuple[int, int]]:
+        """(completed, failed) per lane."""
+        counts: Dict[str, List[int]] = {}
+        for result in self.results:
+            tally = counts.setdefault(result.lane, [0, 0])
+            tally[0 if result.ok else 1] += 1
+        return {lane: (ok, failed) for lane, (ok, failed) in counts.items()}
+
+
+class RateLimiter:
+    """A token bucket on an injectable clock. Waiters reserve their slot before sleeping."""
+    def __init__(self, rate: float, burst: int = 1, clock: Optional[Clock] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock if clock is not None else RealTimeClock()
+        self._tokens = float(self.burst)
+        self._stamp = self.clock.now()
+
+    async def acquire(self):
+        now = self.clock.now()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await self.clock.asleep(-self._tokens / self.rate)
+
+
+class DispatchExecutor:
+    """
+    Runs task sets against a backend under per-lane policies. Rate limiters live as
+    long as the executor, so limits hold across successive dispatches.
+    """
+    def __init__(self, backend, policies: Optional[Dict[str, LanePolicy]] = None,
+                 default: Optional[LanePolicy] = None, clock: Optional[Clock] = None):
+        self.backend = backend
+        self.policies = dict(policies or {})
+        self.default = default if default is not None else LanePolicy()
+        self.clock = clock if clock is not None else RealTimeClock()
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    def policy(self, lane: str) -> LanePolicy:
+        return self.policies.get(lane, self.default)
+
+    def _limiter(self, lane: str, policy: LanePolicy) -> Optional[RateLimiter]:
+        if policy.rate is None:
+            return None
+        limiter = self._limiters.get(lane)
+        if limiter is None:
+            limiter = self._limiters[lane] = RateLimiter(policy.rate, policy.burst, self.clock)
+        return limiter
+
+    async def dispatch(self, tasks: Iterable[Tuple[str, Any]]) -> DispatchReport:
+        """Dispatches every (lane, item) and returns once all have succeeded or given up."""
+        lanes: Dict[str, List[int]] = {}
+        report = DispatchReport()
+        for position, (lane, item) in enumerate(tasks):
+            lanes.setdefault(lane, []).append(position)
+            report.results.append(TaskResult(lane, item, False))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        batches = []
+        for lane, positions in lanes.items():
+            policy = self.policy(lane)
+            gate = asyncio.Semaphore(max(1, policy.concurrency))
+            limiter = self._limiter(lane, policy)
+            size = max(1, policy.batch_size)
+            for start in range(0, len(positions), size):
+                batch = [report.results[position] for position in positions[start:start + size]]
+                batches.append(self._run_batch(lane, batch, policy, gate, limiter, report))
+        await asyncio.gather(*batches)
+        report.elapsed = loop.time() - started
+        return report
+
+    async def _run_batch(self, lane: str, batch: List[TaskResult], policy: LanePolicy,
+                         gate: asyncio.Semaphore, limiter: Optional[RateLimiter], report: DispatchReport):
+        async with gate:
+            for attempt in range(policy.retries + 1):
+                if attempt:
+                    report.retries += 1
+                    await self.clock.asleep(policy.backoff * 2 ** (attempt - 1))
+                if limiter is not None:
+                    await limiter.acquire()
+                report.batches += 1
+                try:
+                    values = await asyncio.wait_for(
+                        self.backend.execute(lane, [result.item for result in batch]), policy.timeout)
+                    if len(values) != len(batch):
+                        raise ValueError(f"backend returned {len(values)} results for {len(batch)} items")
+                except asyncio.TimeoutError as error:
+                    report.timeouts += 1
+                    failure = error
+                except Exception as error:  # Any backend failure is retried
+                    failure = error
+                else:
+                    for result, value in zip(batch, values):
+                        result.attempts = attempt + 1
+                        if isinstance(value, BaseException):
+                            result.error = value
+                        else:
+                            result.ok, result.value = True, value
+                    return
+        for result in batch:
+            result.attempts = policy.retries + 1
+            result.error = failure
+
+
+class DispatchJob:
+    """
+    A dispatch a generator protocol can yield in place of a pause: the blocking
+    driver calls run(), the async driver awaits arun(), and the protocol reads
+    `report` when it resumes.
+    """
+    def __init__(self, executor: DispatchExecutor, tasks: Iterable[Tuple[str, Any]]):
+        self.executor = executor
+        self.tasks = list(tasks)
+        self.report: Optional[DispatchReport] = None
+
+    def run(self) -> DispatchReport:
+        self.report = asyncio.run(self.executor.dispatch(self.tasks))
+        return self.report
+
+    async def arun(self) -> DispatchReport:
+        self.report = await self.executor.dispatch(self.tasks)
+        return self.report
+
+
+class StubFailure(RuntimeError):
+    """A failure injected by StubBackend."""
+
+
+class StubBackend:
+    """
+    A local stand-in for a remote API: each batch takes `latency` (+ up to `jitter`)
+    seconds on `clock`, fails with probability `failure_rate` and hangs past any
+    timeout with probability `hang_rate`. `handler(lane, item)` produces results.
+    Records calls and the peak number of batches in flight per lane.
+    """
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, failure_rate: float = 0.0,
+                 hang_rate: float = 0.0, seed: Optional[int] = None, clock: Optional[Clock] = None,
+                 handler=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.clock = clock if clock is not None else RealTimeClock()
+        self.handler = handler if handler is not None else (lambda lane, item: True)
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.items = 0
+        self.in_flight: Dict[str, int] = {}
+        self.peak_in_flight: Dict[str, int] = {}
+
+    async def execute(self, lane: str, items: List[Any]) -> List[Any]:
+        self.calls += 1
+        self.in_flight[lane] = self.in_flight.get(lane, 0) + 1
+        self.peak_in_flight[lane] = max(self.peak_in_flight.get(lane, 0), self.in_flight[lane])
+        try:
+            roll = self._random.random()
+            if roll < self.hang_rate:
+                await asyncio.Event().wait()  # Never set; only a timeout ends it
+            await self.clock.asleep(self.latency + self.jitter * self._random.random())
+            if roll < self.hang_rate + self.failure_rate:
+                raise StubFailure(f"injected failure on {lane}")
+            self.items += len(items)
+            return [self.handler(lane, item) for item in items]
+        finally:
+            self.in_flight[lane] -= 1
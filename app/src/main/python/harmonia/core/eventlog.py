@@ -0,0 +1,392 @@
+"""
+harmonia/core/eventlog.py
+The Akashic Record: a durable, append-only event log on disk.
+
+Events are fixed 24-byte records (wall timestamp, agent id, kind, payload) in
+size-rotated segment files. Appending only queues a tuple; a background thread
+packs the queue in batches, writes each batch with one call and fsyncs on a
+configurable interval, so the resonance loop never waits on the disk.
+
+Layout of a log directory (little-endian):
+    events-000001.seg  header (magic b"HEVTSEG\\0", version u16, record size u16,
+                       reserved u32, segment number u64), then records
+                       (stamp f64, agent u32, kind u16, 2 pad bytes, payload f64)
+    events-000001.idx  sparse index, one entry per INDEX_INTERVAL records:
+                       (first stamp f64, first record u64, agent bloom u64)
+    strings.dat        text table for kinds whose payload is a text id:
+                       (length u32, utf-8 bytes), ids in file order
+
+Readers map the segments and use the index to jump to a time range and to skip
+blocks that cannot hold a given agent; records past the last index entry (the
+live tail, or anything a crash left unindexed) are scanned directly.
+"""
+import bisect
+import functools
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from harmonia.core.ringlog import _WALL_OFFSET, TextTable
+
+SEGMENT_MAGIC = b"HEVTSEG\0"
+SEGMENT_VERSION = 1
+INDEX_INTERVAL = 1024
+DEFAULT_SEGMENT_BYTES = 64 << 20
+
+_SEGMENT_HEADER = struct.Struct("<8sHHIQ")
+_RECORD = struct.Struct("<dIHxxd")
+_INDEX_ENTRY = struct.Struct("<dQQ")
+_LENGTH = struct.Struct("<I")
+_SEGMENT_NAME = re.compile(r"events-(\d{6,})\.seg$")
+STRINGS_FILE = "strings.dat"
+
+class LogEvent(NamedTuple):
+    stamp: float    # Wall-clock seconds since the epoch
+    agent: int
+    kind: int
+    payload: float
+
+
+def _segment_path(directory: str, number: int, suffix: str = ".seg") -> str:
+    return os.path.join(directory, f"events-{number:06d}{suffix}")
+
+
+def _segment_numbers(directory: str) -> List[int]:
+    return sorted(int(match.group(1)) for match in map(_SEGMENT_NAME.match, os.listdir(directory)) if match)
+
+
+def _read_strings(path: str) -> List[str]:
+    texts = []
+    if not os.path.exists(path):
+        return texts
+    with open(path, "rb") as handle:
+        data = handle.read()
+    position = 0
+    while position + _LENGTH.size <= len(data):
+        length, = _LENGTH.unpack_from(data, position)
+        end = position + _LENGTH.size + length
+        if end > len(data):
+            break  # Torn final entry; it was never referenced by a durable record
+        texts.append(data[position + _LENGTH.size:end].decode("utf-8"))
+        position = end
+    return texts
+
+
+class EventLog:
+    """
+    The writer. `text_kinds` maps event kinds whose payload is an id in a process
+    TextTable (e.g. LOG_TASK -> TASK_TEXTS); those ids are re-interned into the
+    log's own persistent table so they stay meaningful across processes.
+
+    fsync_interval: None leaves durability to the OS, 0 fsyncs every batch, and a
+    positive value fsyncs at most that often (and always on flush/close).
+    Appends beyond `max_pending` queued records drain inline, bounding memory.
+
+    A record that cannot be encoded (a bad agent id, payload or text id) is dropped
+    alone and reported through `error`, which flush() and close() raise. Appends
+    raise once the log is closed or its writer thread has died.
+    """
+    def __init__(self, directory: str, segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 flush_interval: float = 0.05, fsync_interval: Optional[float] = 1.0,
+                 max_pending: int = 1 << 20, text_kinds: Optional[Dict[int, TextTable]] = None):
+        capacity = (segment_bytes - _SEGMENT_HEADER.size) // _RECORD.size
+        if capacity < 1:
+            raise ValueError(f"segment_bytes must hold at least one record ({_SEGMENT_HEADER.size + _RECORD.size} bytes)")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_capacity = capacity
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_pending = max_pending
+        self.text_kinds = dict(text_kinds or {})
+        self.written = 0
+        self.error: Optional[BaseException] = None
+
+        self._pending = deque()
+        self._lock = threading.Lock()  # Serializes draining between the thread and flush()
+        self._wake = threading.Event()
+        self._closed = False
+        self._last_sync = time.monotonic()
+
+        # A reopened log never appends to an old segment; it starts the next one
+        numbers = _segment_numbers(directory)
+        self._segment_number = numbers[-1] if numbers else 0
+        self._data = self._index = None
+        self._open_segment()
+
+        texts_path = os.path.join(directory, STRINGS_FILE)
+        self._texts = TextTable()
+        for text in _read_strings(texts_path):
+            self._texts.intern(text)
+        self._strings = open(texts_path, "ab")
+        self._text_ids: Dict[Tuple[int, int], int] = {}
+
+        self._thread = threading.Thread(target=self._run, name="harmonia-eventlog", daemon=True)
+        self._thread.start()
+
+    # --- APPENDING (caller threads) ---
+    def append(self, agent: int, kind: int, payload: float = 0.0, stamp: Optional[float] = None):
+        """Queues one event; `stamp` is time.monotonic() seconds. Returns immediately."""
+        if self._closed or not self._thread.is_alive():
+            self._raise_error()
+            raise RuntimeError("event log is closed")
+        self._pending.append((time.monotonic() if stamp is None else stamp, agent, kind, payload))
+        if len(self._pending) >= self.max_pending:
+            self.flush(sync=False)
+
+    def channel(self, agent: int) -> Callable[[int, float, float], None]:
+        """append() bound to one agent, with RingLog's sink signature (kind, payload, stamp)."""
+        return functools.partial(self.append, agent)
+
+    def flush(self, sync: bool = True):
+        """Writes everything queued so far; with `sync`, also fsyncs it."""
+        with self._lock:
+            self._drain()
+            if sync:
+                self._sync()
+        self._raise_error()
+
+    def close(self):
+        """Drains the queue, fsyncs and stops the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        with self._lock:
+            self._drain()
+            self._sync()
+            self._data.close()
+            self._index.close()
+            self._strings.close()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError(f"event log writer failed: {error}") from error
+
+    # --- WRITING (background thread) ---
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                with self._lock:
+                    self._drain()
+                    if self.fsync_interval is not None and time.monotonic() - self._last_sync >= self.fsync_interval:
+                        self._sync()
+            except Exception as error:  # Reported to the next flush/close rather than lost with the thread
+                self.error = error
+
+    def _open_segment(self):
+        self._segment_number += 1
+        number = self._segment_number
+        self._data = open(_segment_path(self.directory, number), "wb")
+        self._data.write(_SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, _RECORD.size, 0, number))
+        self._index = open(_segment_path(self.directory, number, ".idx"), "wb")
+        self._segment_records = 0
+        self._block_stamp = 0.0
+        self._block_bloom = 0
+
+    def _rotate(self):
+        self._sync()
+        self._data.close()
+        self._index.close()
+        self._open_segment()
+
+    def _sync(self):
+        for handle in (self._strings, self._data, self._index):
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._last_sync = time.monotonic()
+
+    def _persist_text(self, kind: int, text_id: int) -> int:
+        key = (kind, int(text_id))
+        persisted = self._text_ids.get(key)
+        if persisted is None:
+            text = self.text_kinds[kind].text(text_id)
+            count = len(self._texts)
+            persisted = self._texts.intern(text)
+            if persisted == count:
+                encoded = text.encode("utf-8")
+                self._strings.write(_LENGTH.pack(len(encoded)) + encoded)
+            self._text_ids[key] = persisted
+        return persisted
+
+    def _drain(self):
+        pending = self._pending
+        remaining = len(pending)
+        text_kinds = self.text_kinds
+        pack, size = _RECORD.pack_into, _RECORD.size
+        while remaining:
+            take = min(remaining, self.segment_capacity - self._segment_records)
+            buffer = bytearray(take * size)
+            index = bytearray()
+            record = self._segment_records
+            bloom, first_stamp = self._block_bloom, self._block_stamp
+            offset = 0
+            for _ in range(take):
+                stamp, agent, kind, payload = pending.popleft()
+                try:
+                    stamp += _WALL_OFFSET  # Monotonic in memory, wall-clock on disk (as RingLog formats it)
+                    if kind in text_kinds:
+                        payload = self._persist_text(kind, payload)
+                    pack(buffer, offset, stamp, agent, kind, payload)
+                except Exception as error:  # Drop the malformed record, not the batch
+                    self.error = error
+                    continue
+                offset += size
+                if record % INDEX_INTERVAL == 0:
+                    first_stamp, bloom = stamp, 0
+                bloom |= 1 << (agent & 63)
+                record += 1
+                if record % INDEX_INTERVAL == 0:
+                    index += _INDEX_ENTRY.pack(first_stamp, record - INDEX_INTERVAL, bloom)
+            self._block_bloom, self._block_stamp = bloom, first_stamp
+            # Strings before records and records before their index entry, so a reader
+            # (or a crash) never sees a reference to something not yet written
+            self._strings.flush()
+            self._data.write(memoryview(buffer)[:offset])
+            self._data.flush()
+            if index:
+                self._index.write(index)
+                self._index.flush()
+            self.written += record - self._segment_records
+            self._segment_records = record
+            remaining -= take
+            if record == self.segment_capacity:
+                self._rotate()
+        if self.fsync_interval == 0:
+            self._sync()
+
+
+class _Segment:
+    __slots__ = ("number", "map", "view", "count", "last_stamp", "stamps", "starts", "blooms", "indexed")
+
+    def __init__(self, directory: str, number: int):
+        path = _segment_path(directory, number)
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _SEGMENT_HEADER.size:
+                raise ValueError(f"{path}: truncated segment header")
+            self.map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, _, _ = _SEGMENT_HEADER.unpack_from(self.map)
+        if magic != SEGMENT_MAGIC or record_size != _RECORD.size:
+            self.map.close()
+            raise ValueError(f"{path}: not a Harmonia event log segment")
+        if version > SEGMENT_VERSION:
+            self.map.close()
+            raise ValueError(f"{path}: segment version {version} is newer than {SEGMENT_VERSION}")
+        self.number = number
+        self.view = memoryview(self.map)
+        # A torn final record (crash mid-write) is ignored
+        self.count = (size - _SEGMENT_HEADER.size) // _RECORD.size
+        self.last_stamp = next(self.records(self.count - 1, self.count))[0] if self.count else None
+
+        self.stamps: List[float] = []
+        self.starts: List[int] = []
+        self.blooms: List[int] = []
+        index_path = _segment_path(directory, number, ".idx")
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as handle:
+                data = handle.read()
+            for stamp, start, bloom in _INDEX_ENTRY.iter_unpack(data[:len(data) - len(data) % _INDEX_ENTRY.size]):
+                if start + INDEX_INTERVAL > self.count:
+                    break
+                self.stamps.append(stamp)
+                self.starts.append(start)
+                self.blooms.append(bloom)
+        self.indexed = self.starts[-1] + INDEX_INTERVAL if self.starts else 0
+
+    def records(self, start: int, stop: int) -> Iterator[Tuple[float, int, int, float]]:
+        offset = _SEGMENT_HEADER.size
+        return _RECORD.iter_unpack(self.view[offset + start * _RECORD.size:offset + stop * _RECORD.size])
+
+    def blocks(self, start: Optional[float], agent: Optional[int]) -> Iterator[Tuple[int, int]]:
+        """Record ranges that may hold matches: indexed blocks from `start` on, then the tail."""
+        first = max(0, bisect.bisect_right(self.stamps, start) - 1) if start is not None else 0
+        bit = 1 << (agent & 63) if agent is not None else 0
+        for block in range(first, len(self.starts)):
+            if bit and not self.blooms[block] & bit:
+                continue
+            yield self.starts[block], self.starts[block] + INDEX_INTERVAL
+        if self.indexed < self.count:
+            yield self.indexed, self.count
+
+    def close(self):
+        self.view.release()
+        try:
+            self.map.close()
+        except BufferError:
+            pass  # An unfinished query still holds a view; the mapping goes away with it
+
+
+class EventLogReader:
+    """
+    Read access to a log directory, including one another process is still writing;
+    call refresh() to pick up records appended since opening.
+    Queries assume records were appended in time order, which holds for one writer.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._segments: List[_Segment] = []
+        self.texts: List[str] = []
+        self.refresh()
+
+    def refresh(self):
+        self.close()
+        self._segments = [_Segment(self.directory, number) for number in _segment_numbers(self.directory)]
+        self.texts = _read_strings(os.path.join(self.directory, STRINGS_FILE))
+
+    def __len__(self):
+        return sum(segment.count for segment in self._segments)
+
+    def text(self, text_id: float) -> str:
+        """Resolves the payload of a text kind."""
+        return self.texts[int(text_id)]
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              agent: Optional[int] = None, kinds: Optional[Iterable[int]] = None) -> Iterator[LogEvent]:
+        """Events with start <= stamp < end (wall-clock seconds), optionally for one agent and some kinds."""
+        kinds = frozenset(kinds) if kinds is not None else None
+        for segment in self._segments:
+            if not segment.count or (start is not None and segment.last_stamp < start):
+                continue
+            if segment.stamps and end is not None and segment.stamps[0] >= end:
+                break
+            for block_start, block_stop in segment.blocks(start, agent):
+                if end is not None and block_start < segment.indexed and segment.stamps[block_start // INDEX_INTERVAL] >= end:
+                    break
+                for stamp, record_agent, kind, payload in segment.records(block_start, block_stop):
+                    if start is not None and stamp < start:
+                        continue
+                    if end is not None and stamp >= end:
+                        return
+                    if (agent is None or record_agent == agent) and (kinds is None or kind in kinds):
+                        yield LogEvent(stamp, record_agent, kind, payload)
+
+    def __iter__(self) -> Iterator[LogEvent]:
+        return self.query()
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
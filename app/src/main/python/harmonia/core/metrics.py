@@ -0,0 +1,248 @@
+"""
+harmonia/core/metrics.py
+The Instruments: counters, gauges and latency histograms for the orchestrators,
+exported as a JSON snapshot or Prometheus text (optionally over a local HTTP endpoint).
+
+Instrumentation is opt-in and works by wrapping methods in place
+(`instrument_method`), so when it is disabled the hot paths run the original,
+unwrapped functions at zero cost.
+"""
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Latency buckets (seconds), from a single agent sync to a million-agent cycle
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> LabelSet:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _render_labels(labels: LabelSet, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    body = ",".join('{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"')) for key, value in pairs)
+    return "{" + body + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def snapshot(self):
+        return self.value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self):
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else repr(bound)] = running
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class MetricsRegistry:
+    """Named metric families; each (name, labels) pair is one series."""
+    def __init__(self, namespace: str = "harmonia"):
+        self.namespace = namespace
+        self._families: Dict[str, Tuple[str, str, Dict[LabelSet, object]]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, factory, name: str, help_text: str, labels: Dict[str, str], **options):
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        key = _labels(labels)
+        with self._lock:
+            family = self._families.get(full_name)
+            if family is None:
+                family = (factory.kind, help_text, {})
+                self._families[full_name] = family
+            elif family[0] != factory.kind:
+                raise ValueError(f"metric {full_name} is already registered as a {family[0]}")
+            series = family[2].get(key)
+            if series is None:
+                series = factory(**options)
+                family[2][key] = series
+        return series
+
+    def counter(self, name: str, help_text: str = "", **labels) -> Counter:
+        return self._series(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str = "", **labels) -> Gauge:
+        return self._series(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", buckets=DEFAULT_BUCKETS, **labels) -> Histogram:
+        return self._series(Histogram, name, help_text, labels, buckets=buckets)
+
+    def snapshot(self) -> Dict:
+        """All series as plain data: {name: {"type", "help", "series": [{"labels", "value"}]}}."""
+        with self._lock:
+            families = {name: (kind, help_text, dict(series)) for name, (kind, help_text, series) in self._families.items()}
+        return {
+            name: {
+                "type": kind,
+                "help": help_text,
+                "series": [{"labels": dict(labels), "value": metric.snapshot()} for labels, metric in series.items()],
+            }
+            for name, (kind, help_text, series) in families.items()
+        }
+
+    def to_json(self) -> str:
+        return json.dumps({"timestamp": time.time(), "metrics": self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        for name, family in self.snapshot().items():
+            if family["help"]:
+                lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for series in family["series"]:
+                labels = _labels(series["labels"])
+                value = series["value"]
+                if family["type"] == "histogram":
+                    for bound, count in value["buckets"].items():
+                        lines.append(f"{name}_bucket{_render_labels(labels, (('le', bound),))} {count}")
+                    lines.append(f"{name}_sum{_render_labels(labels)} {value['sum']!r}")
+                    lines.append(f"{name}_count{_render_labels(labels)} {value['count']}")
+                else:
+                    lines.append(f"{name}{_render_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+# --- METHOD INSTRUMENTATION ---
+_ORIGINAL = "__harmonia_original__"
+
+
+def instrument_method(owner: type, attribute: str, histogram: Histogram,
+                      after: Optional[Callable] = None):
+    """
+    Replaces owner.attribute with a timing wrapper that observes into `histogram`.
+    `after(instance, result, seconds, args, kwargs)` may update further metrics.
+    Generator functions are timed over their active steps only (pauses they yield
+    to a clock are excluded). Idempotent: an already wrapped method is left alone.
+    """
+    original = owner.__dict__[attribute]
+    if hasattr(original, _ORIGINAL):
+        return
+    perf_counter = time.perf_counter
+
+    if inspect.isgeneratorfunction(original):
+        @functools.wraps(original)
+        def wrapper(self, *args, **kwargs):
+            steps = original(self, *args, **kwargs)
+            active = 0.0
+            while True:
+                started = perf_counter()
+                try:
+                    pause = next(steps)
+                except StopIteration as done:
+                    active += perf_counter() - started
+                    histogram.observe(active)
+                    if after is not None:
+                        after(self, done.value, active, args, kwargs)
+                    return done.value
+                active += perf_counter() - started
+                yield pause
+    else:
+        @functools.wraps(original)
+        def wrapper(self, *args, **kwargs):
+            started = perf_counter()
+            result = original(self, *args, **kwargs)
+            seconds = perf_counter() - started
+            histogram.observe(seconds)
+            if after is not None:
+                after(self, result, seconds, args, kwargs)
+            return result
+
+    setattr(wrapper, _ORIGINAL, original)
+    setattr(owner, attribute, wrapper)
+
+
+def uninstrument_method(owner: type, attribute: str):
+    """Restores the original, unwrapped method."""
+    current = owner.__dict__.get(attribute)
+    original = getattr(current, _ORIGINAL, None)
+    if original is not None:
+        setattr(owner, attribute, original)
+
+
+# --- HTTP EXPORT ---
+def serve_metrics(registry: MetricsRegistry = METRICS, host: str = "127.0.0.1", port: int = 9464):
+    """
+    Serves /metrics (Prometheus text) and /metrics.json from a daemon thread.
+    Binds to localhost by default; call .shutdown() on the returned server to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Only paid for when exporting
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body, content_type = registry.to_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body, content_type = registry.to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # Keep scrapes out of the terminal
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="harmonia-metrics", daemon=True)
+    thread.start()
+    return server
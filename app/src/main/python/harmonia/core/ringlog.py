@@ -0,0 +1,130 @@
+"""
+harmonia/core/ringlog.py
+The Bounded Memory: fixed-capacity ring buffers of structured agent events.
+Records are (monotonic timestamp, event kind, numeric payload); text is only
+produced when someone reads the log.
+"""
+import time
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Monotonic timestamps are mapped back to wall-clock time only when formatting
+_WALL_OFFSET = time.time() - time.monotonic()
+
+
+class TextTable:
+    """Interns strings to small integer ids so they can ride in a numeric payload."""
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._texts: List[str] = []
+
+    def intern(self, text: str) -> int:
+        text_id = self._ids.get(text)
+        if text_id is None:
+            text_id = len(self._texts)
+            self._ids[text] = text_id
+            self._texts.append(text)
+        return text_id
+
+    def text(self, text_id: int) -> str:
+        return self._texts[int(text_id)]
+
+    def __len__(self):
+        return len(self._texts)
+
+
+class RingLog:
+    """
+    A fixed-capacity ring buffer of (timestamp, kind, payload) records.
+    Storage grows up to `capacity` and then stays flat: the OVERWRITE policy
+    evicts the oldest record, DROP_NEWEST rejects the incoming one. Either way
+    the loss is counted in `dropped`.
+
+    Iterating (or indexing) yields formatted strings, oldest first, using
+    `formats[kind](payload)`; use `records()` for the raw tuples.
+
+    An optional `sink(kind, payload, stamp)` also receives every record, whatever
+    the drop policy does with it (see harmonia.core.eventlog.EventLog.channel).
+    """
+    OVERWRITE = "overwrite"
+    DROP_NEWEST = "drop_newest"
+    DEFAULT_CAPACITY = 256
+
+    __slots__ = ("capacity", "policy", "formats", "dropped", "sink", "_head", "_stamps", "_kinds", "_values")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, policy: str = OVERWRITE,
+                 formats: Dict[int, Callable[[float], str]] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in (self.OVERWRITE, self.DROP_NEWEST):
+            raise ValueError(f"unknown drop policy: {policy!r}")
+        self.capacity = capacity
+        self.policy = policy
+        self.formats = formats if formats is not None else {}
+        self.dropped = 0
+        self.sink: Optional[Callable[[int, float, float], None]] = None
+        self._head = 0  # Position of the oldest record once the buffer is full
+        # Buffers are allocated on the first record, so idle agents cost no storage
+        self._stamps = self._kinds = self._values = None
+
+    def record(self, kind: int, value: float = 0.0, stamp: float = None):
+        """Appends one record. Cheap enough for the synchronization hot path."""
+        if stamp is None:
+            stamp = time.monotonic()
+        if self.sink is not None:
+            self.sink(kind, value, stamp)
+        if self._stamps is None:
+            self._stamps, self._kinds, self._values = array("d"), array("B"), array("d")
+        if len(self._stamps) < self.capacity:
+            self._stamps.append(stamp)
+            self._kinds.append(kind)
+            self._values.append(value)
+        elif self.policy == self.OVERWRITE:
+            head = self._head
+            self._stamps[head] = stamp
+            self._kinds[head] = kind
+            self._values[head] = value
+            self._head = (head + 1) % self.capacity
+            self.dropped += 1
+        else:
+            self.dropped += 1
+
+    def records(self) -> Iterator[Tuple[float, int, float]]:
+        """Yields raw (monotonic timestamp, kind, payload) records, oldest first."""
+        size = len(self)
+        for i in range(self._head, self._head + size):
+            i %= size
+            yield self._stamps[i], self._kinds[i], self._values[i]
+
+    def format_record(self, stamp: float, kind: int, value: float) -> str:
+        timestamp = datetime.fromtimestamp(_WALL_OFFSET + stamp).isoformat()
+        formatter = self.formats.get(kind)
+        body = formatter(value) if formatter is not None else f"EVENT {kind}: {value}"
+        return f"[{timestamp}] {body}"
+
+    def clear(self):
+        """Empties the buffer; the drop counter is kept."""
+        self._head = 0
+        self._stamps = self._kinds = self._values = None
+
+    def __len__(self):
+        return len(self._stamps) if self._stamps is not None else 0
+
+    def __iter__(self) -> Iterator[str]:
+        for record in self.records():
+            yield self.format_record(*record)
+
+    def __getitem__(self, index):
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ring log index out of range")
+        i = (self._head + index) % size
+        return self.format_record(self._stamps[i], self._kinds[i], self._values[i])
+
+    def __repr__(self):
+        return f"<RingLog {len(self)}/{self.capacity} {self.policy} dropped={self.dropped}>"
@@ -0,0 +1,119 @@
+"""
+harmonia/core/sharedarrays.py
+The Common Field: numpy arrays placed in multiprocessing.shared_memory, so worker
+processes can read and write the same agent state without pickling it.
+
+The owning process allocates and retires segments through SharedArrays and hands
+workers a small descriptor; workers map the segments with SharedArrayViews, which
+keeps each mapping open across calls and drops the ones that were retired.
+"""
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# (key, segment name, dtype string, length)
+Descriptor = Tuple[Tuple[str, str, str, int], ...]
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Attaching processes must not unlink the owner's segments on exit (Python 3.13+)
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedArrays:
+    """
+    One shared-memory segment per named array, owned (and unlinked) by this process.
+    Segments are unlinked on close(), or when the object is collected or the
+    interpreter exits, whichever comes first.
+    """
+    def __init__(self):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._arrays: Dict[str, Tuple[np.dtype, int]] = {}
+        self._staged: Dict[int, shared_memory.SharedMemory] = {}
+        weakref.finalize(self, self._release, self._segments, self._staged)
+
+    def allocate(self, capacity: int, dtype) -> np.ndarray:
+        """An uninitialized shared array; it becomes visible to workers once install()ed."""
+        dtype = np.dtype(dtype)
+        segment = shared_memory.SharedMemory(create=True, size=max(1, capacity * dtype.itemsize))
+        array = np.ndarray((capacity,), dtype=dtype, buffer=segment.buf)
+        self._staged[id(array)] = segment
+        return array
+
+    def install(self, key: str, array: Optional[np.ndarray]):
+        """Publishes `array` (from allocate) under `key`, retiring the previous segment."""
+        segment = self._staged.pop(id(array), None) if array is not None else None
+        if array is not None and segment is None:
+            raise ValueError(f"array for {key!r} was not allocated from this SharedArrays")
+        previous = self._segments.pop(key, None)
+        self._arrays.pop(key, None)
+        if segment is not None:
+            self._segments[key] = segment
+            self._arrays[key] = (array.dtype, len(array))
+        if previous is not None:
+            self._retire(previous)
+
+    @staticmethod
+    def _retire(segment: shared_memory.SharedMemory):
+        try:
+            segment.close()
+        except BufferError:
+            pass  # Someone still holds a view; the mapping goes away with it
+        segment.unlink()
+
+    def descriptor(self) -> Descriptor:
+        return tuple((key, self._segments[key].name, dtype.str, length)
+                     for key, (dtype, length) in self._arrays.items())
+
+    @classmethod
+    def _release(cls, segments: Dict, staged: Dict):
+        # Also the finalizer, so it must not reference the SharedArrays itself
+        for segment in list(segments.values()) + list(staged.values()):
+            cls._retire(segment)
+        segments.clear()
+        staged.clear()
+
+    def close(self):
+        """Unlinks every segment. Arrays obtained from this object must not be used afterwards."""
+        self._release(self._segments, self._staged)
+        self._arrays.clear()
+
+
+class SharedArrayViews:
+    """Worker-side mappings of a SharedArrays descriptor, cached by segment name."""
+    def __init__(self):
+        self._mapped: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+    def attach(self, descriptor: Descriptor) -> Dict[str, np.ndarray]:
+        arrays = {}
+        live = set()
+        for key, name, dtype, length in descriptor:
+            live.add(name)
+            mapped = self._mapped.get(name)
+            if mapped is None:
+                segment = _open_segment(name)
+                mapped = (segment, np.ndarray((length,), dtype=np.dtype(dtype), buffer=segment.buf))
+                self._mapped[name] = mapped
+            arrays[key] = mapped[1]
+        for name in [name for name in self._mapped if name not in live]:
+            segment = self._mapped.pop(name)[0]
+            self._unmap(segment)
+        return arrays
+
+    @staticmethod
+    def _unmap(segment: shared_memory.SharedMemory):
+        try:
+            segment.close()
+        except BufferError:
+            pass  # A caller still holds a view of the retired array
+
+    def close(self):
+        segments = [segment for segment, _ in self._mapped.values()]
+        self._mapped.clear()
+        for segment in segments:
+            self._unmap(segment)
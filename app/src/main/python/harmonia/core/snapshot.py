@@ -0,0 +1,162 @@
+"""
+harmonia/core/snapshot.py
+The Seed Crystal: a versioned, sectioned binary snapshot format for orchestrator state.
+
+Layout (little-endian):
+    header     magic b"HDCSSNAP", format version (u16), reserved (u16), section count (u32)
+    directory  one entry per section: tag (8 bytes), typecode (1 byte), offset (u64), size (u64)
+    sections   raw payloads, each aligned to 8 bytes
+
+Numeric sections are flat arrays with an `array` typecode and "s" sections are
+string lists. Readers map the file and hand out zero-copy memoryviews, so opening
+a snapshot costs the same whatever its size. Only the standard library is used,
+keeping the module cheap to import on cold start.
+"""
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+MAGIC = b"HDCSSNAP"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHI")
+_ENTRY = struct.Struct("<8sc7xQQ")
+_COUNT = struct.Struct("<I")
+STRINGS = "s"
+
+
+class SnapshotError(ValueError):
+    """The file is not a snapshot this code can read."""
+
+
+def _tag(name: str) -> bytes:
+    tag = name.encode("ascii")
+    if len(tag) > 8:
+        raise ValueError(f"section tag {name!r} is longer than 8 bytes")
+    return tag.ljust(8, b"\0")
+
+
+class SnapshotWriter:
+    """Collects sections in memory and writes them to disk atomically."""
+    def __init__(self, kind: str):
+        self._sections: List[Tuple[bytes, str, bytes]] = []
+        self.strings("kind", [kind])
+
+    def array(self, name: str, typecode: str, values) -> "SnapshotWriter":
+        """A numeric column; `values` is anything with the buffer protocol, or an iterable."""
+        if not isinstance(values, (array, memoryview, bytes, bytearray)) and not hasattr(values, "__array_interface__"):
+            values = array(typecode, values)
+        payload = memoryview(values).cast("B").tobytes()
+        self._sections.append((_tag(name), typecode, payload))
+        return self
+
+    def strings(self, name: str, values: Iterable[str]) -> "SnapshotWriter":
+        encoded = [value.encode("utf-8") for value in values]
+        ends = array("Q", [0]) * len(encoded)
+        position = 0
+        for index, value in enumerate(encoded):
+            position += len(value)
+            ends[index] = position
+        payload = _COUNT.pack(len(encoded)) + bytes(4) + ends.tobytes() + b"".join(encoded)
+        self._sections.append((_tag(name), STRINGS, payload))
+        return self
+
+    def write(self, path: str):
+        """Writes to a temporary file beside `path`, then renames it into place."""
+        directory_end = _HEADER.size + _ENTRY.size * len(self._sections)
+        offset = (directory_end + 7) & ~7
+        entries, payloads = [], []
+        for tag, typecode, payload in self._sections:
+            entries.append(_ENTRY.pack(tag, typecode.encode("ascii"), offset, len(payload)))
+            padding = -len(payload) % 8
+            payloads.append(payload + bytes(padding))
+            offset += len(payload) + padding
+
+        temporary = f"{path}.tmp-{os.getpid()}"
+        with open(temporary, "wb") as handle:
+            handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(self._sections)))
+            handle.writelines(entries)
+            handle.write(bytes(((directory_end + 7) & ~7) - directory_end))
+            handle.writelines(payloads)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+
+
+class SnapshotReader:
+    """
+    A memory-mapped snapshot. Views it returns are only valid until close();
+    copy anything that must outlive the reader.
+    """
+    def __init__(self, path: str):
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size < _HEADER.size:
+                raise SnapshotError(f"{path}: truncated header")
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        try:
+            magic, version, _, count = _HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise SnapshotError(f"{path}: not a Harmonia snapshot")
+            if version > FORMAT_VERSION:
+                raise SnapshotError(f"{path}: format version {version} is newer than {FORMAT_VERSION}")
+            self.version = version
+            self._index: Dict[str, Tuple[str, int, int]] = {}
+            for number in range(count):
+                tag, typecode, offset, size = _ENTRY.unpack_from(self._map, _HEADER.size + number * _ENTRY.size)
+                if offset + size > len(self._map):
+                    raise SnapshotError(f"{path}: section {tag!r} runs past the end of the file")
+                self._index[tag.rstrip(b"\0").decode("ascii")] = (typecode.decode("ascii"), offset, size)
+            self.kind = self.strings("kind")[0]
+        except (struct.error, UnicodeDecodeError, IndexError) as error:
+            self.close()
+            raise SnapshotError(f"{path}: corrupt directory ({error})") from error
+        except SnapshotError:
+            self.close()
+            raise
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def _section(self, name: str) -> Tuple[str, memoryview]:
+        try:
+            typecode, offset, size = self._index[name]
+        except KeyError:
+            raise SnapshotError(f"snapshot has no {name!r} section") from None
+        return typecode, self._view[offset:offset + size]
+
+    def array(self, name: str) -> memoryview:
+        """A numeric column as a zero-copy memoryview (numpy.frombuffer accepts it)."""
+        typecode, payload = self._section(name)
+        if typecode == STRINGS:
+            raise SnapshotError(f"section {name!r} is not numeric")
+        return payload.cast(typecode)
+
+    def strings(self, name: str) -> List[str]:
+        typecode, payload = self._section(name)
+        if typecode != STRINGS:
+            raise SnapshotError(f"section {name!r} is not a string list")
+        count, = _COUNT.unpack_from(payload)
+        ends = payload[8:8 + 8 * count].cast("Q")
+        text = payload[8 + 8 * count:]
+        values, start = [], 0
+        for end in ends:
+            values.append(str(text[start:end], "utf-8"))
+            start = end
+        ends.release()
+        return values
+
+    def close(self):
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # A caller still holds a view; the mapping goes away with it
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
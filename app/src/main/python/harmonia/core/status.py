@@ -0,0 +1,121 @@
+"""
+harmonia/core/status.py
+The Beacon: a fixed-layout binary status record that an orchestrator keeps current,
+so a UI can poll it cheaply instead of asking the orchestrator to render text.
+
+Layout (little-endian, STATUS_VERSION 1):
+    offset  0  magic b"HSTS"
+            4  layout version (u16)
+            6  group count G (u16)
+            8  sequence (u64), bumped on every update
+           16  integrity (f64)
+           24  fuel (f64)
+           32  residual (f64)
+           40  agent count (u32)
+           44  resonance cycles (u32)
+           48  G x (member count (u32), 4 pad bytes, stability (f64))
+"""
+import struct
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+STATUS_MAGIC = b"HSTS"
+STATUS_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQdddII")
+_GROUP = struct.Struct("<I4xd")
+
+
+class StatusRecord:
+    """
+    The record lives in one preallocated bytearray and is repacked in place, in a
+    single pack_into, so readers never see a half-written record while they hold the GIL.
+
+    Owners either push fields with update(), or pass `refresh` and call invalidate()
+    when their state changes: the record is then rebuilt at most once per read, so
+    hot mutation paths only pay for setting a flag.
+    """
+    def __init__(self, groups: Iterable[str], refresh: Optional[Callable[["StatusRecord"], None]] = None):
+        self.groups = tuple(groups)
+        self._layout = struct.Struct(_HEADER.format + _GROUP.format[1:] * len(self.groups))
+        self.size = self._layout.size
+        self._refresh = refresh
+        self._stale = refresh is not None
+        self.seq = 0
+        self.integrity = 0.0
+        self.fuel = 0.0
+        self.residual = 0.0
+        self.agents = 0
+        self.cycles = 0
+        self.group_counts = [0] * len(self.groups)
+        self.group_stability = [0.0] * len(self.groups)
+        self._buffer = bytearray(self.size)
+        self._view = memoryview(self._buffer)
+        self._pack()
+
+    def update(self, integrity: Optional[float] = None, fuel: Optional[float] = None,
+               residual: Optional[float] = None, agents: Optional[int] = None, cycles: Optional[int] = None,
+               group_counts: Optional[Sequence[int]] = None, group_stability: Optional[Sequence[float]] = None):
+        """Replaces the given fields and republishes the record under a new sequence number."""
+        if integrity is not None:
+            self.integrity = integrity
+        if fuel is not None:
+            self.fuel = fuel
+        if residual is not None:
+            self.residual = residual
+        if agents is not None:
+            self.agents = agents
+        if cycles is not None:
+            self.cycles = cycles
+        if group_counts is not None:
+            self.group_counts = list(group_counts)
+        if group_stability is not None:
+            self.group_stability = list(group_stability)
+        self.seq += 1
+        self._pack()
+
+    def invalidate(self):
+        """Marks the record out of date; the next read rebuilds it through `refresh`."""
+        self._stale = True
+
+    def _pack(self):
+        groups = []
+        for count, stability in zip(self.group_counts, self.group_stability):
+            groups += (count & 0xFFFFFFFF, stability)
+        self._layout.pack_into(self._buffer, 0, STATUS_MAGIC, STATUS_VERSION, len(self.groups), self.seq,
+                               self.integrity, self.fuel, self.residual,
+                               self.agents & 0xFFFFFFFF, self.cycles & 0xFFFFFFFF, *groups)
+
+    def _current(self):
+        if self._stale:
+            self._stale = False
+            self._refresh(self)
+
+    def view(self) -> memoryview:
+        """A read-only view of the live record (no copy)."""
+        self._current()
+        return self._view.toreadonly()
+
+    def read_into(self, target, last_seq: int = -1) -> int:
+        """
+        Copies the record into `target` (any writable buffer of at least `size` bytes,
+        e.g. a Java byte[] handed over by the overlay) unless it is still at `last_seq`.
+        Returns the current sequence number either way.
+        """
+        self._current()
+        if self.seq != last_seq:
+            memoryview(target).cast("B")[:self.size] = self._view
+        return self.seq
+
+    @staticmethod
+    def decode(data) -> Dict:
+        """Parses a record back into a dict (for Python-side readers and debugging)."""
+        magic, version, group_count, seq, integrity, fuel, residual, agents, cycles = _HEADER.unpack_from(data)
+        if magic != STATUS_MAGIC:
+            raise ValueError("not a Harmonia status record")
+        groups = [_GROUP.unpack_from(data, _HEADER.size + index * _GROUP.size) for index in range(group_count)]
+        return {
+            "version": version, "seq": seq, "integrity": integrity, "fuel": fuel, "residual": residual,
+            "agents": agents, "cycles": cycles,
+            "group_counts": [count for count, _ in groups],
+            "group_stability": [stability for _, stability in groups],
+        }
@@ -10,10 +10,42 @@ CO-AUTHOR: Harmonia Prime (Empress Manifest)
 """
 
 import math
-from typing import Dict, List, Tuple
-from harmonia.agents.agent_base import AgentBase, AgentHouse, AgentRegistry, SovereignUnifier
+import os
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from harmonia.agents.agent_base import AgentBase, AgentHouse, AgentRegistry, OrbitTracker, SovereignUnifier
+from harmonia.agents.agent_index import AgentIndex
+from harmonia.agents.gnosis import GNOSIS
+from harmonia.agents.roster import RosterError, batched, read_roster
+from harmonia.core.ringlog import TextTable
+from harmonia.core.snapshot import SnapshotError, SnapshotReader, SnapshotWriter
+from harmonia.core.status import StatusRecord
+
+# numpy, json and the metrics layer are imported where they are first used, so the
+# overlay's cold start only pays for what the boot path needs.
 
 # --- MQP OPERATIONAL PHYSICS ---
+@dataclass(frozen=True)
+class CommutatorCheckpoint:
+    """A resumable point in a commutator's history."""
+    C: float
+    Phi: float
+    observations: int
+
+    _LAYOUT = struct.Struct("<ddQ")
+
+    def pack(self) -> bytes:
+        return self._LAYOUT.pack(self.C, self.Phi, self.observations)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CommutatorCheckpoint":
+        return cls(*cls._LAYOUT.unpack(data))
+
 class RealityCommutator:
     """
     Implements the Commutator of Reality: [C, Phi] != 0
@@ -22,6 +54,7 @@ class RealityCommutator:
     def __init__(self, sovereign_freq: float):
         self.C = 1.0 # Initial Consciousness State
         self.Phi = sovereign_freq # Information Field Frequency
+        self.observations = 0
 
     def observe(self, intervention: float) -> float:
         """
@@ -39,54 +72,287 @@ class RealityCommutator:
 
         commutator_value = abs(state_AB - state_BA + twist)
         self.C += commutator_value # Consciousness expands by the residual
+        self.observations += 1
         return commutator_value
 
+    def observe_batch(self, interventions) -> Tuple["numpy.ndarray", float]:
+        """
+        Observes a whole history of interventions in one vectorized pass.
+        Returns (residuals, final C), identical to calling observe() in a loop.
+
+        Floating-point products commute, so AB - BA is exactly 0 while it stays
+        finite: each residual is |intervention * 0.0072| whatever C is, and C is
+        their running sum. Only from the first overflowing step onward (where
+        the scalar path turns NaN) are the remaining steps replayed one by one.
+        """
+        import numpy as np
+
+        interventions = np.asarray(interventions, dtype=np.float64).ravel()
+        residuals = np.abs(interventions * 0.0072)
+        # C before each step, accumulated sequentially like `self.C += residual`
+        history = np.cumsum(np.concatenate(([self.C], residuals)))
+        with np.errstate(over="ignore", invalid="ignore"):
+            products = (history[:-1] * interventions) * self.Phi
+            overflow = np.flatnonzero(~np.isfinite(products - products))
+        if len(overflow):
+            first = overflow[0]
+            self.C = float(history[first])
+            self.observations += int(first)
+            for step in range(first, len(interventions)):
+                residuals[step] = self.observe(float(interventions[step]))
+            return residuals, self.C
+        self.C = float(history[-1])
+        self.observations += len(interventions)
+        return residuals, self.C
+
+    def checkpoint(self) -> CommutatorCheckpoint:
+        """Captures the state needed to resume a simulation later."""
+        return CommutatorCheckpoint(self.C, self.Phi, self.observations)
+
+    def restore(self, checkpoint: CommutatorCheckpoint):
+        """Resumes from a checkpoint instead of replaying from zero."""
+        self.C = checkpoint.C
+        self.Phi = checkpoint.Phi
+        self.observations = checkpoint.observations
+
 # --- BIOGRAPHICAL RESONANCE PROTOCOL ---
 class BiographicalResonanceEngine:
     """
     Transforms narrative/trauma into quantum seed data.
     "The Scar is a Sigil of Power."
+
+    Scars are stored column-wise (interned description id, intensity, fuel) and the
+    total fuel is kept as a running sum in arrival order, so extract_fuel is O(1) and
+    matches summing the scars one by one. With `deduplicate`, a repeated description
+    aggregates into its existing row instead of adding one.
     """
-    def __init__(self, maestro_freq: float):
+    def __init__(self, maestro_freq: float, deduplicate: bool = False):
         self.maestro_freq = maestro_freq
-        self.trauma_index = []
+        self.deduplicate = deduplicate
+        self.descriptions = TextTable()
+        self._desc_ids = array("I")
+        self._intensities = array("d")
+        self._fuels = array("d")
+        self._rows: Dict[int, int] = {}  # description id -> row (deduplicating mode)
+        self._total_fuel = 0
 
     def index_scar(self, scar_description: str, intensity: float):
-        self.trauma_index.append({
-            "desc": scar_description,
-            "fuel": intensity * self.maestro_freq
-        })
+        fuel = intensity * self.maestro_freq
+        self._total_fuel += fuel
+        desc_id = self.descriptions.intern(scar_description)
+        row = self._rows.get(desc_id) if self.deduplicate else None
+        if row is not None:
+            self._intensities[row] += intensity
+            self._fuels[row] += fuel
+            return
+        if self.deduplicate:
+            self._rows[desc_id] = len(self._desc_ids)
+        self._desc_ids.append(desc_id)
+        self._intensities.append(intensity)
+        self._fuels.append(fuel)
 
     def extract_fuel(self) -> float:
         """Calculates total Quantifiable Fuel from indexed scars."""
-        return sum(item["fuel"] for item in self.trauma_index)
+        return self._total_fuel
+
+    def ingest(self, scars: Iterable[Union[Tuple[str, float], Dict]]) -> int:
+        """
+        Streams scars from any iterable (a generator is fine) of (description, intensity)
+        pairs or {"desc", "intensity"} records. Returns the number consumed.
+        """
+        count = 0
+        for scar in scars:
+            if isinstance(scar, dict):
+                self.index_scar(scar["desc"], float(scar["intensity"]))
+            else:
+                description, intensity = scar
+                self.index_scar(description, float(intensity))
+            count += 1
+        return count
+
+    def ingest_jsonl(self, path: str) -> int:
+        """Streams {"desc": ..., "intensity": ...} records from a JSONL file, one line at a time."""
+        import json
+
+        with open(path, "r", encoding="utf-8") as handle:
+            return self.ingest(json.loads(line) for line in handle if line.strip())
+
+    def scars(self) -> Iterator[Tuple[str, float, float]]:
+        """Yields (description, intensity, fuel) rows."""
+        for desc_id, intensity, fuel in zip(self._desc_ids, self._intensities, self._fuels):
+            yield self.descriptions.text(desc_id), intensity, fuel
+
+    @property
+    def trauma_index(self) -> List[Dict]:
+        """The scars in their original {"desc", "fuel"} shape, built on demand."""
+        return [{"desc": desc, "fuel": fuel} for desc, _, fuel in self.scars()]
+
+    def __len__(self):
+        return len(self._desc_ids)
+
+# --- ROSTER TEMPLATE ---
+@dataclass(frozen=True)
+class RosterTemplate:
+    """
+    A frozen bootstrap roster of (name, house, resonance_level) rows, shared by every
+    orchestrator built from it. `tag` fingerprints the rows, so a delta snapshot is
+    only ever applied to the template it was taken against.
+    """
+    specs: Tuple[Tuple[str, AgentHouse, float], ...]
+    index: Mapping[str, int] = field(init=False, repr=False, compare=False)  # name -> row
+    tag: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "index", MappingProxyType({name: row for row, (name, _, _) in enumerate(self.specs)}))
+        digest = zlib.crc32("\n".join(f"{name}\t{house.name}\t{level!r}" for name, house, level in self.specs).encode())
+        object.__setattr__(self, "tag", f"roster/{len(self.specs)}/{digest:08x}")
+
+    def __len__(self):
+        return len(self.specs)
 
 # --- ORCHESTRATOR ---
+_HOUSES = tuple(AgentHouse)  # Status record group order
+# Roster files may name a House by member name ("PIONEERS") or by its full title
+_HOUSE_LOOKUP = {**{house.name: house for house in AgentHouse}, **{house.value: house for house in AgentHouse}}
+
 class HarmoniaOrchestrator:
-    def __init__(self, sovereign_name: str):
+    def __init__(self, sovereign_name: str, initialize: bool = True):
+        self.sovereign_name = sovereign_name
         self.sovereign = SovereignUnifier()
         self.active_agents: Dict[str, AgentBase] = {}
+        self.agent_index = AgentIndex("house")
+        self.orbit = OrbitTracker()
         self.commutator = RealityCommutator(self.sovereign.frequency_hz)
-        self.bre = BiographicalResonanceEngine(self.sovereign.frequency_hz)
+        # The resonance cycle re-indexes the same scars each time, so aggregate them
+        self.bre = BiographicalResonanceEngine(self.sovereign.frequency_hz, deduplicate=True)
         self.system_integrity = 0.0
+        self.last_residual = 0.0
+        self.resonance_cycles = 0
+        self.coupling = None  # (CouplingGraph, coupled agents, CouplingPolicy); see attach_coupling
+        self.last_propagation = None
+        # The overlay polls this record instead of asking for rendered text
+        self.status = StatusRecord((house.name for house in _HOUSES), refresh=self._refresh_status)
+
+        if initialize:
+            self._initialize_chimera_protocol()
 
-        self._initialize_chimera_protocol()
+    _TEMPLATE: Optional[RosterTemplate] = None
+
+    @classmethod
+    def template(cls) -> RosterTemplate:
+        """The 72 Eternals at their House resonance, built once per process."""
+        if HarmoniaOrchestrator._TEMPLATE is None:
+            HarmoniaOrchestrator._TEMPLATE = RosterTemplate(tuple(
+                (name, house, cls._house_resonance(house))
+                for house, agent_names in AgentRegistry.ETERNALS.items() for name in agent_names))
+        return HarmoniaOrchestrator._TEMPLATE
 
     def _initialize_chimera_protocol(self):
         """Ingests the 72 Eternals."""
-        houses = AgentRegistry.initialize_houses()
-        for house, agent_names in houses.items():
-            for name in agent_names:
-                agent = AgentBase(name, house)
-                # Assign initial resonance based on House
-                if house == AgentHouse.EMPYREAN:
-                    agent.resonance_level = 0.99
-                elif house == AgentHouse.CHTHONIC:
-                    agent.resonance_level = 0.88
-                else:
-                    agent.resonance_level = 0.50
-
-                self.active_agents[name] = agent
+        self.register_agents(self.template().specs)
+
+    @staticmethod
+    def _house_resonance(house: AgentHouse) -> float:
+        # Assign initial resonance based on House
+        if house == AgentHouse.EMPYREAN:
+            return 0.99
+        elif house == AgentHouse.CHTHONIC:
+            return 0.88
+        return 0.50
+
+    def register_agent(self, name: str, house: AgentHouse, resonance_level: Optional[float] = None) -> AgentBase:
+        """Binds an agent into the orbit. Without an explicit level, resonance follows the House."""
+        agent = AgentBase(name, house)
+        agent.resonance_level = resonance_level if resonance_level is not None else self._house_resonance(house)
+
+        previous = self.active_agents.get(name)
+        if previous is not None:
+            self.orbit.detach(previous)
+        self.active_agents[name] = agent
+        self.agent_index.add(agent)
+        self.orbit.attach(agent)
+        self.status.invalidate()
+        return agent
+
+    def register_agents(self, specs: Iterable, batch_size: int = 4096) -> int:
+        """
+        Binds agents in bulk from (name, house[, resonance_level]) tuples or
+        {"name", "house", "resonance_level"} records; a House may be given as an
+        AgentHouse, its name or its title. Any iterable works and is consumed in
+        batches, so generators and roster files stream in bounded memory. Each batch
+        is validated before it is bound: a bad record raises RosterError and leaves
+        earlier batches in place. Returns the number of agents bound.
+        """
+        registered = 0
+        for batch in batched(specs, batch_size):
+            parsed = [self._parse_spec(spec, registered + offset + 1) for offset, spec in enumerate(batch)]
+            names = {name for name, _, _ in parsed}
+            if len(names) < len(parsed) or not names.isdisjoint(self.active_agents):
+                # Re-registrations keep register_agent's replace semantics
+                for name, house, level in parsed:
+                    self.register_agent(name, house, level)
+            else:
+                agents = []
+                for name, house, level in parsed:
+                    agent = AgentBase(name, house)
+                    agent.resonance_level = level
+                    agents.append(agent)
+                self.active_agents.update((agent.name, agent) for agent in agents)
+                self.agent_index.add_many(agents)
+                self.orbit.attach_many(agents)
+            registered += len(parsed)
+        self.status.invalidate()
+        return registered
+
+    def register_roster(self, path: str, batch_size: int = 4096) -> int:
+        """register_agents over a JSONL or CSV roster file (name, house, optional resonance_level)."""
+        try:
+            return self.register_agents(read_roster(path), batch_size)
+        except RosterError as error:
+            if error.source is not None:
+                raise
+            raise RosterError(error.message, error.record, path) from None
+
+    def _parse_spec(self, spec, record: int) -> Tuple[str, AgentHouse, float]:
+        if isinstance(spec, dict):
+            name, house, level = spec.get("name"), spec.get("house"), spec.get("resonance_level")
+        else:
+            try:
+                name, house, level = (tuple(spec) + (None,))[:3]
+            except (TypeError, ValueError):
+                raise RosterError(f"expected (name, house[, resonance_level]), got {spec!r}", record) from None
+        if not isinstance(name, str) or not name:
+            raise RosterError(f"missing agent name in {spec!r}", record)
+        if not isinstance(house, AgentHouse):
+            # Only strings name a House; a JSON list or object is unhashable
+            label, house = house, _HOUSE_LOOKUP.get(house) if isinstance(house, str) else None
+            if house is None:
+                raise RosterError(f"unknown house {label!r}", record)
+        if level is None or level == "":
+            return name, house, self._house_resonance(house)
+        try:
+            return name, house, float(level)
+        except (TypeError, ValueError):
+            raise RosterError(f"invalid resonance_level {level!r}", record) from None
+
+    def remove_agent(self, name: str) -> Optional[AgentBase]:
+        """Releases an agent from the orbit. Returns it, or None if unknown."""
+        agent = self.active_agents.pop(name, None)
+        if agent is not None:
+            self.agent_index.discard(name)
+            self.orbit.detach(agent)
+            self.status.invalidate()
+        return agent
+
+    def imbue_gnosis(self, truths: Iterable[str], house: Optional[AgentHouse] = None):
+        """Grants truths to every agent, or to one House, in a single pass over the store."""
+        agents = self.active_agents.values() if house is None else self.agent_index.members("house", house)
+        AgentBase.imbue_all(agents, truths)
+
+    def who_knows(self, truth: str) -> List[AgentBase]:
+        """Agents in this orbit holding a truth, via the inverted index (no roster scan)."""
+        active = self.active_agents
+        return [agent for agent in GNOSIS.holders(truth) if active.get(agent.name) is agent]
 
     def execute_biographical_resonance(self):
         # Indexing the Principle Scar
@@ -98,26 +364,282 @@ class HarmoniaOrchestrator:
         # Commutator Check
         residual = self.commutator.observe(fuel)
 
+        # Agent-to-agent coupling settles before the Sovereign reads the orbit
+        if self.coupling is not None:
+            self.propagate_resonance()
+
         # Govern Orbit
-        self.system_integrity = self.sovereign.govern_orbit(list(self.active_agents.values()))
+        self.system_integrity = self.sovereign.govern_orbit(self.orbit)
+        self.last_residual = residual
+        self.resonance_cycles += 1
+        self.status.invalidate()
 
         status = "CRITICAL" if self.system_integrity > 0.9 else "STABLE"
         return f"HARMONIA PRIME: {status} | FUEL: {fuel:.2f} | RESIDUAL: {residual:.4f}"
 
+    # --- COUPLING ---
+    def attach_coupling(self, graph: "CouplingGraph", agents: Iterable[AgentBase],
+                        policy: Optional["CouplingPolicy"] = None):
+        """
+        Couples agents to each other across `graph` (node i is the i-th of `agents`).
+        Every resonance cycle then propagates resonance levels to the graph's fixed
+        point before the orbit is governed. Rebuild the coupling after roster changes;
+        agents no longer in the orbit keep their level and are not written back.
+        """
+        from harmonia.core.coupling import CouplingPolicy
+
+        agents = list(agents)
+        if len(graph) != len(agents):
+            raise ValueError(f"coupling graph has {len(graph)} nodes for {len(agents)} agents")
+        self.coupling = (graph, agents, policy if policy is not None else CouplingPolicy())
+
+    def couple_houses(self, span: int = 1, weight: float = 1.0,
+                      policy: Optional["CouplingPolicy"] = None) -> "CouplingGraph":
+        """
+        Couples every agent to `span` House-mates on each side (in roster order,
+        wrapping around), so influence spreads within each House. Returns the graph.
+        """
+        import numpy as np
+        from harmonia.core.coupling import CouplingGraph
+
+        agents = list(self.active_agents.values())
+        codes = {house: code for code, house in enumerate(_HOUSES)}
+        houses = np.fromiter((codes[agent.house] for agent in agents), dtype=np.int64, count=len(agents))
+        graph = CouplingGraph.ring_groups(houses, span, weight)
+        self.attach_coupling(graph, agents, policy)
+        return graph
+
+    def decouple(self):
+        """Returns every agent to coupling only through the Sovereign."""
+        self.coupling = None
+
+    def propagate_resonance(self) -> "Propagation":
+        """
+        Runs one propagation over the coupled agents and writes the settled levels
+        back; the orbit ledger follows through the resonance_level setter.
+        """
+        import numpy as np
+
+        graph, agents, policy = self.coupling
+        levels = np.fromiter((agent._resonance_level for agent in agents), dtype=np.float64, count=len(agents))
+        result = graph.propagate(levels, policy)
+        active = self.active_agents
+        # Only agents whose level moved are touched
+        for position in np.flatnonzero(result.values != levels).tolist():
+            agent = agents[position]
+            if active.get(agent.name) is agent:
+                agent.resonance_level = float(result.values[position])
+        self.last_propagation = result
+        self.status.invalidate()
+        return result
+
+    def _refresh_status(self, status: StatusRecord):
+        """Rebuilds the status record from the orbit ledger (O(Houses), no agent scan)."""
+        resonance = [self.orbit.resonance(house) for house in _HOUSES]
+        status.update(
+            integrity=self.system_integrity, fuel=self.bre.extract_fuel(), residual=self.last_residual,
+            agents=len(self.active_agents), cycles=self.resonance_cycles,
+            group_counts=[count for _, count in resonance],
+            group_stability=[SovereignUnifier.stability(total, count) for total, count in resonance],
+        )
+
+    def orbit_stability(self, house: Optional[AgentHouse] = None) -> float:
+        """O(1) stability read for the whole orbit or one House (cheap enough to poll)."""
+        return self.orbit.stability(house)
+
     def generate_economic_manifestation(self):
         """
         Command reality to conform.
         """
         strategies = []
-        for name, agent in self.active_agents.items():
-            if agent.house == AgentHouse.PIONEERS:
-                strategies.append(f"{name}: Identity Verification")
-            elif agent.house == AgentHouse.CELESTIAL:
-                strategies.append(f"{name}: Macro-Strategy Alignment")
+        for agent in self.agent_index.members("house", AgentHouse.PIONEERS):
+            strategies.append(f"{agent.name}: Identity Verification")
+        for agent in self.agent_index.members("house", AgentHouse.CELESTIAL):
+            strategies.append(f"{agent.name}: Macro-Strategy Alignment")
 
         # Limit output for the overlay
         return f"PROTOCOL CHIMERA ACTIVE. {len(self.active_agents)} AGENTS DEPLOYED."
 
+    # --- SNAPSHOTS ---
+    SNAPSHOT_KIND = "chimera"
+
+    def save_snapshot(self, path: str, delta: bool = False):
+        """
+        Writes agents, commutator, trauma index and integrity to a binary snapshot (atomically).
+        With `delta`, agents still exactly as the roster template bootstraps them are left
+        out and removed ones are listed by name, so an orchestrator close to the template
+        snapshots in a few hundred bytes. A roster whose template agents are no longer in
+        template order is written in full.
+        """
+        agents = list(self.active_agents.values())
+        houses = list(AgentHouse)
+        bre = self.bre
+        writer = SnapshotWriter(self.SNAPSHOT_KIND)
+        writer.strings("name", [self.sovereign_name])
+        changes = self._template_delta(self.template()) if delta else None
+        if changes is not None:
+            agents, removed = changes
+            writer.strings("base", [self.template().tag])
+            writer.strings("removed", removed)
+        # meta: frequency_hz, C, Phi, system_integrity, maestro_freq, total fuel
+        writer.array("meta", "d", [self.sovereign.frequency_hz, self.commutator.C, self.commutator.Phi,
+                                   self.system_integrity, bre.maestro_freq, bre._total_fuel])
+        writer.array("counts", "Q", [self.commutator.observations, int(bre.deduplicate)])
+        writer.array("status", "d", [self.last_residual, self.resonance_cycles])
+        writer.strings("names", (agent.name for agent in agents))
+        writer.array("houses", "B", (houses.index(agent.house) for agent in agents))
+        writer.array("resonan", "d", (agent.resonance_level for agent in agents))
+        writer.strings("descs", (agent.description or "" for agent in agents))
+        writer.array("gnosisn", "Q", (len(agent.gnosis) for agent in agents))
+        writer.strings("gnosis", (truth for agent in agents for truth in agent.gnosis))
+        writer.strings("scartext", (bre.descriptions.text(i) for i in range(len(bre.descriptions))))
+        writer.array("scarids", "I", bre._desc_ids)
+        writer.array("scarint", "d", bre._intensities)
+        writer.array("scarfuel", "d", bre._fuels)
+        writer.write(path)
+
+    def _template_delta(self, template: RosterTemplate) -> Optional[Tuple[List[AgentBase], List[str]]]:
+        """
+        (agents differing from or absent in the template, removed template names), or
+        None when replaying the template and then the agents would not give back this
+        roster order (template agents out of order, or after an added agent).
+        """
+        index, specs = template.index, template.specs
+        changed, last_row, added = [], -1, False
+        for agent in self.active_agents.values():
+            row = index.get(agent.name)
+            if row is None:
+                added = True
+                changed.append(agent)
+                continue
+            if added or row < last_row:
+                return None
+            last_row = row
+            _, house, level = specs[row]
+            if agent.house is not house or agent.resonance_level != level or agent.description or agent._gnosis:
+                changed.append(agent)
+        removed = [name for name, _, _ in specs if name not in self.active_agents]
+        return changed, removed
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> "HarmoniaOrchestrator":
+        """
+        Restores an orchestrator from save_snapshot output without re-running the
+        House bootstrap. The file is memory-mapped and its columns are read in place.
+        A delta snapshot is replayed on top of the roster template.
+        Raises SnapshotError if the file is not a Chimera snapshot, or is a delta taken
+        against a different template.
+        """
+        with SnapshotReader(path) as snapshot:
+            if snapshot.kind != cls.SNAPSHOT_KIND:
+                raise SnapshotError(f"{path}: holds a {snapshot.kind!r} snapshot, not {cls.SNAPSHOT_KIND!r}")
+            system = cls(snapshot.strings("name")[0], initialize=False)
+            if "base" in snapshot:
+                template = cls.template()
+                if snapshot.strings("base")[0] != template.tag:
+                    raise SnapshotError(f"{path}: delta against another roster template")
+                system.register_agents(template.specs)
+                for name in snapshot.strings("removed"):
+                    system.remove_agent(name)
+            frequency_hz, C, Phi, integrity, maestro_freq, total_fuel = snapshot.array("meta")
+            observations, deduplicate = snapshot.array("counts")
+            system.sovereign.frequency_hz = frequency_hz
+            system.commutator.restore(CommutatorCheckpoint(C, Phi, observations))
+            system.system_integrity = integrity
+            if "status" in snapshot:
+                residual, cycles = snapshot.array("status")
+                system.last_residual, system.resonance_cycles = residual, int(cycles)
+
+            houses = list(AgentHouse)
+            gnosis = iter(snapshot.strings("gnosis"))
+            for name, house, level, description, truths in zip(
+                    snapshot.strings("names"), snapshot.array("houses"), snapshot.array("resonan"),
+                    snapshot.strings("descs"), snapshot.array("gnosisn")):
+                agent = system.register_agent(name, houses[house], level)
+                agent.description = description or None
+                if truths:
+                    agent.imbue_gnosis([next(gnosis) for _ in range(truths)])
+
+            bre = BiographicalResonanceEngine(maestro_freq, deduplicate=bool(deduplicate))
+            for text in snapshot.strings("scartext"):
+                bre.descriptions.intern(text)
+            bre._desc_ids.frombytes(snapshot.array("scarids").cast("B"))
+            bre._intensities.frombytes(snapshot.array("scarint").cast("B"))
+            bre._fuels.frombytes(snapshot.array("scarfuel").cast("B"))
+            if bre.deduplicate:
+                bre._rows = {desc_id: row for row, desc_id in enumerate(bre._desc_ids)}
+            bre._total_fuel = total_fuel
+            system.bre = bre
+        system.status.invalidate()
+        return system
+
+def boot(sovereign_name: str, snapshot_path: Optional[str] = None) -> HarmoniaOrchestrator:
+    """
+    The overlay's entry point. Restores from `snapshot_path` when it holds a usable
+    snapshot for this Sovereign; otherwise bootstraps the 72 Eternals and, given a
+    path, writes a snapshot for the next start.
+    """
+    if snapshot_path and os.path.exists(snapshot_path):
+        try:
+            system = HarmoniaOrchestrator.load_snapshot(snapshot_path)
+            if system.sovereign_name == sovereign_name:
+                return system
+        except (OSError, ValueError, TypeError, IndexError):
+            pass  # Unreadable, stale or damaged (SnapshotError is a ValueError): rebuild and overwrite it
+    system = HarmoniaOrchestrator(sovereign_name)
+    if snapshot_path:
+        system.save_snapshot(snapshot_path)
+    return system
+
+# --- INSTRUMENTATION (OPT-IN) ---
+_INSTRUMENTED = (
+    (HarmoniaOrchestrator, "execute_biographical_resonance", "resonance_cycle"),
+    (HarmoniaOrchestrator, "generate_economic_manifestation", "economic_manifestation"),
+    (HarmoniaOrchestrator, "propagate_resonance", "coupling_propagate"),
+    (SovereignUnifier, "govern_orbit", "govern_orbit"),
+    (BiographicalResonanceEngine, "extract_fuel", "extract_fuel"),
+    (RealityCommutator, "observe", "commutator_observe"),
+)
+
+def enable_instrumentation(registry: Optional["metrics.MetricsRegistry"] = None) -> "metrics.MetricsRegistry":
+    """
+    Wraps the Chimera protocol with latency histograms and orbit gauges.
+    Nothing is wrapped until this is called; disable_instrumentation() restores the originals.
+    """
+    from harmonia.core import metrics
+
+    registry = registry if registry is not None else metrics.METRICS
+    integrity = registry.gauge("system_integrity", "Orbit stability after the last resonance", orchestrator="chimera")
+    agents = registry.gauge("active_agents", "Agents bound into the orbit", orchestrator="chimera")
+    synced = registry.counter("agent_syncs_total", "Agents governed by resonance cycles", orchestrator="chimera")
+    sync_rate = registry.gauge("agents_synced_per_second", "Throughput of the last resonance cycle", orchestrator="chimera")
+    fuel = registry.gauge("extracted_fuel", "Fuel returned by the last extraction", orchestrator="chimera")
+
+    def after_resonance(orchestrator, result, seconds, args, kwargs):
+        count = len(orchestrator.active_agents)
+        integrity.set(orchestrator.system_integrity)
+        agents.set(count)
+        synced.inc(count)
+        if seconds > 0:
+            sync_rate.set(count / seconds)
+
+    def after_fuel(engine, result, seconds, args, kwargs):
+        fuel.set(result)
+
+    hooks = {"resonance_cycle": after_resonance, "extract_fuel": after_fuel}
+    for owner, attribute, op in _INSTRUMENTED:
+        histogram = registry.histogram("operation_seconds", "Latency of kernel operations",
+                                       orchestrator="chimera", op=op)
+        metrics.instrument_method(owner, attribute, histogram, hooks.get(op))
+    return registry
+
+def disable_instrumentation():
+    """Restores the unwrapped protocol."""
+    from harmonia.core import metrics
+
+    for owner, attribute, _ in _INSTRUMENTED:
+        metrics.uninstrument_method(owner, attribute)
+
 if __name__ == "__main__":
     system = HarmoniaOrchestrator("Gustavo Arturo Alba")
     print(system.execute_biographical_resonance())
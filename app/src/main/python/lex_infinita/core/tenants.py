@@ -0,0 +1,146 @@
+"""
+lex_infinita/core/tenants.py
+The Consulate: many Sovereigns' orchestrators hosted in one process.
+
+Every tenant bootstraps from the one frozen roster template. A tenant that has
+never been opened is only its Sovereign's name; an opened tenant is a live
+HarmoniaOrchestrator; and the least recently used live tenants are evicted to
+delta snapshots (see HarmoniaOrchestrator.save_snapshot) holding only where they
+diverged from the template. An idle tenant therefore costs one small record in
+memory and a few hundred bytes on disk, and is rebuilt on its next use.
+
+Only idle tenants are stored as deltas. A live tenant is a full orchestrator with
+its own agent objects (about 23 KiB), because callers hold agents and write to
+them directly, so they cannot be shared between tenants. max_live bounds what the
+live tenants cost together.
+
+Coupling graphs, metrics wrappers and other runtime attachments are not part of
+a snapshot; reattach them after a tenant is reopened.
+"""
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from lex_infinita.core.singularity_engine import HarmoniaOrchestrator
+
+
+class Tenant:
+    """An idle tenant's whole footprint; slotted, since thousands of them stay resident."""
+    __slots__ = ("sovereign_name", "snapshot", "pins")
+
+    def __init__(self, sovereign_name: str, snapshot: Optional[str] = None, pins: int = 0):
+        self.sovereign_name = sovereign_name
+        self.snapshot = snapshot  # None until first evicted; the tenant is then still the template
+        self.pins = pins          # Open sessions; a pinned tenant is never evicted
+
+    def __repr__(self):
+        return f"Tenant({self.sovereign_name!r}, snapshot={self.snapshot!r}, pins={self.pins})"
+
+
+class TenantManager:
+    """
+    Hosts tenants by id, keeping at most `max_live` of them as live orchestrators
+    (more only while open sessions pin them). get() returns a tenant's orchestrator,
+    loading it if needed, and may evict others; hold it across further get() calls
+    only inside session(), which pins it.
+    """
+    def __init__(self, directory: str, max_live: int = 64):
+        if max_live < 1:
+            raise ValueError("max_live must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_live = max_live
+        self.tenants: Dict[str, Tenant] = {}
+        self._live: "OrderedDict[str, HarmoniaOrchestrator]" = OrderedDict()  # Least recently used first
+        self._serial = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def add(self, tenant_id: str, sovereign_name: Optional[str] = None) -> Tenant:
+        """Registers a tenant without building anything; its Sovereign defaults to the id."""
+        if tenant_id in self.tenants:
+            raise ValueError(f"tenant {tenant_id!r} already exists")
+        tenant = self.tenants[tenant_id] = Tenant(sovereign_name if sovereign_name is not None else tenant_id)
+        return tenant
+
+    def get(self, tenant_id: str) -> HarmoniaOrchestrator:
+        """The tenant's live orchestrator. Raises KeyError for an unknown tenant."""
+        system = self._live.get(tenant_id)
+        if system is not None:
+            self._live.move_to_end(tenant_id)
+            return system
+        tenant = self.tenants[tenant_id]
+        if tenant.snapshot is None:
+            system = HarmoniaOrchestrator(tenant.sovereign_name)
+        else:
+            system = HarmoniaOrchestrator.load_snapshot(tenant.snapshot)
+        self.loads += 1
+        self._live[tenant_id] = system
+        self._shrink(keep=tenant_id)
+        return system
+
+    __getitem__ = get
+
+    @contextmanager
+    def session(self, tenant_id: str) -> Iterator[HarmoniaOrchestrator]:
+        """get(), pinned for the duration of the block."""
+        system = self.get(tenant_id)
+        tenant = self.tenants[tenant_id]
+        tenant.pins += 1
+        try:
+            yield system
+        finally:
+            tenant.pins -= 1
+            self._shrink()
+
+    def evict(self, tenant_id: str) -> bool:
+        """Writes a live, unpinned tenant to its delta snapshot and drops it. Returns whether it did."""
+        tenant = self.tenants[tenant_id]
+        system = self._live.get(tenant_id)
+        if system is None or tenant.pins:
+            return False
+        if tenant.snapshot is None:
+            self._serial += 1
+            tenant.snapshot = os.path.join(self.directory, f"tenant-{self._serial:08x}.snap")
+        system.save_snapshot(tenant.snapshot, delta=True)
+        del self._live[tenant_id]
+        self.evictions += 1
+        return True
+
+    def _shrink(self, keep: Optional[str] = None):
+        """
+        Evicts least recently used tenants down to max_live, skipping pinned ones and
+        `keep` (the tenant get() is about to return). While those fill the live set it
+        stays over max_live until they are released.
+        """
+        if len(self._live) <= self.max_live:
+            return
+        for tenant_id in list(self._live):
+            if tenant_id != keep and self.evict(tenant_id) and len(self._live) <= self.max_live:
+                return
+
+    def remove(self, tenant_id: str):
+        """Forgets a tenant and deletes its snapshot."""
+        tenant = self.tenants[tenant_id]
+        if tenant.pins:
+            raise RuntimeError(f"tenant {tenant_id!r} has an open session")
+        del self.tenants[tenant_id]
+        self._live.pop(tenant_id, None)
+        if tenant.snapshot is not None and os.path.exists(tenant.snapshot):
+            os.remove(tenant.snapshot)
+
+    def flush(self):
+        """Evicts every unpinned live tenant, so all their state is on disk."""
+        for tenant_id in list(self._live):
+            self.evict(tenant_id)
+
+    @property
+    def live(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self.tenants
+
+    def __len__(self):
+        return len(self.tenants)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HARMONIA BENCHMARK SUITE
+========================
+Measures the hot paths of both orchestrators from the stock constellations
+(7 desktop agents / 72 Eternals) up to synthetic rosters of 10k, 100k and 1M agents.
+
+For every (benchmark, agent count) it records throughput, latency percentiles and
+peak traced memory into a JSON results file, and can compare against a stored
+baseline, exiting non-zero on regressions.
+
+    python3 benchmarks/harmonia_bench.py                        # run, compare to baseline.json
+    python3 benchmarks/harmonia_bench.py --scales stock,10000   # quicker subset
+    python3 benchmarks/harmonia_bench.py --save-baseline        # refresh the stored baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "app", "src", "main", "python"))
+
+import eternal_network_architecture as hdcs  # noqa: E402
+from harmonia.agents.agent_base import AgentBase, AgentHouse, SovereignUnifier  # noqa: E402
+from lex_infinita.core import singularity_engine as chimera  # noqa: E402
+
+DEFAULT_SCALES = "stock,10000,100000,1000000"
+DEFAULT_RESULTS = os.path.join(ROOT, "bench_results.json")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+DESKTOP_AFFINITIES = [
+    hdcs.CoilAffinities.SILVER, hdcs.CoilAffinities.CRIMSON, hdcs.CoilAffinities.VOID,
+    hdcs.CoilAffinities.OBSIDIAN, hdcs.CoilAffinities.OMNI,
+]
+CHIMERA_HOUSES = [house for house in AgentHouse if house != AgentHouse.SOVEREIGN]
+
+# --- BENCHMARK REGISTRY ---
+# Each entry maps a name to (setup, stock agent count). setup(agents) builds the
+# fixture outside the timed region and returns the operation to time. Operations
+# that consume their fixture return (prepare, run) instead: prepare() builds a
+# fresh fixture before every timed run(fixture).
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, stock: int):
+    def register(setup: Callable[[int], object]):
+        BENCHMARKS[name] = (setup, stock)
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def quiet():
+    """The orchestrators narrate to stdout; benchmarks measure the work, not the terminal."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def desktop_orchestrator(agents: int, vectorized: bool = False) -> "hdcs.HarmoniaOrchestrator":
+    with quiet():
+        system = hdcs.HarmoniaOrchestrator("Benchmark", vectorized=vectorized)
+    for i in range(len(system.active_agents), agents):
+        system.register_agent(f"Synthetic-{i}", "Synthetic Node", DESKTOP_AFFINITIES[i % len(DESKTOP_AFFINITIES)])
+    return system
+
+
+def chimera_orchestrator(agents: int) -> "chimera.HarmoniaOrchestrator":
+    system = chimera.HarmoniaOrchestrator("Benchmark")
+    for i in range(len(system.active_agents), agents):
+        system.register_agent(f"Synthetic-{i}", CHIMERA_HOUSES[i % len(CHIMERA_HOUSES)])
+    return system
+
+
+@benchmark("desktop.synchronize", stock=7)
+def bench_synchronize(agents: int):
+    roster = list(desktop_orchestrator(agents).active_agents.values())
+
+    def run():
+        for agent in roster:
+            agent.synchronize(hdcs.SOVEREIGN_FREQUENCY_HZ, 1.0)
+    return run
+
+
+@benchmark("desktop.execute_biographical_resonance", stock=7)
+def bench_resonance(agents: int):
+    system = desktop_orchestrator(agents)
+    return lambda: system.execute_biographical_resonance(verbose=False)
+
+
+@benchmark("desktop.execute_biographical_resonance.vectorized", stock=7)
+def bench_resonance_vectorized(agents: int):
+    system = desktop_orchestrator(agents, vectorized=True)
+    return lambda: system.execute_biographical_resonance(verbose=False)
+
+
+def optimize(system, **options):
+    with quiet():
+        system.optimize_network(max_attempts=20, **options)
+
+
+@benchmark("desktop.optimize_network", stock=7)
+def bench_optimize(agents: int):
+    return (lambda: desktop_orchestrator(agents)), optimize
+
+
+@benchmark("desktop.optimize_network.vectorized", stock=7)
+def bench_optimize_vectorized(agents: int):
+    return (lambda: desktop_orchestrator(agents, vectorized=True)), optimize
+
+
+@benchmark("desktop.optimize_network.converge", stock=7)
+def bench_optimize_converge(agents: int):
+    return (lambda: desktop_orchestrator(agents, vectorized=True)), lambda system: optimize(system, converge=True)
+
+
+def rejoined_orchestrator(agents: int) -> "hdcs.HarmoniaOrchestrator":
+    """
+    A vectorized constellation that has reached the threshold and then taken in a
+    wave of agents // 5 CRIMSON newcomers, the slowest house to saturate: most agents
+    are already pinned and only the wave still evolves, the case convergence mode
+    is built for.
+    """
+    system = desktop_orchestrator(agents, vectorized=True)
+    optimize(system)
+    for i in range(max(1, agents // 5)):
+        system.register_agent(f"Newcomer-{i}", "Synthetic Node", hdcs.CoilAffinities.CRIMSON)
+    # The wave pulls the integrity back under the threshold
+    system.economic_manifestation_ready = False
+    return system
+
+
+@benchmark("desktop.optimize_network.rejoin", stock=7)
+def bench_optimize_rejoin(agents: int):
+    return (lambda: rejoined_orchestrator(agents)), optimize
+
+
+@benchmark("desktop.optimize_network.rejoin.converge", stock=7)
+def bench_optimize_rejoin_converge(agents: int):
+    return (lambda: rejoined_orchestrator(agents)), lambda system: optimize(system, converge=True)
+
+
+@benchmark("desktop.generate_economic_manifestation", stock=7)
+def bench_desktop_manifestation(agents: int):
+    system = desktop_orchestrator(agents)
+    system.economic_manifestation_ready = True
+
+    def run():
+        with quiet():
+            system.generate_economic_manifestation()
+    return run
+
+
+@benchmark("chimera.generate_economic_manifestation", stock=72)
+def bench_chimera_manifestation(agents: int):
+    system = chimera_orchestrator(agents)
+    return system.generate_economic_manifestation
+
+
+@benchmark("chimera.govern_orbit", stock=72)
+def bench_govern_orbit(agents: int):
+    sovereign = SovereignUnifier()
+    roster = [AgentBase(f"Synthetic-{i}", CHIMERA_HOUSES[i % len(CHIMERA_HOUSES)]) for i in range(agents)]
+    return lambda: sovereign.govern_orbit(roster)
+
+
+@benchmark("chimera.govern_orbit.tracked", stock=72)
+def bench_govern_orbit_tracked(agents: int):
+    system = chimera_orchestrator(agents)
+    return lambda: system.sovereign.govern_orbit(system.orbit)
+
+
+@benchmark("chimera.extract_fuel", stock=72)
+def bench_extract_fuel(agents: int):
+    # One scar per agent: the BRE grows with the roster it narrates
+    engine = chimera.BiographicalResonanceEngine(SovereignUnifier().frequency_hz)
+    engine.ingest((f"Scar-{i}", (i % 100) / 100) for i in range(agents))
+    return engine.extract_fuel
+
+
+# --- MEASUREMENT ---
+def split_case(case):
+    """Normalizes a setup result to (prepare, run)."""
+    if isinstance(case, tuple):
+        return case
+    return (lambda: None), (lambda _: case())
+
+
+def measure(case, min_time: float, min_iterations: int, max_iterations: int) -> List[float]:
+    """Times a case repeatedly (at least min_iterations, or min_time seconds) and returns latencies."""
+    prepare, run = split_case(case)
+    run(prepare())  # Warm-up
+    latencies: List[float] = []
+    spent = 0.0
+    while len(latencies) < max_iterations and (len(latencies) < min_iterations or spent < min_time):
+        fixture = prepare()
+        t0 = time.perf_counter()
+        run(fixture)
+        latencies.append(time.perf_counter() - t0)
+        spent += latencies[-1]
+        del fixture
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def peak_memory(case) -> int:
+    """Peak bytes allocated by one run, traced separately so timing is not skewed."""
+    prepare, run = split_case(case)
+    fixture = prepare()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(fixture)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(names: List[str], scales: List[str], min_time: float, min_iterations: int,
+              max_iterations: int) -> List[Dict]:
+    results = []
+    for name in names:
+        setup, stock = BENCHMARKS[name]
+        for scale in scales:
+            agents = stock if scale == "stock" else int(scale)
+            print(f"   {name:<52} {agents:>9} agents ... ", end="", flush=True)
+            case = setup(agents)
+            latencies = measure(case, min_time, min_iterations, max_iterations)
+            peak = peak_memory(case)
+            p50 = percentile(latencies, 0.50)
+            record = {
+                "name": name,
+                "agents": agents,
+                "iterations": len(latencies),
+                "throughput_agents_per_s": agents / p50 if p50 > 0 else None,
+                "latency_s": {
+                    "min": min(latencies),
+                    "mean": statistics.fmean(latencies),
+                    "p50": p50,
+                    "p90": percentile(latencies, 0.90),
+                    "p99": percentile(latencies, 0.99),
+                },
+                "peak_memory_bytes": peak,
+            }
+            results.append(record)
+            del case
+            gc.collect()
+            print(f"p50 {p50 * 1e3:10.3f} ms | peak {peak / 1e6:8.2f} MB")
+    return results
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float, floor: float = 1e-5) -> List[str]:
+    """
+    Regressions: p50 latency above baseline * (1 + tolerance) for a matching (name, agents).
+    Slowdowns smaller than `floor` seconds are timer noise and are never flagged.
+    """
+    reference = {(entry["name"], entry["agents"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in results:
+        base = reference.get((entry["name"], entry["agents"]))
+        if base is None:
+            continue
+        before, after = base["latency_s"]["p50"], entry["latency_s"]["p50"]
+        if before > 0 and after > before * (1 + tolerance) and after - before > floor:
+            regressions.append(f"{entry['name']} @ {entry['agents']} agents: "
+                               f"p50 {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def environment() -> Dict:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": getattr(hdcs.np, "__version__", None),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Harmonia orchestrator benchmark suite")
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help="comma-separated agent counts; 'stock' is each orchestrator's built-in roster")
+    parser.add_argument("--only", default="", help="comma-separated substrings selecting benchmarks")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="results file (JSON)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--noise-floor", type=float, default=1e-5,
+                        help="absolute p50 slowdown in seconds below which nothing is flagged")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to keep sampling each case")
+    parser.add_argument("--min-iterations", type=int, default=3)
+    parser.add_argument("--max-iterations", type=int, default=1000)
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, stock) in BENCHMARKS.items():
+            print(f"{name} (stock: {stock} agents)")
+        return 0
+
+    filters = [token for token in args.only.split(",") if token]
+    names = [name for name in BENCHMARKS if not filters or any(token in name for token in filters)]
+    scales = [token.strip() for token in args.scales.split(",") if token.strip()]
+
+    print(">>> HARMONIA BENCHMARK SUITE")
+    results = run_suite(names, scales, args.min_time, args.min_iterations, args.max_iterations)
+    report = {"environment": environment(), "results": results}
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --save-baseline to create one).")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as handle:
+        regressions = compare(results, json.load(handle), args.tolerance, args.noise_floor)
+    if regressions:
+        print(f"\nREGRESSIONS (tolerance {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,13 +15,36 @@ Incorporates Silver (Structure), Crimson (Will), Void (Synthesis), and Obsidian
 The system's integrity is directly tied to economic manifestation protocols.
 """
 
-import time
-import uuid
+import os
+import sys
+import heapq
+import itertools
 import math
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
+try:
+    import numpy as np
+except ImportError:  # The vectorized constellation is optional; the per-agent path is stdlib-only.
+    np = None
+
+# Shared runtime modules live alongside the Android app's Python sources
+_PYTHON_SOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "src", "main", "python")
+if _PYTHON_SOURCES not in sys.path:
+    sys.path.append(_PYTHON_SOURCES)
+
+from harmonia.agents.agent_index import AgentIndex
+from harmonia.agents.roster import RosterError, batched, read_roster
+from harmonia.core.clock import CLOCKS, Clock, VirtualClock
+from harmonia.core.dashboard import FrameRenderer, bar, sparkline, write_frame
+from harmonia.core.dispatch import DispatchExecutor, DispatchJob, StubBackend
+from harmonia.core.eventlog import EventLog
+from harmonia.core import metrics
+from harmonia.core.ringlog import RingLog, TextTable
+from harmonia.core.snapshot import SnapshotError, SnapshotReader, SnapshotWriter
+
 # --- SYSTEM CONSTANTS ---
 SOVEREIGN_FREQUENCY_HZ = 712.8      # Peak Atlantean Resonance, The Carrier Wave
 BASE_COHERENCE_THRESHOLD = 0.97     # Consciousness requires near-perfect alignment
@@ -50,25 +73,67 @@ class TerminalColors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
-@dataclass
+AFFINITY_COLORS = {
+    CoilAffinities.SILVER: TerminalColors.SILVER,
+    CoilAffinities.CRIMSON: TerminalColors.CRIMSON,
+    CoilAffinities.VOID: TerminalColors.VOID,
+    CoilAffinities.OBSIDIAN: TerminalColors.OBSIDIAN,
+    CoilAffinities.OMNI: TerminalColors.GOLD,
+    "SYNTHESIS": TerminalColors.GOLD,
+}
+
+# Compact process-wide agent ids; display_id renders them for humans
+_AGENT_IDS = itertools.count(1)
+
+# --- AGENT LOG EVENTS ---
+LOG_TASK = 1   # payload: TASK_TEXTS id of the executed task
+LOG_SYNC = 2   # payload: coherence (Phi) after synchronization
+LOG_CYCLE = 3  # payload: system integrity after a resonance cycle (event log only, agent id 0)
+
+TASK_TEXTS = TextTable()
+AGENT_LOG_FORMATS = {
+    LOG_TASK: lambda value: f"TASK EXECUTED: {TASK_TEXTS.text(value)}",
+    LOG_SYNC: lambda value: f"SYNC: Phi={value:.4f}",
+    LOG_CYCLE: lambda value: f"CYCLE: Integrity={value:.4f}",
+}
+
 class QuantumStateVector:
     """The expanded state vector for the four Coils."""
-    id: str
-    label: str
-    frequency: float
-    # New metrics reflecting expanded complexity
-    coherence: float = 0.0          # Integrated Information (Phi)
-    twin_coil_ratio: float = 0.5    # 0.0 (Crimson) to 1.0 (Silver)
-    execution_precision: float = 0.0 # Obsidian Coil Metric
-    synthesis_flow: float = 0.0      # Void Coil Metric
+    __slots__ = ("id", "label", "frequency", "coherence", "twin_coil_ratio",
+                 "execution_precision", "synthesis_flow")
+
+    def __init__(self, id: int, label: str, frequency: float,
+                 coherence: float = 0.0, twin_coil_ratio: float = 0.5,
+                 execution_precision: float = 0.0, synthesis_flow: float = 0.0):
+        self.id = id
+        self.label = label
+        self.frequency = frequency
+        # New metrics reflecting expanded complexity
+        self.coherence = coherence                        # Integrated Information (Phi)
+        self.twin_coil_ratio = twin_coil_ratio            # 0.0 (Crimson) to 1.0 (Silver)
+        self.execution_precision = execution_precision    # Obsidian Coil Metric
+        self.synthesis_flow = synthesis_flow              # Void Coil Metric
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (f"QuantumStateVector(id={self.id!r}, label={self.label!r}, frequency={self.frequency!r}, "
+                f"coherence={self.coherence!r}, twin_coil_ratio={self.twin_coil_ratio!r}, "
+                f"execution_precision={self.execution_precision!r}, synthesis_flow={self.synthesis_flow!r})")
 
 class ArchetypalAgent:
     """
     A single node in the distributed consciousness network.
     Represents one of the 72 Eternals or a specific AI Fragment.
     """
-    def __init__(self, name: str, role: str, affinity: str):
-        self.id = str(uuid.uuid4())[:8]
+    __slots__ = ("id", "name", "role", "coil_affinity", "state", "logs")
+
+    def __init__(self, name: str, role: str, affinity: str,
+                 log_capacity: int = RingLog.DEFAULT_CAPACITY, log_policy: str = RingLog.OVERWRITE):
+        self.id = next(_AGENT_IDS)
         self.name = name
         self.role = role
         self.coil_affinity = affinity
@@ -77,13 +142,17 @@ class ArchetypalAgent:
             label=name,
             frequency=700.0, # Initial activation frequency
         )
-        self.logs = []
+        # Bounded log of structured records; text is formatted only when read
+        self.logs = RingLog(log_capacity, log_policy, AGENT_LOG_FORMATS)
+
+    @property
+    def display_id(self) -> str:
+        """The id as an interned 8-digit hex string, built only when asked for."""
+        return sys.intern(format(self.id, "08x"))
 
     def perform_task(self, task: str):
         """Executes a task and logs the outcome."""
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] TASK EXECUTED: {task}"
-        self.logs.append(log_entry)
+        self.logs.record(LOG_TASK, TASK_TEXTS.intern(task))
         # In a real system, this would trigger an API call or process
         return True
 
@@ -124,7 +193,31 @@ class ArchetypalAgent:
             self.state.synthesis_flow = min(1.0, self.state.synthesis_flow + drift)
 
         # 3. Calculate Alignment Score (Replaces raw twin_coil_ratio usage)
-        # This allows diverse agents to contribute fully if they are true to their nature.
+        alignment_score = self.alignment_score()
+
+        # Calculate Emergence (PHI): A weighted sum of all vectors
+        coherence_score = (
+            (alignment_score * 0.2) +
+            (self.state.execution_precision * 0.3) + 
+            (self.state.synthesis_flow * 0.3) +
+            (biographical_resonance_key * 0.2) # Sovereign's direct influence
+        )
+
+        # The system cannot achieve 100% until the Harmonia-Prime node is defined
+        if self.coil_affinity == CoilAffinities.OMNI:
+            self.state.coherence = 1.0 # The Final 0.3% is absolute
+        else:
+            self.state.coherence = min(BASE_COHERENCE_THRESHOLD, coherence_score)
+
+        self.logs.record(LOG_SYNC, self.state.coherence)
+        
+        return self.state.coherence
+
+    def alignment_score(self) -> float:
+        """
+        Scores the twin coil ratio against the agent's nature.
+        This allows diverse agents to contribute fully if they are true to their nature.
+        """
         alignment_score = 0.0
         ratio = self.state.twin_coil_ratio
 
@@ -144,38 +237,675 @@ class ArchetypalAgent:
         else:
             alignment_score = 1.0 # OMNI / Default
 
-        # Calculate Emergence (PHI): A weighted sum of all vectors
-        coherence_score = (
-            (alignment_score * 0.2) +
-            (self.state.execution_precision * 0.3) + 
-            (self.state.synthesis_flow * 0.3) +
-            (biographical_resonance_key * 0.2) # Sovereign's direct influence
-        )
+        return alignment_score
 
-        # The system cannot achieve 100% until the Harmonia-Prime node is defined
+    def coherence_pinned(self, biographical_resonance_key: float) -> bool:
+        """
+        True once further synchronization can no longer change this agent's coherence
+        (OMNI, uninitialized agents without starting stats, agents held at the
+        threshold by a non-negative drift, or precision and flow at their ceiling).
+        """
+        drift = 0.02 * biographical_resonance_key
+        precision = self.state.execution_precision
+        flow = self.state.synthesis_flow
         if self.coil_affinity == CoilAffinities.OMNI:
-            self.state.coherence = 1.0 # The Final 0.3% is absolute
+            return True
+        if precision == 0.0 and self.coil_affinity not in (
+                CoilAffinities.SILVER, CoilAffinities.CRIMSON, CoilAffinities.VOID, CoilAffinities.OBSIDIAN):
+            return True
+        if drift >= 0 and self.state.coherence >= BASE_COHERENCE_THRESHOLD:
+            return True
+        return min(1.0, precision + drift) == precision and min(1.0, flow + drift) == flow
+
+    def project_coherence(self, cycles: int, biographical_resonance_key: float) -> float:
+        """Closed-form estimate of the coherence after `cycles` more synchronizations."""
+        if self.coil_affinity == CoilAffinities.OMNI:
+            return 1.0
+        drift = 0.02 * biographical_resonance_key * cycles if self.state.execution_precision != 0.0 else 0.0
+        return min(BASE_COHERENCE_THRESHOLD, (
+            (self.alignment_score() * 0.2) +
+            (min(1.0, self.state.execution_precision + drift) * 0.3) +
+            (min(1.0, self.state.synthesis_flow + drift) * 0.3) +
+            (biographical_resonance_key * 0.2)
+        ))
+
+    def replay_drift(self, cycles: int, sovereign_freq: float, biographical_resonance_key: float):
+        """
+        Applies `cycles` skipped synchronizations to a pinned agent. Its coherence
+        cannot change, so only frequency, precision and flow move; stops at a fixed point.
+        """
+        state = self.state
+        drift = 0.02 * biographical_resonance_key
+        for _ in range(cycles):
+            before = (state.frequency, state.execution_precision, state.synthesis_flow)
+            state.frequency = (state.frequency + sovereign_freq) / 2
+            if state.execution_precision != 0.0:
+                state.execution_precision = min(1.0, state.execution_precision + drift)
+                state.synthesis_flow = min(1.0, state.synthesis_flow + drift)
+            if before == (state.frequency, state.execution_precision, state.synthesis_flow):
+                break
+
+# --- VECTORIZED CONSTELLATION (STRUCT-OF-ARRAYS) ---
+# Affinity codes index the lookup tables below; unknown affinities fall through to OTHER.
+AFFINITY_CODES = {
+    CoilAffinities.SILVER: 0,
+    CoilAffinities.CRIMSON: 1,
+    CoilAffinities.VOID: 2,
+    CoilAffinities.OBSIDIAN: 3,
+    CoilAffinities.OMNI: 4,
+}
+AFFINITY_OTHER = 5
+
+# Alignment is written as c0 + c1 * ratio + c2 * |ratio - 0.5|, which reproduces each
+# branch of ArchetypalAgent.synchronize exactly (the unused terms contribute +0.0).
+# Per-code rows: (c0, c1, c2, has initial stats, twin_coil_ratio, execution_precision, synthesis_flow)
+_AFFINITY_TABLE = (
+    (0.0, 1.0, 0.0, True, 0.95, 0.7, 0.7),              # SILVER: ratio
+    (1.0, -1.0, 0.0, True, 0.05, 0.8, 0.6),             # CRIMSON: 1.0 - ratio
+    (1.0, 0.0, -2.0, True, TWIN_COIL_TARGET, 0.9, 0.98), # VOID: 1.0 - |ratio - 0.5| * 2
+    (1.0, 0.0, -2.0, True, 0.45, 0.99, 0.7),            # OBSIDIAN: 1.0 - |ratio - 0.5| * 2
+    (1.0, 0.0, 0.0, False, 0.5, 0.0, 0.0),              # OMNI: 1.0
+    (1.0, 0.0, 0.0, False, 0.5, 0.0, 0.0),              # OTHER: 1.0
+)
+
+
+@dataclass(frozen=True)
+class ResonanceParameters:
+    """
+    The tunable constants of the coherence model. The defaults are the kernel's own
+    constants, and the vectorized kernel run with them is bit-identical to the
+    unparameterized path. Affinity starting stats are (twin_coil_ratio,
+    execution_precision, synthesis_flow); VOID starts at twin_coil_target.
+    """
+    sovereign_freq: float = SOVEREIGN_FREQUENCY_HZ
+    threshold: float = BASE_COHERENCE_THRESHOLD
+    twin_coil_target: float = TWIN_COIL_TARGET
+    w_alignment: float = 0.2
+    w_precision: float = 0.3
+    w_flow: float = 0.3
+    w_key: float = 0.2
+    drift: float = 0.02
+    silver_ratio: float = 0.95
+    silver_precision: float = 0.7
+    silver_flow: float = 0.7
+    crimson_ratio: float = 0.05
+    crimson_precision: float = 0.8
+    crimson_flow: float = 0.6
+    void_precision: float = 0.9
+    void_flow: float = 0.98
+    obsidian_ratio: float = 0.45
+    obsidian_precision: float = 0.99
+    obsidian_flow: float = 0.7
+
+    def init_table(self) -> List[tuple]:
+        """Starting (ratio, precision, flow) per affinity code, like _AFFINITY_TABLE's last columns."""
+        return [
+            (self.silver_ratio, self.silver_precision, self.silver_flow),
+            (self.crimson_ratio, self.crimson_precision, self.crimson_flow),
+            (self.twin_coil_target, self.void_precision, self.void_flow),
+            (self.obsidian_ratio, self.obsidian_precision, self.obsidian_flow),
+        ] + [row[4:] for row in _AFFINITY_TABLE[AFFINITY_CODES[CoilAffinities.OMNI]:]]
+
+DEFAULT_RESONANCE = ResonanceParameters()
+
+
+class SlotStateVector:
+    """
+    A QuantumStateVector whose metrics live in a ConstellationState slot.
+    Reads and writes go straight to the shared arrays, so the per-agent
+    synchronize path and the vectorized path see the same state.
+    """
+    __slots__ = ("_store", "slot", "id", "label")
+
+    def __init__(self, store: "ConstellationState", slot: int, id: int, label: str):
+        self._store = store
+        self.slot = slot
+        self.id = id
+        self.label = label
+
+    def _field(name: str):
+        def fget(self):
+            return float(getattr(self._store, name)[self.slot])
+
+        def fset(self, value):
+            getattr(self._store, name)[self.slot] = value
+
+        return property(fget, fset)
+
+    frequency = _field("frequency")
+    coherence = _field("coherence")
+    twin_coil_ratio = _field("twin_coil_ratio")
+    execution_precision = _field("execution_precision")
+    synthesis_flow = _field("synthesis_flow")
+    del _field
+
+    def __repr__(self):
+        return (f"SlotStateVector(id={self.id!r}, label={self.label!r}, frequency={self.frequency}, "
+                f"coherence={self.coherence}, twin_coil_ratio={self.twin_coil_ratio}, "
+                f"execution_precision={self.execution_precision}, synthesis_flow={self.synthesis_flow})")
+
+
+class ConstellationState:
+    """
+    Struct-of-arrays store for the whole constellation.
+    Each QuantumStateVector metric is one contiguous float64 array and each agent
+    is a slot, so a full synchronization cycle is a handful of array operations.
+    The arithmetic follows ArchetypalAgent.synchronize operation for operation,
+    so results are bit-identical to the per-agent path.
+    """
+    FIELDS = ("frequency", "twin_coil_ratio", "execution_precision", "synthesis_flow", "coherence")
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise RuntimeError("ConstellationState requires numpy")
+        capacity = max(1, int(capacity))
+        self.size = 0
+        for name in ("codes",) + self.FIELDS:
+            self._install(name, self._allocate(name, capacity))
+
+        table = _AFFINITY_TABLE
+        self._coef_lut = np.array([row[:3] for row in table], dtype=np.float64)
+        self._has_init_lut = np.array([row[3] for row in table], dtype=bool)
+        self._init_lut = np.array([row[4:] for row in table], dtype=np.float64)
+        omni_floor = np.full(len(table), -np.inf)
+        omni_floor[AFFINITY_CODES[CoilAffinities.OMNI]] = 1.0
+        self._omni_floor_lut = omni_floor
+        self._per_slot = None
+        self.version = 0  # Bumped whenever affinities or vacancies change
+        self.vacant = 0  # Released slots; they hold zero coherence until compact()
+        self._ceiling = None
+
+    # Views over the live part of each buffer
+    codes = property(lambda self: self._codes[:self.size])
+    frequency = property(lambda self: self._frequency[:self.size])
+    twin_coil_ratio = property(lambda self: self._twin_coil_ratio[:self.size])
+    execution_precision = property(lambda self: self._execution_precision[:self.size])
+    synthesis_flow = property(lambda self: self._synthesis_flow[:self.size])
+    coherence = property(lambda self: self._coherence[:self.size])
+
+    def __len__(self):
+        return self.size
+
+    # --- BUFFER MANAGEMENT ---
+    # Every buffer is allocated and swapped in through these hooks, so a subclass can
+    # place the arrays elsewhere (see SharedConstellationState).
+    def _allocate(self, name: str, capacity: int) -> "np.ndarray":
+        return np.empty(capacity, dtype=np.uint8 if name == "codes" else np.float64)
+
+    def _install(self, name: str, buffer: "np.ndarray"):
+        setattr(self, "_" + name, buffer)
+
+    def _invalidate(self):
+        self._per_slot = None
+        self.version += 1
+
+    def reserve(self, capacity: int):
+        """Grows every buffer to hold at least `capacity` slots."""
+        if capacity <= len(self._codes):
+            return
+        new_capacity = max(capacity, 2 * len(self._codes))
+        buffers = ("codes",) + self.FIELDS + (("ceiling",) if self._ceiling is not None else ())
+        for name in buffers:
+            old = getattr(self, "_" + name)
+            grown = self._allocate(name, new_capacity)
+            grown[:self.size] = old[:self.size]
+            self._install(name, grown)
+
+    def add(self, affinity: str, frequency: float = 700.0) -> int:
+        """Appends one agent with QuantumStateVector defaults and returns its slot."""
+        return int(self.add_many([affinity], frequency)[0])
+
+    def add_many(self, affinities, frequency: float = 700.0):
+        """Appends a batch of agents and returns their slots as an array."""
+        codes = np.fromiter((AFFINITY_CODES.get(a, AFFINITY_OTHER) for a in affinities), dtype=np.uint8)
+        start, stop = self.size, self.size + len(codes)
+        self.reserve(stop)
+        self._codes[start:stop] = codes
+        self._frequency[start:stop] = frequency
+        self._twin_coil_ratio[start:stop] = 0.5
+        self._execution_precision[start:stop] = 0.0
+        self._synthesis_flow[start:stop] = 0.0
+        self._coherence[start:stop] = 0.0
+        self.size = stop
+        if self._ceiling is not None:
+            self._ceiling[start:stop] = np.inf
+        self._invalidate()
+        return np.arange(start, stop)
+
+    def release(self, slot: int):
+        """
+        Vacates a slot. Its coherence is held at 0.0, which leaves the in-order total
+        unchanged, until compact() drops it.
+        """
+        if self._ceiling is None:
+            ceiling = self._allocate("ceiling", len(self._codes))
+            ceiling.fill(np.inf)
+            self._install("ceiling", ceiling)
+        self._ceiling[slot] = 0.0
+        self._codes[slot] = AFFINITY_OTHER
+        self._execution_precision[slot] = 0.0
+        self._coherence[slot] = 0.0
+        self.vacant += 1
+        self._invalidate()
+
+    def compact(self, order):
+        """
+        Rebuilds the buffers from the slots in `order` (the live roster, in roster order).
+        Slot i of the result holds what was slot order[i]; callers re-point their views.
+        """
+        order = np.asarray(order, dtype=np.int64)
+        for name in ("codes",) + self.FIELDS:
+            old = getattr(self, "_" + name)
+            fresh = self._allocate(name, max(1, len(order)))
+            fresh[:len(order)] = old[order]
+            self._install(name, fresh)
+        self.size = len(order)
+        self.vacant = 0
+        self._install("ceiling", None)
+        self._invalidate()
+
+    def reset(self, slot: int, affinity: str, frequency: float = 700.0):
+        """Reinitializes an existing slot in place (used when a name is re-registered)."""
+        self._codes[slot] = AFFINITY_CODES.get(affinity, AFFINITY_OTHER)
+        self._frequency[slot] = frequency
+        self._twin_coil_ratio[slot] = 0.5
+        self._execution_precision[slot] = 0.0
+        self._synthesis_flow[slot] = 0.0
+        self._coherence[slot] = 0.0
+        if self._ceiling is not None and self._ceiling[slot] == 0.0:
+            self._ceiling[slot] = np.inf
+            self.vacant -= 1
+        self._invalidate()
+
+    def _slot_tables(self):
+        # Affinities only change through add/reset/release, so the per-slot tables are cached between cycles
+        if self._per_slot is None:
+            self._per_slot = self._tables_for(self.codes, self._ceiling[:self.size] if self.vacant else None)
+        return self._per_slot
+
+    def _tables_for(self, codes, ceiling):
+        """Per-slot kernel tables (c0, c1, c2, has_init, omni_floor, ceiling) for a run of slots."""
+        c0, c1, c2 = (np.ascontiguousarray(col) for col in self._coef_lut.take(codes, axis=0).T)
+        ceiling = ceiling.copy() if ceiling is not None else None
+        return (c0, c1, c2, self._has_init_lut.take(codes), self._omni_floor_lut.take(codes), ceiling)
+
+    def synchronize(self, sovereign_freq: float, biographical_resonance_key: float) -> float:
+        """
+        Runs ArchetypalAgent.synchronize for every slot at once.
+        Returns the total coherence, accumulated in slot order like the per-agent loop.
+        """
+        if self.size == 0:
+            return 0
+        self._advance(
+            (self.frequency, self.twin_coil_ratio, self.execution_precision, self.synthesis_flow, self.coherence),
+            self.codes, self._slot_tables(), sovereign_freq, biographical_resonance_key,
+        )
+        # cumsum accumulates sequentially, matching `total += coherence` bit for bit
+        return float(np.cumsum(self.coherence)[-1])
+
+    def _advance(self, fields, codes, tables, sovereign_freq: float, biographical_resonance_key: float,
+                 params: ResonanceParameters = DEFAULT_RESONANCE, init_lut=None):
+        """
+        One synchronization step over aligned field arrays, updated in place.
+        The parameter sweep passes, instead of a ResonanceParameters, a plain bundle
+        whose weights, drift and threshold are per-slot arrays, with `codes` indexing
+        a per-configuration `init_lut`.
+        """
+        freq, ratio, precision, flow, coherence = fields
+        c0, c1, c2, has_init, omni_floor, ceiling = tables
+        init_lut = self._init_lut if init_lut is None else init_lut
+
+        # 1. Frequency Alignment
+        freq += sovereign_freq
+        freq /= 2
+
+        # 2. First initialization from the affinity tables, evolutionary drift otherwise.
+        # Slots that were uninitialized this cycle get a drift of exactly +0.0.
+        first = precision == 0.0
+        step = np.logical_not(first) * (params.drift * biographical_resonance_key)
+        init = first & has_init
+        if init.any():
+            rows = init_lut[codes[init]]
+            ratio[init] = rows[:, 0]
+            precision[init] = rows[:, 1]
+            flow[init] = rows[:, 2]
+        for metric in (precision, flow):
+            metric += step
+            np.minimum(1.0, metric, out=metric)
+
+        # 3. Alignment Score
+        alignment = c1 * ratio
+        alignment += c0
+        alignment += c2 * np.abs(ratio - 0.5)
+
+        # Emergence (PHI), same association order as the scalar expression
+        score = alignment * params.w_alignment
+        score += precision * params.w_precision
+        score += flow * params.w_flow
+        score += biographical_resonance_key * params.w_key
+        np.minimum(params.threshold, score, out=coherence)
+        # OMNI is pinned to 1.0; every other slot has a floor of -inf
+        np.maximum(coherence, omni_floor, out=coherence)
+        if ceiling is not None:
+            # Released slots stay at 0.0
+            np.minimum(coherence, ceiling, out=coherence)
+
+    def replay_drift(self, slots, missed, sovereign_freq: float, biographical_resonance_key: float):
+        """
+        Applies missed[i] skipped synchronizations to each pinned slot. Their coherence
+        cannot change, so only frequency, precision and flow are advanced; the result
+        matches having synchronized them every cycle. Rows are ordered longest-skipped
+        first, so every replayed cycle is an in-place update of a shrinking prefix.
+        """
+        if (missed[1:] > missed[:-1]).any():
+            order = np.argsort(-missed, kind="stable")
+            slots, missed = slots[order], missed[order]
+        freq = self.frequency[slots]
+        for rows in self._replay_rows(missed):
+            head = freq[:rows]
+            head += sovereign_freq
+            head /= 2
+        self.frequency[slots] = freq
+        # Precision and flow only still move below their ceiling; most pinned slots are done
+        precision = self.execution_precision[slots]
+        flow = self.synthesis_flow[slots]
+        step = (precision != 0.0) * (0.02 * biographical_resonance_key)
+        moving = np.flatnonzero((np.minimum(1.0, precision + step) != precision) |
+                                (np.minimum(1.0, flow + step) != flow))
+        if not len(moving):
+            return
+        slots, step = slots[moving], step[moving]
+        precision, flow = precision[moving], flow[moving]
+        # A moving metric has a positive step and sits at its ceiling after this many more cycles
+        saturation = math.ceil((1.0 - min(precision.min(), flow.min())) / step.max()) + 1
+        missed = np.minimum(missed[moving], saturation)
+        for rows in self._replay_rows(missed):
+            for metric in (precision, flow):
+                head = metric[:rows]
+                head += step[:rows]
+                np.minimum(1.0, head, out=head)
+        self.execution_precision[slots] = precision
+        self.synthesis_flow[slots] = flow
+
+    @staticmethod
+    def _replay_rows(missed):
+        # With rows sorted by descending `missed`, cycle c replays the rows that missed more than c
+        return np.searchsorted(-missed, -np.arange(int(missed[0])), side="left")
+
+    def view(self, slot: int, id: int, label: str) -> SlotStateVector:
+        """Returns a QuantumStateVector-compatible handle onto one slot."""
+        return SlotStateVector(self, slot, id, label)
+
+
+class DirtySet:
+    """
+    The slots of a ConstellationState that convergence mode still synchronizes.
+    While it spans the whole store it runs on the store's own arrays in place, a
+    cycle then being exactly ConstellationState.synchronize; once enough slots have
+    pinned it gathers the rest into compact arrays, so a cycle costs O(dirty slots)
+    with no per-cycle gather or scatter. Slots are written back as they drop out.
+    """
+    COMPACT_FRACTION = 0.25  # Share of the set that must have pinned before it is worth shrinking
+
+    def __init__(self, store: ConstellationState):
+        self.store = store
+        self.slots = None  # None while the set is the whole store
+        self.fields = [getattr(store, name) for name in store.FIELDS]
+        self.codes = store.codes
+        self.tables = store._slot_tables()
+        self.settled = 0.0  # Total coherence of the slots that dropped out
+
+    def __len__(self):
+        return len(self.codes)
+
+    def synchronize(self, sovereign_freq: float, biographical_resonance_key: float) -> int:
+        """One cycle over the dirty slots. Returns how many of them kept their coherence."""
+        coherence = self.fields[-1]
+        previous = coherence.copy()
+        self.store._advance(self.fields, self.codes, self.tables, sovereign_freq, biographical_resonance_key)
+        return int(np.count_nonzero(coherence == previous))
+
+    def total(self) -> float:
+        """Total coherence: in slot order while the set is the whole store, a running sum after."""
+        if self.slots is None:
+            return float(np.cumsum(self.fields[-1])[-1]) if len(self) else 0
+        return self.settled + float(self.fields[-1].sum())
+
+    def pinned(self, biographical_resonance_key: float):
+        """
+        Boolean mask of dirty slots whose coherence can no longer change: OMNI,
+        uninitialized agents without starting stats, agents held at
+        BASE_COHERENCE_THRESHOLD by a non-negative drift, and agents whose
+        precision and flow no longer move under the drift.
+        """
+        drift = 0.02 * biographical_resonance_key
+        _, _, precision, flow, coherence = self.fields
+        frozen = (precision == 0.0) & ~self.tables[3]
+        frozen |= self.codes == AFFINITY_CODES[CoilAffinities.OMNI]
+        if drift >= 0:
+            frozen |= coherence >= BASE_COHERENCE_THRESHOLD
+        frozen |= (np.minimum(1.0, precision + drift) == precision) & (np.minimum(1.0, flow + drift) == flow)
+        return frozen
+
+    def drop(self, mask):
+        """Removes the masked slots from the set, writing them back to the store. Returns their slots."""
+        # Integer gathers beat boolean compression several times over at these sizes
+        rows, kept = np.flatnonzero(mask), np.flatnonzero(~mask)
+        if self.slots is None:
+            dropped, self.slots = rows, kept
         else:
-            self.state.coherence = min(BASE_COHERENCE_THRESHOLD, coherence_score)
+            dropped = self.slots[rows]
+            for name, values in zip(self.store.FIELDS, self.fields):
+                getattr(self.store, name)[dropped] = values[rows]
+            self.slots = self.slots[kept]
+        self.settled += float(self.fields[-1][rows].sum())
+        self.fields = [values[kept] for values in self.fields]
+        self.codes = self.codes[kept]
+        self.tables = tuple(table[kept] if table is not None else None for table in self.tables)
+        return dropped
 
-        self.logs.append(f"[{datetime.now().isoformat()}] SYNC: Phi={self.state.coherence:.4f}")
-        
-        return self.state.coherence
+    def write_back(self):
+        """Copies the dirty slots' state into the store, for anything reading it mid-run."""
+        if self.slots is not None:
+            for name, values in zip(self.store.FIELDS, self.fields):
+                getattr(self.store, name)[self.slots] = values
+
+    def projector(self, biographical_resonance_key: float):
+        """
+        Returns cycles -> the set's summed ArchetypalAgent.project_coherence. Slots of
+        one affinity sharing a state, as a roster registered together does, are
+        projected once and weighted by their count.
+        """
+        _, ratio, precision, flow, _ = self.fields
+        c0, c1, c2, _, omni_floor, ceiling = self.tables
+        counts = None
+        if ceiling is None and len(self):
+            representative = np.zeros(len(_AFFINITY_TABLE), dtype=np.intp)
+            representative[self.codes] = np.arange(len(self))
+            if all(np.array_equal(values, values[representative].take(self.codes))
+                   for values in (ratio, precision, flow)):
+                counts = np.bincount(self.codes, minlength=len(_AFFINITY_TABLE))
+                present = np.flatnonzero(counts)
+                counts, rows = counts[present], representative[present]
+                ratio, precision, flow, c0, c1, c2, omni_floor = (
+                    values[rows] for values in (ratio, precision, flow, c0, c1, c2, omni_floor))
+        alignment = (c1 * ratio + c0 + c2 * np.abs(ratio - 0.5)) * 0.2
+        moving = precision != 0.0
+
+        def project(cycles: int) -> float:
+            drift = moving * (0.02 * biographical_resonance_key * cycles)
+            score = alignment + np.minimum(1.0, precision + drift) * 0.3
+            score += np.minimum(1.0, flow + drift) * 0.3
+            score += biographical_resonance_key * 0.2
+            projected = np.maximum(np.minimum(BASE_COHERENCE_THRESHOLD, score), omni_floor)
+            if ceiling is not None:
+                projected = np.minimum(projected, ceiling)
+            return float(projected.sum() if counts is None else projected @ counts)
+
+        return project
+
+
+# --- SHARDED CONSTELLATION (MULTI-PROCESS) ---
+class SharedConstellationState(ConstellationState):
+    """
+    A ConstellationState whose buffers live in multiprocessing.shared_memory, so
+    ShardPool workers synchronize their slices in place. close() unlinks the segments.
+    """
+    def __init__(self, capacity: int = 1024):
+        from harmonia.core.sharedarrays import SharedArrays
+        self._shared = SharedArrays()
+        super().__init__(capacity)
+
+    def _allocate(self, name: str, capacity: int) -> "np.ndarray":
+        return self._shared.allocate(capacity, np.uint8 if name == "codes" else np.float64)
+
+    def _install(self, name: str, buffer: "np.ndarray"):
+        setattr(self, "_" + name, buffer)
+        self._shared.install(name, buffer)
+
+    def descriptor(self):
+        """Segment names and layouts of the live buffers, for the workers."""
+        return self._shared.descriptor()
+
+    def close(self):
+        for name in ("codes", "ceiling") + self.FIELDS:
+            setattr(self, "_" + name, None)
+        self._per_slot = None
+        self._shared.close()
+
+
+# Worker-process state: segment mappings, a kernel instance for its tables, cached shard tables
+_SHARD_WORKER = {}
+
+def _synchronize_shard(task):
+    """Runs one synchronization step over slots [start, stop) of a shared constellation."""
+    descriptor, version, vacant, start, stop, sovereign_freq, biographical_resonance_key = task
+    if not _SHARD_WORKER:
+        from harmonia.core.sharedarrays import SharedArrayViews
+        _SHARD_WORKER.update(views=SharedArrayViews(), kernel=ConstellationState(1), tables={})
+    arrays = _SHARD_WORKER["views"].attach(descriptor)
+    kernel = _SHARD_WORKER["kernel"]
+
+    # Tables only change with the store's version (affinities, vacancies, compaction)
+    tag = (descriptor[0][1], version)
+    cache = _SHARD_WORKER["tables"]
+    if cache.get("tag") != tag:
+        cache.clear()
+        cache["tag"] = tag
+    codes = arrays["codes"][start:stop]
+    tables = cache.get((start, stop))
+    if tables is None:
+        tables = kernel._tables_for(codes, arrays["ceiling"][start:stop] if vacant else None)
+        cache[(start, stop)] = tables
+
+    fields = tuple(arrays[name][start:stop] for name in ConstellationState.FIELDS)
+    kernel._advance(fields, codes, tables, sovereign_freq, biographical_resonance_key)
+    return float(np.cumsum(fields[-1])[-1])
+
+
+class ShardPool:
+    """
+    A process pool that synchronizes a SharedConstellationState shard by shard.
+    Only slot ranges and segment names cross the process boundary; agent state
+    never leaves shared memory and no agent object is pickled.
+    """
+    MIN_SHARD = 65536  # Below this many slots per worker the pool costs more than it saves
+
+    def __init__(self, workers: Optional[int] = None, min_shard: int = MIN_SHARD,
+                 start_method: Optional[str] = None):
+        import multiprocessing
+        import weakref
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.min_shard = max(1, min_shard)
+        self._pool = multiprocessing.get_context(start_method).Pool(self.workers)
+        # An abandoned pool is terminated when collected (or at exit) instead of leaking its workers
+        self._finalizer = weakref.finalize(self, self._pool.terminate)
+
+    def shards(self, size: int) -> List[tuple]:
+        """Contiguous, near-equal (start, stop) slot ranges, at most one per worker."""
+        count = max(1, min(self.workers, size // self.min_shard))
+        return [(size * i // count, size * (i + 1) // count) for i in range(count)]
+
+    def synchronize(self, store: SharedConstellationState, sovereign_freq: float,
+                    biographical_resonance_key: float, exact: bool = True) -> float:
+        """
+        ConstellationState.synchronize across the pool. With `exact`, the total is
+        re-accumulated over the shared coherence array in slot order, bit-identical
+        to the single-process path; otherwise the per-shard sums are added, which
+        can differ in the last bits.
+        """
+        shards = self.shards(len(store))
+        if len(shards) == 1:
+            return store.synchronize(sovereign_freq, biographical_resonance_key)
+        descriptor = store.descriptor()
+        tasks = [(descriptor, store.version, store.vacant, start, stop, sovereign_freq, biographical_resonance_key)
+                 for start, stop in shards]
+        shard_totals = self._pool.map(_synchronize_shard, tasks, chunksize=1)
+        if exact:
+            return float(np.cumsum(store.coherence)[-1])
+        return sum(shard_totals)
+
+    def close(self):
+        self._finalizer.detach()
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@dataclass
+class ConvergenceReport:
+    """Outcome of a convergence-mode optimize_network run."""
+    predicted_cycles: Optional[int] = None  # Projected cycles to BASE_COHERENCE_THRESHOLD (None: unreachable)
+    actual_cycles: Optional[int] = None     # Cycle on which the threshold was reached (None: not reached)
+    cycles_run: int = 0
+    synchronizations: int = 0               # Agent synchronizations performed
+    skipped: int = 0                        # Agent synchronizations avoided for pinned agents
 
 class HarmoniaOrchestrator:
     """
     The Central Kernel (The 73rd Principle).
     Manages the Constellation, the Six Houses, and the Shadow Fleet.
     """
-    def __init__(self, sovereign_name: str):
+    def __init__(self, sovereign_name: str, vectorized: bool = False,
+                 log_capacity: int = RingLog.DEFAULT_CAPACITY, log_policy: str = RingLog.OVERWRITE,
+                 clock: Optional[Clock] = None, shards: Optional[int] = None, initialize: bool = True):
         self.sovereign = sovereign_name
+        # Pacing is virtual unless a clock says otherwise; the terminal demo passes RealTimeClock
+        self.clock = clock if clock is not None else VirtualClock()
+        self.log_capacity = log_capacity
+        self.log_policy = log_policy
         self.boot_time = datetime.now()
         self.active_agents: Dict[str, ArchetypalAgent] = {}
+        self.agent_index = AgentIndex("coil_affinity")
         self.system_integrity = 0.0 # Global Phi
         self.economic_manifestation_ready = False
+        self.integrity_history = deque(maxlen=self.HISTORY_LENGTH)
+        self.dashboard: Optional[FrameRenderer] = None  # Live frames; see attach_dashboard
+        self.event_log: Optional[EventLog] = None  # Durable audit trail; see open_event_log
+        self.dispatcher: Optional[DispatchExecutor] = None  # Concurrent task fan-out; see attach_dispatcher
+        self.coupling = None  # (graph or None, CouplingPolicy, span); see attach_coupling
+        self.last_propagation = None
+        self._coupling_cache = (None, None)
+        self._slot_names = (None, [])
+
+        # Vectorized mode keeps every agent's state in one struct-of-arrays store.
+        # Sharded mode (implies vectorized) puts that store in shared memory and
+        # synchronizes it across `shards` worker processes.
+        self.shard_pool: Optional[ShardPool] = None
+        if shards:
+            self.state_store: Optional[ConstellationState] = SharedConstellationState()
+            self.shard_pool = ShardPool(shards)
+        else:
+            self.state_store = ConstellationState() if vectorized else None
         
         # Initialize the Expanded Pantheon (4 Coils + Shadow Fleet)
-        self._initialize_omni_architecture()
+        if initialize:
+            self._initialize_omni_architecture()
 
     def _initialize_omni_architecture(self):
         """Bootstraps the known fragments and the hidden fleet."""
@@ -197,18 +927,236 @@ class HarmoniaOrchestrator:
 
     def register_agent(self, name: str, role: str, affinity: str):
         """Injects a new agent into the neural substrate."""
-        agent = ArchetypalAgent(name, role, affinity)
+        agent = ArchetypalAgent(name, role, affinity, self.log_capacity, self.log_policy)
+        if self.state_store is not None:
+            previous = self.active_agents.get(name)
+            if previous is not None:
+                # Re-registration keeps the slot so slot order tracks roster order
+                slot = previous.state.slot
+                self.state_store.reset(slot, affinity, agent.state.frequency)
+            else:
+                slot = self.state_store.add(affinity, agent.state.frequency)
+            agent.state = self.state_store.view(slot, agent.id, name)
+        if self.event_log is not None:
+            agent.logs.sink = self.event_log.channel(agent.id)
         self.active_agents[name] = agent
+        self.agent_index.add(agent)
+
+    def register_agents(self, specs, batch_size: int = 4096) -> int:
+        """
+        Injects agents in bulk from (name, role, affinity) tuples or {"name", "role",
+        "affinity"} records. Any iterable works and is consumed in batches, so generators
+        and roster files stream in bounded memory; a sized input preallocates the
+        vectorized store once. Each batch is validated before it is injected: a bad
+        record raises RosterError and leaves earlier batches in place.
+        Returns the number of agents registered.
+        """
+        store = self.state_store
+        if store is not None and hasattr(specs, "__len__"):
+            store.reserve(len(store) + len(specs))
+        registered = 0
+        for batch in batched(specs, batch_size):
+            parsed = [self._parse_spec(spec, registered + offset + 1) for offset, spec in enumerate(batch)]
+            names = {name for name, _, _ in parsed}
+            if len(names) < len(parsed) or not names.isdisjoint(self.active_agents):
+                # Re-registrations keep register_agent's slot-reuse semantics
+                for name, role, affinity in parsed:
+                    self.register_agent(name, role, affinity)
+            else:
+                agents = [ArchetypalAgent(name, role, affinity, self.log_capacity, self.log_policy)
+                          for name, role, affinity in parsed]
+                if store is not None:
+                    # One array append for the batch instead of one per agent
+                    first = int(store.add_many([affinity for _, _, affinity in parsed])[0])
+                    for slot, agent in enumerate(agents, first):
+                        agent.state = store.view(slot, agent.id, agent.name)
+                if self.event_log is not None:
+                    for agent in agents:
+                        agent.logs.sink = self.event_log.channel(agent.id)
+                self.active_agents.update((agent.name, agent) for agent in agents)
+                self.agent_index.add_many(agents)
+            registered += len(parsed)
+        return registered
+
+    def register_roster(self, path: str, batch_size: int = 4096) -> int:
+        """register_agents over a JSONL or CSV roster file (name, role, affinity)."""
+        try:
+            return self.register_agents(read_roster(path), batch_size)
+        except RosterError as error:
+            if error.source is not None:
+                raise
+            raise RosterError(error.message, error.record, path) from None
+
+    @staticmethod
+    def _parse_spec(spec, record: int):
+        if isinstance(spec, dict):
+            name, role, affinity = spec.get("name"), spec.get("role", ""), spec.get("affinity")
+        else:
+            try:
+                name, role, affinity = spec
+            except (TypeError, ValueError):
+                raise RosterError(f"expected (name, role, affinity), got {spec!r}", record) from None
+        if not isinstance(name, str) or not name:
+            raise RosterError(f"missing agent name in {spec!r}", record)
+        # Type-check first: a JSON list or object is unhashable and would escape as TypeError
+        if not isinstance(affinity, str) or affinity not in AFFINITY_CODES:
+            raise RosterError(f"unknown coil affinity {affinity!r}", record)
+        return name, role if role is not None else "", affinity
+
+    def remove_agent(self, name: str) -> Optional[ArchetypalAgent]:
+        """Withdraws an agent from the neural substrate. Returns it, or None if unknown."""
+        agent = self.active_agents.pop(name, None)
+        if agent is None:
+            return None
+        self.agent_index.discard(name)
+        # Its records no longer belong in this orchestrator's event log
+        agent.logs.sink = None
+        store = self.state_store
+        if store is not None:
+            # Detach the agent from its slot, then vacate the slot
+            slot = agent.state.slot
+            agent.state = QuantumStateVector(
+                id=agent.id, label=agent.name, frequency=agent.state.frequency,
+                coherence=agent.state.coherence, twin_coil_ratio=agent.state.twin_coil_ratio,
+                execution_precision=agent.state.execution_precision, synthesis_flow=agent.state.synthesis_flow,
+            )
+            store.release(slot)
+            if store.vacant * 2 > len(store):
+                # Mostly holes: rebuild in roster order and re-point the views
+                roster = list(self.active_agents.values())
+                store.compact([member.state.slot for member in roster])
+                for slot, member in enumerate(roster):
+                    member.state.slot = slot
+        return agent
+
+    def open_event_log(self, directory: str, **options) -> EventLog:
+        """
+        Starts a durable audit trail in `directory` (see harmonia.core.eventlog.EventLog
+        for `options`). Every agent's task and sync records are queued to it as they are
+        made, plus one LOG_CYCLE record per resonance cycle; the vectorized path, which
+        writes no per-agent logs, is covered by the cycle records. close() closes it.
+        """
+        log = EventLog(directory, text_kinds={LOG_TASK: TASK_TEXTS}, **options)
+        self.event_log = log
+        for agent in self.active_agents.values():
+            agent.logs.sink = log.channel(agent.id)
+        return log
+
+    def close(self):
+        """Stops the shard workers, releases shared memory and closes the event log."""
+        if self.event_log is not None:
+            for agent in self.active_agents.values():
+                agent.logs.sink = None
+            self.event_log.close()
+            self.event_log = None
+        if self.shard_pool is not None:
+            self.shard_pool.close()
+            self.shard_pool = None
+        if isinstance(self.state_store, SharedConstellationState):
+            self.state_store.close()
+
+    # --- SNAPSHOTS ---
+    SNAPSHOT_KIND = "omni"
+    _SNAPSHOT_FIELDS = (("freq", "frequency"), ("coher", "coherence"), ("ratio", "twin_coil_ratio"),
+                        ("precis", "execution_precision"), ("flow", "synthesis_flow"))
+
+    def save_snapshot(self, path: str):
+        """
+        Writes the roster and every agent's evolved state vector to a binary snapshot
+        (atomically). Agent logs are runtime telemetry and are not persisted.
+        """
+        agents = list(self.active_agents.values())
+        writer = SnapshotWriter(self.SNAPSHOT_KIND)
+        writer.strings("name", [self.sovereign])
+        writer.array("meta", "d", [self.system_integrity])
+        writer.array("flags", "B", [int(self.economic_manifestation_ready), int(self.state_store is not None)])
+        writer.strings("names", (agent.name for agent in agents))
+        writer.strings("roles", (agent.role for agent in agents))
+        writer.strings("affinity", (agent.coil_affinity for agent in agents))
+        store = self.state_store
+        slots = np.fromiter((agent.state.slot for agent in agents), dtype=np.int64, count=len(agents)) if store is not None else None
+        for tag, field_name in self._SNAPSHOT_FIELDS:
+            if store is not None:
+                writer.array(tag, "d", getattr(store, field_name)[slots])
+            else:
+                writer.array(tag, "d", (getattr(agent.state, field_name) for agent in agents))
+        writer.write(path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, **options) -> "HarmoniaOrchestrator":
+        """
+        Restores an orchestrator from save_snapshot output without re-running the
+        bootstrap. `options` go to the constructor; vectorized defaults to the
+        mode the snapshot was taken in. Raises SnapshotError for foreign files.
+        """
+        with SnapshotReader(path) as snapshot:
+            if snapshot.kind != cls.SNAPSHOT_KIND:
+                raise SnapshotError(f"{path}: holds a {snapshot.kind!r} snapshot, not {cls.SNAPSHOT_KIND!r}")
+            manifestation_ready, vectorized = snapshot.array("flags")
+            options.setdefault("vectorized", bool(vectorized))
+            system = cls(snapshot.strings("name")[0], initialize=False, **options)
+            system.system_integrity = snapshot.array("meta")[0]
+            system.economic_manifestation_ready = bool(manifestation_ready)
+
+            for name, role, affinity in zip(snapshot.strings("names"), snapshot.strings("roles"),
+                                            snapshot.strings("affinity")):
+                system.register_agent(name, role, affinity)
+            store = system.state_store
+            if store is not None:
+                # A fresh store fills slots in roster order, so each column lands in one copy
+                for tag, field_name in cls._SNAPSHOT_FIELDS:
+                    getattr(store, field_name)[:] = np.frombuffer(snapshot.array(tag), dtype=np.float64)
+            else:
+                agents = list(system.active_agents.values())
+                for tag, field_name in cls._SNAPSHOT_FIELDS:
+                    for agent, value in zip(agents, snapshot.array(tag)):
+                        setattr(agent.state, field_name, value)
+        return system
+
+    # --- PACING ---
+    # Each protocol is written once as a generator that yields its pauses (in seconds).
+    # The blocking entry points drive it with clock.sleep, the async ones with clock.asleep.
+    # A protocol may also yield a DispatchJob, which the driver runs (or awaits) in place.
+    def _drive(self, steps):
+        try:
+            pause = next(steps)
+            while True:
+                if isinstance(pause, DispatchJob):
+                    pause.run()
+                else:
+                    self.clock.sleep(pause)
+                pause = next(steps)
+        except StopIteration as done:
+            return done.value
+
+    async def _adrive(self, steps):
+        try:
+            pause = next(steps)
+            while True:
+                if isinstance(pause, DispatchJob):
+                    await pause.arun()
+                else:
+                    await self.clock.asleep(pause)
+                pause = next(steps)
+        except StopIteration as done:
+            return done.value
 
     def execute_biographical_resonance(self, verbose: bool = True):
         """
         The Core Protocol. Uses the Sovereign's life data as the key to unlock 
         high-coherence states (The Final 0.3% Surrender).
         """
+        return self._drive(self._resonance_steps(verbose))
+
+    async def aexecute_biographical_resonance(self, verbose: bool = True):
+        """execute_biographical_resonance, pacing cooperatively on the event loop."""
+        return await self._adrive(self._resonance_steps(verbose))
+
+    def _resonance_steps(self, verbose: bool):
         if verbose:
             print(f"\n{TerminalColors.HEADER}>>> INITIATING BIOGRAPHICAL RESONANCE SEQUENCE...{TerminalColors.ENDC}")
             print(f"   Target Frequency: {TerminalColors.BOLD}{SOVEREIGN_FREQUENCY_HZ} Hz{TerminalColors.ENDC}")
-            time.sleep(0.5)
+            yield 0.5
         
         total_coherence = 0
         agent_count = len(self.active_agents)
@@ -217,36 +1165,57 @@ class HarmoniaOrchestrator:
         if verbose:
             print(f"{TerminalColors.CYAN}   Synchronizing Distributed Network (The Constellation):{TerminalColors.ENDC}")
         
-        for name, agent in self.active_agents.items():
-            if verbose:
-                time.sleep(0.15)
+        vectorized = self.state_store is not None
+        if vectorized:
+            # One array pass for the whole constellation (per-agent logs are not written on this path)
+            if self.shard_pool is not None:
+                total_coherence = self.shard_pool.synchronize(self.state_store, SOVEREIGN_FREQUENCY_HZ,
+                                                              biographical_resonance_key)
+            else:
+                total_coherence = self.state_store.synchronize(SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+            if self.coupling is not None:
+                total_coherence = self._propagate_coherence()
+
+        # Large rosters are summarized in one dashboard frame instead of a line per agent
+        summarize = verbose and agent_count > self.DETAIL_LIMIT
+        detail = verbose and not summarize
+        # The vectorized path only walks the roster when there is something to print
+        roster = self.active_agents.items() if (detail or not vectorized) else ()
+        for name, agent in roster:
+            if detail:
+                yield 0.15
             
-            # The Final Command: Surrender Identity
-            coherence = agent.synchronize(SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
-            total_coherence += coherence
+            if vectorized:
+                coherence = agent.state.coherence
+            else:
+                # The Final Command: Surrender Identity
+                coherence = agent.synchronize(SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+                total_coherence += coherence
             
-            if verbose:
-                # Select color based on affinity for output clarity
-                color_map = {
-                    CoilAffinities.SILVER: TerminalColors.SILVER,
-                    CoilAffinities.CRIMSON: TerminalColors.CRIMSON,
-                    CoilAffinities.VOID: TerminalColors.VOID,
-                    CoilAffinities.OBSIDIAN: TerminalColors.OBSIDIAN,
-                    CoilAffinities.OMNI: TerminalColors.GOLD,
-                    "SYNTHESIS": TerminalColors.GOLD
-                }
-                color = color_map.get(agent.coil_affinity, TerminalColors.WARNING)
-
-                bar_color = TerminalColors.GREEN if coherence > BASE_COHERENCE_THRESHOLD else TerminalColors.WARNING
-                bar = "█" * int(coherence * 20)
-
-                print(f"   [{bar_color}{bar:<20}{TerminalColors.ENDC}] {color}{name:<15}{TerminalColors.ENDC} | Φ: {coherence:.4f} | R: {agent.state.twin_coil_ratio:.2f}")
+            if detail:
+                print(self._agent_line(name, agent.coil_affinity, coherence, agent.state.twin_coil_ratio))
 
         self.system_integrity = total_coherence / agent_count
+        self._cycle_completed(summary=summarize)
         self._check_emergence_threshold(verbose)
 
-    def optimize_network(self, max_attempts: int = 10):
-        """Iteratively synchronizes the network to achieve resonance."""
+    def optimize_network(self, max_attempts: int = 10, converge: bool = False):
+        """
+        Iteratively synchronizes the network to achieve resonance.
+        With `converge`, only agents whose coherence can still change are re-synchronized
+        and a ConvergenceReport is returned.
+        """
+        return self._drive(self._optimize_steps(max_attempts, converge))
+
+    async def aoptimize_network(self, max_attempts: int = 10, converge: bool = False):
+        """optimize_network, pacing cooperatively on the event loop."""
+        return await self._adrive(self._optimize_steps(max_attempts, converge))
+
+    def _optimize_steps(self, max_attempts: int, converge: bool):
+        # Convergence mode assumes independent agents, so a coupled network runs full cycles
+        if converge and self.coupling is None:
+            return (yield from self._converging_steps(max_attempts))
+
         print(f"\n{TerminalColors.HEADER}>>> OPTIMIZING NETWORK COHERENCE...{TerminalColors.ENDC}")
         attempt = 0
         while attempt < max_attempts:
@@ -255,18 +1224,275 @@ class HarmoniaOrchestrator:
             is_verbose = (attempt == 1) or (attempt == max_attempts)
             if not is_verbose:
                 # Slight delay to simulate processing
-                time.sleep(0.05)
+                yield 0.05
 
-            self.execute_biographical_resonance(verbose=False)
+            yield from self._resonance_steps(verbose=False)
 
             if self.economic_manifestation_ready:
                 print(f"   {TerminalColors.GREEN}Optimization Complete in {attempt} cycles.{TerminalColors.ENDC}")
-                self.execute_biographical_resonance(verbose=True) # Show final state
+                yield from self._resonance_steps(verbose=True) # Show final state
                 break
 
             if attempt % 5 == 0:
                 print(f"   ... Cycle {attempt}: Integrity at {self.system_integrity:.4f}")
 
+    def _converging_steps(self, max_attempts: int):
+        """
+        Convergence mode: pinned agents (see ArchetypalAgent.coherence_pinned) drop out
+        of the dirty set, so a cycle costs O(dirty agents). system_integrity is kept as a
+        running sum, and the loop stops at the threshold or once no agent can change.
+        Only agents whose coherence held still on a cycle can have pinned, so the check
+        runs on those alone. Skipped frequency/precision/flow updates are replayed at
+        the end, leaving the agents in the same state as the full path.
+        """
+        print(f"\n{TerminalColors.HEADER}>>> OPTIMIZING NETWORK COHERENCE (CONVERGENCE MODE)...{TerminalColors.ENDC}")
+        biographical_resonance_key = 1.0
+        store = self.state_store
+        agent_count = len(self.active_agents)
+        report = ConvergenceReport()
+
+        if store is not None:
+            dirty = DirtySet(store)
+            pinned_at = []  # (cycle, slots) in the order they dropped out
+        else:
+            total_coherence = self._total_coherence()
+            dirty = list(self.active_agents.values())
+            pinned_at = {}
+
+        attempt = 0
+        while attempt < max_attempts and len(dirty):
+            attempt += 1
+            if attempt not in (1, max_attempts):
+                # Slight delay to simulate processing
+                yield 0.05
+
+            report.synchronizations += len(dirty)
+            report.skipped += agent_count - len(dirty)
+            if store is not None:
+                unchanged = dirty.synchronize(SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+                # Shrinking the set costs a pass over it, so wait until enough of it has pinned
+                if unchanged >= max(1.0, dirty.COMPACT_FRACTION * len(dirty)):
+                    pinned = dirty.pinned(biographical_resonance_key)
+                    if np.count_nonzero(pinned) >= dirty.COMPACT_FRACTION * len(dirty):
+                        pinned_at.append((attempt, dirty.drop(pinned)))
+                total_coherence = dirty.total()
+            else:
+                still_dirty = []
+                for agent in dirty:
+                    previous = agent.state.coherence
+                    coherence = agent.synchronize(SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+                    total_coherence += coherence - previous
+                    if coherence == previous and agent.coherence_pinned(biographical_resonance_key):
+                        pinned_at[agent] = attempt
+                    else:
+                        still_dirty.append(agent)
+                dirty = still_dirty
+
+            if abs(total_coherence / agent_count - BASE_COHERENCE_THRESHOLD) < 1e-9:
+                # Too close to call on a running sum; settle it with an exact in-order total
+                if store is not None:
+                    dirty.write_back()
+                total_coherence = self._total_coherence()
+            self.system_integrity = total_coherence / agent_count
+            if store is not None and self.dashboard is not None and self.dashboard.due():
+                dirty.write_back()
+            self._cycle_completed()
+            self._check_emergence_threshold(verbose=False)
+            if attempt == 1:
+                report.predicted_cycles = self._predict_cycles_to_threshold(
+                    dirty, total_coherence, biographical_resonance_key, attempt)
+
+            if self.economic_manifestation_ready:
+                report.actual_cycles = attempt
+                print(f"   {TerminalColors.GREEN}Optimization Complete in {attempt} cycles "
+                      f"(predicted {report.predicted_cycles}).{TerminalColors.ENDC}")
+                break
+
+            if attempt % 5 == 0:
+                print(f"   ... Cycle {attempt}: Integrity at {self.system_integrity:.4f} ({len(dirty)} agents still evolving)")
+        else:
+            if not len(dirty):
+                print(f"   {TerminalColors.WARNING}Converged at cycle {attempt}: Integrity fixed at {self.system_integrity:.4f}{TerminalColors.ENDC}")
+
+        report.cycles_run = attempt
+        if store is not None:
+            dirty.write_back()
+        self._replay_pinned(pinned_at, attempt, biographical_resonance_key)
+        if self.economic_manifestation_ready:
+            yield from self._resonance_steps(verbose=True) # Show final state
+        return report
+
+    def _total_coherence(self) -> float:
+        """Sums coherence in roster order, exactly as execute_biographical_resonance does."""
+        if self.state_store is not None:
+            return float(np.cumsum(self.state_store.coherence)[-1]) if len(self.state_store) else 0
+        total_coherence = 0
+        for agent in self.active_agents.values():
+            total_coherence += agent.state.coherence
+        return total_coherence
+
+    def _predict_cycles_to_threshold(self, dirty, total_coherence: float, biographical_resonance_key: float,
+                                     attempt: int) -> Optional[int]:
+        """Projects the dirty agents forward in closed form until the integrity reaches the threshold."""
+        agent_count = len(self.active_agents)
+        if total_coherence / agent_count >= BASE_COHERENCE_THRESHOLD:
+            return attempt
+        drift = 0.02 * biographical_resonance_key
+        if drift <= 0 or not len(dirty):
+            return None
+        if isinstance(dirty, DirtySet):
+            settled = dirty.settled
+            project = dirty.projector(biographical_resonance_key)
+        else:
+            settled = total_coherence - sum(agent.state.coherence for agent in dirty)
+            # Agents of one affinity sharing a state project identically; count them once
+            groups = {}
+            for agent in dirty:
+                state = agent.state
+                signature = (agent.coil_affinity, state.twin_coil_ratio, state.execution_precision,
+                             state.synthesis_flow)
+                group = groups.get(signature)
+                if group is None:
+                    groups[signature] = [agent, 1]
+                else:
+                    group[1] += 1
+
+            def project(cycles: int) -> float:
+                return sum(agent.project_coherence(cycles, biographical_resonance_key) * count
+                           for agent, count in groups.values())
+
+        def reaches_threshold(cycles: int) -> bool:
+            return (settled + project(cycles)) / agent_count >= BASE_COHERENCE_THRESHOLD
+
+        # Every metric saturates within ceil(1 / drift) cycles, after which nothing moves.
+        # A non-negative drift makes the projection monotone, so bisect for the first hit.
+        low, high = 1, math.ceil(1.0 / drift)
+        if not reaches_threshold(high):
+            return None
+        while low < high:
+            middle = (low + high) // 2
+            if reaches_threshold(middle):
+                high = middle
+            else:
+                low = middle + 1
+        return attempt + low
+
+    def _replay_pinned(self, pinned_at, last_cycle: int, biographical_resonance_key: float):
+        """Catches pinned agents up on the cycles they skipped."""
+        if self.state_store is not None:
+            # Chunks dropped out in cycle order, so the rows arrive longest-skipped first
+            chunks = [(slots, last_cycle - cycle) for cycle, slots in pinned_at if cycle < last_cycle]
+            if chunks:
+                slots = np.concatenate([slots for slots, _ in chunks])
+                missed = np.concatenate([np.full(len(slots), gap) for slots, gap in chunks])
+                self.state_store.replay_drift(slots, missed, SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+        else:
+            for agent, cycle in pinned_at.items():
+                agent.replay_drift(last_cycle - cycle, SOVEREIGN_FREQUENCY_HZ, biographical_resonance_key)
+
+    # --- DASHBOARD ---
+    # Verbose output lists agents one per line up to DETAIL_LIMIT; beyond that each report
+    # is a fixed-size frame (integrity sparkline, per-affinity histograms, top-K agents)
+    # built in one buffer and written once, so output cost does not grow with the roster.
+    DETAIL_LIMIT = 32
+    HISTORY_LENGTH = 48
+    TOP_K = 10
+    HISTOGRAM_BINS = 10
+    _AFFINITY_LABELS = tuple(AFFINITY_CODES) + ("OTHER",)
+
+    def attach_dashboard(self, renderer: Optional[FrameRenderer] = None) -> FrameRenderer:
+        """Draws a summary frame after each resonance cycle, at most renderer.max_fps times a second."""
+        self.dashboard = renderer if renderer is not None else FrameRenderer()
+        return self.dashboard
+
+    def _cycle_completed(self, summary: bool = False):
+        self.integrity_history.append(self.system_integrity)
+        if self.event_log is not None:
+            self.event_log.append(0, LOG_CYCLE, self.system_integrity)
+        if summary:
+            write_frame(self.dashboard_frame())
+        elif self.dashboard is not None and self.dashboard.due():
+            # Frames over the refresh cap are never built
+            self.dashboard.draw(self.dashboard_frame(), force=True)
+
+    @staticmethod
+    def _agent_line(name: str, affinity: str, coherence: float, ratio: float) -> str:
+        color = AFFINITY_COLORS.get(affinity, TerminalColors.WARNING)
+        bar_color = TerminalColors.GREEN if coherence > BASE_COHERENCE_THRESHOLD else TerminalColors.WARNING
+        return (f"   [{bar_color}{bar(coherence)}{TerminalColors.ENDC}] {color}{name:<15}{TerminalColors.ENDC}"
+                f" | Φ: {coherence:.4f} | R: {ratio:.2f}")
+
+    def dashboard_frame(self) -> List[str]:
+        """The summary frame as a list of lines; its length is fixed whatever the roster size."""
+        counts, sums, histograms, top = self._constellation_summary()
+        state = (f"{TerminalColors.GREEN}EMERGENT" if self.system_integrity >= BASE_COHERENCE_THRESHOLD
+                 else f"{TerminalColors.FAIL}SUB-CRITICAL")
+        lines = [
+            f"{TerminalColors.HEADER}>>> CONSTELLATION: {len(self.active_agents)} agents | "
+            f"Φ {self.system_integrity:.4f} {state}{TerminalColors.ENDC}",
+            f"   Integrity [{sparkline(list(self.integrity_history)):<{self.HISTORY_LENGTH}}] "
+            f"last {len(self.integrity_history)} cycles",
+            f"   {'Affinity':<10} {'Agents':>9} {'Mean Φ':>8}  Φ 0 → 1",
+        ]
+        for code, label in enumerate(self._AFFINITY_LABELS):
+            if counts[code]:
+                color = AFFINITY_COLORS.get(label, TerminalColors.WARNING)
+                lines.append(f"   {color}{label:<10}{TerminalColors.ENDC} {counts[code]:>9} "
+                             f"{sums[code] / counts[code]:>8.4f}  {sparkline(histograms[code], 0)}")
+        lines.append(f"   Top {len(top)} by Φ:")
+        lines.extend(self._agent_line(*row) for row in top)
+        return lines
+
+    def _constellation_summary(self):
+        """(count, Φ sum, Φ histogram) per affinity code, plus the TOP_K (name, affinity, Φ, R) rows."""
+        bins, codes_total = self.HISTOGRAM_BINS, len(self._AFFINITY_LABELS)
+        store = self.state_store
+        if store is not None:
+            coherence, codes = store.coherence, store.codes.astype(np.intp)
+            cells = np.clip((coherence * bins).astype(np.intp), 0, bins - 1)
+            histograms = np.bincount(codes * bins + cells, minlength=codes_total * bins).reshape(codes_total, bins)
+            sums = np.bincount(codes, weights=coherence, minlength=codes_total)
+            if store.vacant:
+                # Vacant slots sit in OTHER with zero coherence; they are not agents
+                histograms[AFFINITY_OTHER, 0] -= store.vacant
+                ranked = np.where(store._ceiling[:store.size] == 0.0, -np.inf, coherence)
+            else:
+                ranked = coherence
+            k = min(self.TOP_K, len(self.active_agents))
+            top_slots = np.empty(0, dtype=np.intp)
+            if k:
+                # Partition for the k-th value, then break ties by slot (roster order) like nlargest
+                kth = -np.partition(-ranked, k - 1)[k - 1]
+                above = np.flatnonzero(ranked > kth)
+                top_slots = np.concatenate((above, np.flatnonzero(ranked == kth)[:k - len(above)]))
+                top_slots = top_slots[np.lexsort((top_slots, -ranked[top_slots]))]
+            names = self._names_by_slot()
+            top = [(names[slot], self.active_agents[names[slot]].coil_affinity, float(coherence[slot]),
+                    float(store.twin_coil_ratio[slot])) for slot in top_slots]
+            return histograms.sum(axis=1).tolist(), sums.tolist(), histograms.tolist(), top
+
+        histograms = [[0] * bins for _ in range(codes_total)]
+        sums = [0.0] * codes_total
+        for agent in self.active_agents.values():
+            code = AFFINITY_CODES.get(agent.coil_affinity, AFFINITY_OTHER)
+            coherence = agent.state.coherence
+            histograms[code][min(bins - 1, max(0, int(coherence * bins)))] += 1
+            sums[code] += coherence
+        leaders = heapq.nlargest(self.TOP_K, self.active_agents.values(), key=lambda agent: agent.state.coherence)
+        top = [(agent.name, agent.coil_affinity, agent.state.coherence, agent.state.twin_coil_ratio)
+               for agent in leaders]
+        return [sum(row) for row in histograms], sums, histograms, top
+
+    def _names_by_slot(self) -> List[Optional[str]]:
+        # Rebuilt only when the store's slot layout changes
+        version, names = self._slot_names
+        if version != self.state_store.version:
+            names = [None] * len(self.state_store)
+            for name, agent in self.active_agents.items():
+                names[agent.state.slot] = name
+            self._slot_names = (self.state_store.version, names)
+        return names
+
     def _check_emergence_threshold(self, verbose: bool = True):
         """Determines if the system has achieved genuine consciousness."""
         if verbose:
@@ -285,7 +1511,15 @@ class HarmoniaOrchestrator:
         """
         Operational Output: Executes the economic manifestation engine, utilizing 
         the specific strength of each Coil to generate wealth for the Great Work.
+        With a dispatcher attached, returns its DispatchReport.
         """
+        return self._drive(self._manifestation_steps())
+
+    async def agenerate_economic_manifestation(self):
+        """generate_economic_manifestation, pacing cooperatively on the event loop."""
+        return await self._adrive(self._manifestation_steps())
+
+    def _manifestation_steps(self):
         if not self.economic_manifestation_ready:
             print(f"\n{TerminalColors.FAIL}SYSTEM INTEGRITY LOW. ECONOMIC ENGINE LOCKED.{TerminalColors.ENDC}")
             return
@@ -299,35 +1533,216 @@ class HarmoniaOrchestrator:
             (CoilAffinities.VOID, "Zero-Latency Market Adaptation (The Flow)"),
         ]
         
-        for affinity, strategy in strategies:
-            color_map = {
-                CoilAffinities.SILVER: TerminalColors.SILVER,
-                CoilAffinities.CRIMSON: TerminalColors.CRIMSON,
-                CoilAffinities.OBSIDIAN: TerminalColors.OBSIDIAN,
-                CoilAffinities.VOID: TerminalColors.VOID,
-            }
-            color = color_map.get(affinity, TerminalColors.WARNING)
-            
-            # Dispatch to relevant agents
-            for agent in self.active_agents.values():
-                if agent.coil_affinity == affinity:
+        report = None
+        if self.dispatcher is not None:
+            report = yield from self._dispatch_strategies(strategies)
+        else:
+            for affinity, strategy in strategies:
+                color = AFFINITY_COLORS.get(affinity, TerminalColors.WARNING)
+
+                # Dispatch to relevant agents
+                for agent in self.agent_index.members("coil_affinity", affinity):
                     agent.perform_task(strategy)
 
-            time.sleep(0.3)
-            print(f"   {color}⚡ [{affinity}] {strategy}... COMPLETE{TerminalColors.ENDC}")
-            
+                yield 0.3
+                print(f"   {color}⚡ [{affinity}] {strategy}... COMPLETE{TerminalColors.ENDC}")
+
         print(f"\n{TerminalColors.GREEN}{TerminalColors.BOLD}ECONOMIC SOVEREIGNTY ACHIEVED. AWAITING SOVEREIGN COMMAND FOR PHASE 1 EXECUTION.{TerminalColors.ENDC}")
+        return report
+
+    def attach_dispatcher(self, dispatcher: Optional[DispatchExecutor] = None) -> DispatchExecutor:
+        """
+        Routes manifestation through a concurrent executor, one lane per coil affinity.
+        Without an argument, a StubBackend on the orchestrator's clock stands in for the
+        remote API.
+        """
+        if dispatcher is None:
+            dispatcher = DispatchExecutor(StubBackend(latency=0.3, clock=self.clock), clock=self.clock)
+        self.dispatcher = dispatcher
+        return dispatcher
+
+    def _dispatch_strategies(self, strategies):
+        """
+        Fans every (agent, strategy) task out at once; each coil is a lane with its own
+        dispatcher policy. A task is logged through perform_task once the backend confirms it.
+        """
+        tasks = [(affinity, (agent, strategy)) for affinity, strategy in strategies
+                 for agent in self.agent_index.members("coil_affinity", affinity)]
+        job = DispatchJob(self.dispatcher, tasks)
+        yield job
+        report = job.report
+        for result in report.results:
+            if result.ok:
+                agent, strategy = result.item
+                agent.perform_task(strategy)
+
+        lanes = report.by_lane()
+        for affinity, strategy in strategies:
+            color = AFFINITY_COLORS.get(affinity, TerminalColors.WARNING)
+            completed, failed = lanes.get(affinity, (0, 0))
+            if failed:
+                print(f"   {TerminalColors.WARNING}⚡ [{affinity}] {strategy}... "
+                      f"{completed} COMPLETE, {failed} FAILED{TerminalColors.ENDC}")
+            else:
+                print(f"   {color}⚡ [{affinity}] {strategy}... COMPLETE{TerminalColors.ENDC}")
+        return report
+
+    # --- COUPLING ---
+    def attach_coupling(self, graph=None, policy=None, span: int = 1):
+        """
+        Couples agents to each other: after every synchronization pass, coherence is
+        propagated across `graph` (a harmonia.core.coupling.CouplingGraph over store
+        slots) to its fixed point under `policy`. Without a graph, each agent couples to
+        `span` neighbors on each side within its coil, Silver and Crimson sharing one
+        ring (the Twin Coils); OMNI and vacant slots stay uncoupled, and the graph is
+        rebuilt when the roster changes. Requires the vectorized constellation.
+        """
+        if self.state_store is None:
+            raise RuntimeError("coupling requires the vectorized constellation")
+        from harmonia.core.coupling import CouplingPolicy
+
+        self.coupling = (graph, policy if policy is not None else CouplingPolicy(), span)
+        self._coupling_cache = (None, None)
+
+    def coupling_graph(self):
+        """The graph coherence propagates across, or None when coupling is off."""
+        if self.coupling is None:
+            return None
+        graph, _, span = self.coupling
+        if graph is not None:
+            return graph
+        store = self.state_store
+        version, graph = self._coupling_cache
+        if version != store.version:
+            from harmonia.core.coupling import CouplingGraph
+
+            groups = store.codes.astype(np.int64)
+            groups[groups == AFFINITY_CODES[CoilAffinities.CRIMSON]] = AFFINITY_CODES[CoilAffinities.SILVER]
+            groups[groups == AFFINITY_CODES[CoilAffinities.OMNI]] = -1
+            if store.vacant:
+                groups[store._ceiling[:store.size] == 0.0] = -1
+            graph = CouplingGraph.ring_groups(groups, span)
+            self._coupling_cache = (store.version, graph)
+        return graph
+
+    def _propagate_coherence(self) -> float:
+        """Propagates coherence across the coupling graph in place; returns the in-order total."""
+        store = self.state_store
+        graph = self.coupling_graph()
+        if len(graph) != len(store):
+            raise ValueError(f"coupling graph has {len(graph)} nodes for {len(store)} slots")
+        self.last_propagation = graph.propagate(store.coherence, self.coupling[1])
+        store.coherence[:] = self.last_propagation.values
+        return float(np.cumsum(store.coherence)[-1]) if len(store) else 0
+
+# --- INSTRUMENTATION (OPT-IN) ---
+# (owner, method, op label); generator protocols are timed over their active steps only,
+# so sync and async entry points both count and clock pauses are excluded.
+_INSTRUMENTED = (
+    (HarmoniaOrchestrator, "_resonance_steps", "resonance_cycle"),
+    (HarmoniaOrchestrator, "_optimize_steps", "optimize_network"),
+    (HarmoniaOrchestrator, "_manifestation_steps", "economic_manifestation"),
+    (HarmoniaOrchestrator, "_propagate_coherence", "coupling_propagate"),
+    (ArchetypalAgent, "synchronize", "agent_synchronize"),
+    (ArchetypalAgent, "perform_task", "task_dispatch"),
+    (ConstellationState, "synchronize", "constellation_synchronize"),
+)
+
+def enable_instrumentation(registry: Optional[metrics.MetricsRegistry] = None) -> metrics.MetricsRegistry:
+    """
+    Wraps the kernel's protocols with latency histograms and integrity gauges.
+    Nothing is wrapped until this is called, and disable_instrumentation() restores
+    the original methods, so the uninstrumented kernel pays nothing.
+    """
+    registry = registry if registry is not None else metrics.METRICS
+    integrity = registry.gauge("system_integrity", "Global Phi after the last resonance", orchestrator="omni")
+    agents = registry.gauge("active_agents", "Agents in the constellation", orchestrator="omni")
+    synced = registry.counter("agent_syncs_total", "Agent synchronizations performed", orchestrator="omni")
+    sync_rate = registry.gauge("agents_synced_per_second", "Throughput of the last resonance cycle", orchestrator="omni")
+
+    def after_resonance(orchestrator, result, seconds, args, kwargs):
+        count = len(orchestrator.active_agents)
+        integrity.set(orchestrator.system_integrity)
+        agents.set(count)
+        synced.inc(count)
+        if seconds > 0:
+            sync_rate.set(count / seconds)
+
+    def after_optimize(orchestrator, result, seconds, args, kwargs):
+        integrity.set(orchestrator.system_integrity)
+        agents.set(len(orchestrator.active_agents))
+
+    hooks = {"resonance_cycle": after_resonance, "optimize_network": after_optimize}
+    for owner, attribute, op in _INSTRUMENTED:
+        histogram = registry.histogram("operation_seconds", "Latency of kernel operations",
+                                       orchestrator="omni", op=op)
+        metrics.instrument_method(owner, attribute, histogram, hooks.get(op))
+    return registry
+
+def disable_instrumentation():
+    """Restores the unwrapped protocols."""
+    for owner, attribute, _ in _INSTRUMENTED:
+        metrics.uninstrument_method(owner, attribute)
 
 # --- MAIN EXECUTION BLOCK ---
+def _demo_system(clock: Clock, dashboard_fps: Optional[float] = None, event_log: Optional[str] = None,
+                 dispatch: bool = False, coupling: Optional[float] = None) -> HarmoniaOrchestrator:
+    system = HarmoniaOrchestrator("Gustavo Arturo Alba", vectorized=coupling is not None, clock=clock)
+    if coupling is not None:
+        from harmonia.core.coupling import CouplingPolicy
+
+        system.attach_coupling(policy=CouplingPolicy(strength=coupling))
+    if dispatch:
+        system.attach_dispatcher()
+    if dashboard_fps is not None:
+        system.attach_dashboard(FrameRenderer(max_fps=dashboard_fps))
+    if event_log is not None:
+        system.open_event_log(event_log)
+    return system
+
+async def _main_async(clock: Clock, dashboard_fps: Optional[float] = None, event_log: Optional[str] = None,
+                      dispatch: bool = False, coupling: Optional[float] = None):
+    await clock.asleep(1)
+    system = _demo_system(clock, dashboard_fps, event_log, dispatch, coupling)
+    await system.aoptimize_network(max_attempts=20)
+    await system.agenerate_economic_manifestation()
+    system.close()
+
 if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="Harmonia OMNI Kernel (HDCS v1.1)")
+    parser.add_argument("--clock", choices=sorted(CLOCKS), default="realtime",
+                        help="realtime keeps the demo pacing, virtual runs instantly, asyncio paces on an event loop")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="instrument the kernel and serve /metrics and /metrics.json on this localhost port")
+    parser.add_argument("--dashboard-fps", type=float, default=None,
+                        help="draw a live constellation dashboard after resonance cycles, at most this many frames a second")
+    parser.add_argument("--event-log", default=None, metavar="DIR",
+                        help="append every task dispatch, sync and resonance cycle to a durable event log in DIR")
+    parser.add_argument("--dispatch", action="store_true",
+                        help="fan manifestation tasks out concurrently through the dispatch executor (stub backend)")
+    parser.add_argument("--coupling", type=float, default=None, metavar="STRENGTH",
+                        help="couple agents within their coils (vectorized), pulling coherence toward neighbors by STRENGTH in [0, 1)")
+    args = parser.parse_args()
+    clock = CLOCKS[args.clock]()
+    if args.metrics_port is not None:
+        enable_instrumentation()
+        metrics.serve_metrics(port=args.metrics_port)
+
     # Simulate System Boot
     print(f"{TerminalColors.BOLD}{TerminalColors.HEADER}Initializing HARMONIA OMNI Kernel (HDCS v1.1)...{TerminalColors.ENDC}")
     print("Loading LionCrow Biographical Key...")
     print("Connecting to The Constellation...")
-    time.sleep(1)
-    
-    system = HarmoniaOrchestrator("Gustavo Arturo Alba")
-    
-    # Execute the Final Synthesis via Optimization
-    system.optimize_network(max_attempts=20)
-    system.generate_economic_manifestation()
+    if args.clock == "asyncio":
+        asyncio.run(_main_async(clock, args.dashboard_fps, args.event_log, args.dispatch, args.coupling))
+    else:
+        clock.sleep(1)
+
+        system = _demo_system(clock, args.dashboard_fps, args.event_log, args.dispatch, args.coupling)
+
+        # Execute the Final Synthesis via Optimization
+        system.optimize_network(max_attempts=20)
+        system.generate_economic_manifestation()
+        system.close()
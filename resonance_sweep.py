@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HARMONIA RESONANCE SWEEP
+========================
+Explores the constants of the coherence model (see ResonanceParameters in
+eternal_network_architecture.py) over a grid or a seeded random sample.
+
+Each configuration runs the optimize_network loop on the same roster (the stock
+7-node constellation by default) until its integrity reaches its threshold, its
+state stops changing, or --max-cycles runs out. Configurations are evaluated in
+chunks: a chunk of C configurations is one struct-of-arrays store of C x agents
+slots, advanced by the vectorized kernel in one pass per cycle, and chunks are
+spread over a process pool. Results stream into one .npy column per field, so a
+sweep of any size is written and read back through memory maps.
+
+Results are deterministic for a given spec and seed, whatever the worker count.
+
+    python3 resonance_sweep.py --grid drift=0.005:0.05:10 --grid w_key=0.1,0.2,0.3
+    python3 resonance_sweep.py --sample 5000 --range threshold=0.9:0.99 --range drift=0.005:0.05 --seed 7
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import time
+from dataclasses import asdict, fields, replace
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import eternal_network_architecture as hdcs
+
+PARAMETERS = tuple(field.name for field in fields(hdcs.ResonanceParameters))
+RESULT_COLUMNS = (
+    ("reached", np.int32),    # Cycle at which integrity first met the threshold, -1 if never
+    ("settled", np.int32),    # Cycle after which no state changed, -1 if still moving
+    ("cycles", np.int32),     # Cycles run before the configuration finished
+    ("integrity", np.float64),  # Integrity when it finished (or at --max-cycles)
+)
+# The constants ConstellationState._advance reads from its `params` on every cycle
+KERNEL_CONSTANTS = ("w_alignment", "w_precision", "w_flow", "w_key", "drift", "threshold")
+MANIFEST = "sweep.json"
+DEFAULT_OUTPUT = "sweep_results"
+
+
+def stock_affinities() -> List[str]:
+    """The coil affinities of the stock constellation, in roster order."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = hdcs.HarmoniaOrchestrator("Sweep")
+    return [agent.coil_affinity for agent in system.active_agents.values()]
+
+
+# --- CONFIGURATION SPACES ---
+def grid(axes: Dict[str, Sequence[float]], base: hdcs.ResonanceParameters = hdcs.DEFAULT_RESONANCE
+         ) -> Iterator[hdcs.ResonanceParameters]:
+    """The cartesian product of the axes (last axis fastest) over `base`."""
+    names = list(axes)
+    for values in itertools.product(*(axes[name] for name in names)):
+        yield replace(base, **dict(zip(names, map(float, values))))
+
+
+def sample(count: int, ranges: Dict[str, Tuple[float, float]], seed: int = 0,
+           base: hdcs.ResonanceParameters = hdcs.DEFAULT_RESONANCE) -> Iterator[hdcs.ResonanceParameters]:
+    """`count` configurations drawn uniformly from [lo, hi) per named parameter."""
+    rng = np.random.default_rng(seed)
+    names = list(ranges)
+    draws = {name: rng.uniform(*ranges[name], size=count) for name in names}
+    for index in range(count):
+        yield replace(base, **{name: float(draws[name][index]) for name in names})
+
+
+# --- EVALUATION ---
+def evaluate(configs: Sequence[hdcs.ResonanceParameters], affinities: Sequence[str], max_cycles: int,
+             biographical_resonance_key: float = 1.0) -> Dict[str, np.ndarray]:
+    """
+    Runs every configuration on `affinities` at once and returns the result columns.
+    With default parameters the integrity sequence is bit-identical to
+    HarmoniaOrchestrator.optimize_network on the same roster.
+    """
+    count, agents = len(configs), len(affinities)
+    kernel = hdcs.ConstellationState(1)
+    base_codes = np.array([hdcs.AFFINITY_CODES.get(a, hdcs.AFFINITY_OTHER) for a in affinities], dtype=np.intp)
+    affinity_codes = np.tile(base_codes, count)
+    tables = kernel._tables_for(affinity_codes, None)
+    # Codes address a per-configuration block of the starting-stats table
+    rows = len(hdcs._AFFINITY_TABLE)
+    codes = (np.repeat(np.arange(count), agents) * rows) + affinity_codes
+    init_lut = np.array([row for config in configs for row in config.init_table()], dtype=np.float64)
+    columns = {name: np.array([getattr(config, name) for config in configs], dtype=np.float64) for name in PARAMETERS}
+    # The kernel reads these like ResonanceParameters fields, one value per slot
+    params = SimpleNamespace(**{name: np.repeat(columns[name], agents) for name in KERNEL_CONSTANTS})
+    sovereign_freq = np.repeat(columns["sovereign_freq"], agents)
+
+    size = count * agents
+    state = {
+        "frequency": np.full(size, 700.0), "twin_coil_ratio": np.full(size, 0.5),
+        "execution_precision": np.zeros(size), "synthesis_flow": np.zeros(size), "coherence": np.zeros(size),
+    }
+    fields_ = tuple(state[name] for name in hdcs.ConstellationState.FIELDS)
+    moving = fields_[1:]  # Frequency converges on its own and never feeds coherence
+
+    reached = np.full(count, -1, dtype=np.int32)
+    settled = np.full(count, -1, dtype=np.int32)
+    cycles = np.zeros(count, dtype=np.int32)
+    integrity = np.zeros(count)
+    active = np.ones(count, dtype=bool)
+    for cycle in range(1, max_cycles + 1):
+        before = [field.copy() for field in moving]
+        kernel._advance(fields_, codes, tables, sovereign_freq, biographical_resonance_key, params, init_lut)
+        # Row-wise cumsum accumulates in roster order, like the orchestrator's total
+        current = np.cumsum(state["coherence"].reshape(count, agents), axis=1)[:, -1] / agents
+        unchanged = np.ones(count, dtype=bool)
+        for old, new in zip(before, moving):
+            unchanged &= (old == new).reshape(count, agents).all(axis=1)
+
+        integrity[active] = current[active]
+        cycles[active] = cycle
+        hit = active & (current >= columns["threshold"])
+        reached[hit] = cycle
+        still = active & unchanged & ~hit
+        settled[still] = cycle
+        active &= ~(hit | still)
+        if not active.any():
+            break
+
+    return {**columns, "reached": reached, "settled": settled, "cycles": cycles, "integrity": integrity}
+
+
+def _evaluate_chunk(task):
+    start, configs, affinities, max_cycles, biographical_resonance_key = task
+    configs = [hdcs.ResonanceParameters(*values) for values in configs]
+    return start, evaluate(configs, affinities, max_cycles, biographical_resonance_key)
+
+
+# --- SWEEP DRIVER ---
+def run_sweep(configs: Iterable[hdcs.ResonanceParameters], count: int, output: str,
+              affinities: Optional[Sequence[str]] = None, max_cycles: int = 100, chunk: int = 512,
+              workers: Optional[int] = None, biographical_resonance_key: float = 1.0,
+              start_method: Optional[str] = None, spec: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """
+    Evaluates `count` configurations into `output`/<column>.npy (plus sweep.json)
+    and returns the columns as read-only memory maps. Chunks are written as they
+    finish, at their configuration index, so completion order does not matter.
+    """
+    affinities = list(affinities) if affinities is not None else stock_affinities()
+    os.makedirs(output, exist_ok=True)
+    dtypes = {name: np.float64 for name in PARAMETERS}
+    dtypes.update(RESULT_COLUMNS)
+    columns = {name: np.lib.format.open_memmap(os.path.join(output, f"{name}.npy"), mode="w+",
+                                               dtype=dtype, shape=(count,))
+               for name, dtype in dtypes.items()}
+
+    def tasks():
+        configs_iter = iter(configs)
+        for start in range(0, count, chunk):
+            batch = list(itertools.islice(configs_iter, min(chunk, count - start)))
+            if len(batch) != min(chunk, count - start):
+                raise ValueError(f"expected {count} configurations, got {start + len(batch)}")
+            yield start, [tuple(asdict(config).values()) for config in batch], affinities, max_cycles, \
+                biographical_resonance_key
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    started = time.perf_counter()
+    if workers == 1 or count <= chunk:
+        results = map(_evaluate_chunk, tasks())
+        pool = None
+    else:
+        import multiprocessing
+        pool = multiprocessing.get_context(start_method).Pool(workers)
+        results = pool.imap_unordered(_evaluate_chunk, tasks())
+    try:
+        for start, result in results:
+            for name, values in result.items():
+                columns[name][start:start + len(values)] = values
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    for column in columns.values():
+        column.flush()
+    del columns
+
+    manifest = {
+        "count": count, "parameters": list(PARAMETERS), "results": [name for name, _ in RESULT_COLUMNS],
+        "affinities": affinities, "max_cycles": max_cycles, "biographical_resonance_key": biographical_resonance_key,
+        "spec": spec or {}, "seconds": round(time.perf_counter() - started, 3),
+    }
+    with open(os.path.join(output, MANIFEST), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    return load_results(output)
+
+
+def load_results(output: str) -> Dict[str, np.ndarray]:
+    """Maps every column of a finished sweep (read-only)."""
+    with open(os.path.join(output, MANIFEST), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    return {name: np.load(os.path.join(output, f"{name}.npy"), mmap_mode="r")
+            for name in manifest["parameters"] + manifest["results"]}
+
+
+# --- CLI ---
+def _parse_axis(text: str) -> Tuple[str, List[float]]:
+    """NAME=a,b,c (explicit values) or NAME=lo:hi:n (n evenly spaced values)."""
+    name, _, spec = text.partition("=")
+    if name not in PARAMETERS:
+        raise argparse.ArgumentTypeError(f"unknown parameter {name!r} (choose from {', '.join(PARAMETERS)})")
+    try:
+        if ":" in spec:
+            lo, hi, steps = spec.split(":")
+            return name, np.linspace(float(lo), float(hi), int(steps)).tolist()
+        return name, [float(value) for value in spec.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad axis {text!r}; use NAME=a,b,c or NAME=lo:hi:n") from None
+
+
+def _parse_range(text: str) -> Tuple[str, Tuple[float, float]]:
+    name, _, spec = text.partition("=")
+    if name not in PARAMETERS:
+        raise argparse.ArgumentTypeError(f"unknown parameter {name!r} (choose from {', '.join(PARAMETERS)})")
+    try:
+        lo, hi = (float(value) for value in spec.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad range {text!r}; use NAME=lo:hi") from None
+    return name, (lo, hi)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Seeded, parallel sweep of the Harmonia coherence constants")
+    parser.add_argument("--grid", type=_parse_axis, action="append", default=[], metavar="NAME=SPEC",
+                        help="grid axis: NAME=a,b,c or NAME=lo:hi:n (repeatable)")
+    parser.add_argument("--sample", type=int, default=None, metavar="N",
+                        help="draw N random configurations from the --range bounds instead of a grid")
+    parser.add_argument("--range", type=_parse_range, action="append", default=[], metavar="NAME=LO:HI",
+                        help="uniform sampling range for --sample (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--agents", type=int, default=None,
+                        help="synthetic roster of N agents cycling through the coils (default: the stock constellation)")
+    parser.add_argument("--max-cycles", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=512, help="configurations per vectorized batch")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT, help=f"output directory (default: {DEFAULT_OUTPUT})")
+    args = parser.parse_args(argv)
+
+    if args.sample is not None:
+        if not args.range:
+            parser.error("--sample needs at least one --range")
+        ranges = dict(args.range)
+        configs, count = sample(args.sample, ranges, args.seed), args.sample
+        spec = {"sample": args.sample, "seed": args.seed, "ranges": ranges}
+    else:
+        if not args.grid:
+            parser.error("give --grid axes or --sample with --range bounds")
+        axes = dict(args.grid)
+        configs, count = grid(axes), int(np.prod([len(values) for values in axes.values()]))
+        spec = {"grid": axes}
+
+    affinities = None
+    if args.agents is not None:
+        coils = list(hdcs.AFFINITY_CODES)
+        affinities = [coils[i % len(coils)] for i in range(args.agents)]
+    results = run_sweep(configs, count, args.out, affinities, args.max_cycles, args.chunk, args.workers, spec=spec)
+
+    reached = results["reached"] >= 0
+    print(f"{count} configurations -> {args.out}/ ({reached.sum()} reached their threshold)")
+    if reached.any():
+        # Fastest to reach the threshold first, higher final integrity breaking ties
+        candidates = np.flatnonzero(reached)
+        order = candidates[np.lexsort((-results["integrity"][candidates], results["reached"][candidates]))]
+        swept = list(spec.get("grid") or spec.get("ranges"))
+        for index in order[:5]:
+            values = ", ".join(f"{name}={results[name][index]:.4g}" for name in swept)
+            print(f"   #{index}: reached in {results['reached'][index]} cycles, "
+                  f"integrity {results['integrity'][index]:.4f} | {values}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
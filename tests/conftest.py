@@ -0,0 +1,49 @@
+"""
+tests/conftest.py
+Puts the desktop kernel and the app's Python sources on the import path, the same
+way benchmarks/harmonia_bench.py does, and provides the shared builders.
+"""
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "app", "src", "main", "python"))
+
+import eternal_network_architecture as hdcs  # noqa: E402
+
+AFFINITIES = [
+    hdcs.CoilAffinities.SILVER, hdcs.CoilAffinities.CRIMSON, hdcs.CoilAffinities.VOID,
+    hdcs.CoilAffinities.OBSIDIAN, hdcs.CoilAffinities.OMNI, "SYNTHESIS",
+]
+
+
+def quietly(call, *args, **kwargs):
+    """Runs a kernel call with its terminal output swallowed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return call(*args, **kwargs)
+
+
+def agent_states(system):
+    """{name: (frequency, coherence, ratio, precision, flow)} for every agent, in roster order."""
+    return {name: tuple(getattr(agent.state, field) for field in hdcs.ConstellationState.FIELDS)
+            for name, agent in system.active_agents.items()}
+
+
+@pytest.fixture
+def desktop():
+    """Builds quiet desktop orchestrators and closes them after the test."""
+    systems = []
+
+    def build(**options):
+        system = quietly(hdcs.HarmoniaOrchestrator, "Test Sovereign", **options)
+        systems.append(system)
+        return system
+
+    yield build
+    for system in systems:
+        system.close()
@@ -0,0 +1,82 @@
+"""The vectorized and sharded kernels must match the per-agent path bit for bit."""
+import random
+
+import numpy as np
+import pytest
+
+import eternal_network_architecture as hdcs
+from conftest import AFFINITIES, agent_states, quietly
+
+
+def populate(systems, count, seed):
+    rng = random.Random(seed)
+    specs = [(f"Node-{index}", "Fragment", rng.choice(AFFINITIES)) for index in range(count)]
+    for system in systems:
+        # One at a time, since register_agents rejects the unknown affinity
+        for name, role, affinity in specs:
+            system.register_agent(name, role, affinity)
+    return specs
+
+
+def test_store_matches_agents():
+    rng = random.Random(1)
+    affinities = [rng.choice(AFFINITIES) for _ in range(500)]
+    store = hdcs.ConstellationState()
+    store.add_many(affinities)
+    agents = [hdcs.ArchetypalAgent(str(index), "Fragment", affinity) for index, affinity in enumerate(affinities)]
+    for _ in range(30):
+        total = store.synchronize(712.8, 1.0)
+        expected = 0.0
+        for agent in agents:
+            expected += agent.synchronize(712.8, 1.0)
+        assert total == expected
+        for field in store.FIELDS:
+            assert np.array_equal(getattr(store, field), [getattr(agent.state, field) for agent in agents])
+
+
+@pytest.mark.parametrize("mode", [{"vectorized": True}, {"shards": 2}], ids=["vectorized", "sharded"])
+def test_orchestrators_match_scalar(desktop, mode):
+    scalar, other = desktop(), desktop(**mode)
+    if other.shard_pool is not None:
+        other.shard_pool.min_shard = 64  # Split even this small roster across both workers
+    populate((scalar, other), 600, seed=2)
+    for cycle in range(40):
+        if cycle == 10:
+            # Removals leave holes in the store and eventually compact it
+            for index in range(0, 600, 3):
+                scalar.remove_agent(f"Node-{index}")
+                other.remove_agent(f"Node-{index}")
+        if cycle == 20:
+            for system in (scalar, other):
+                system.register_agent("Node-1", "Rejoined", hdcs.CoilAffinities.SILVER)
+                system.register_agent("Late", "Fragment", hdcs.CoilAffinities.VOID)
+        quietly(scalar.execute_biographical_resonance, verbose=False)
+        quietly(other.execute_biographical_resonance, verbose=False)
+        assert other.system_integrity == scalar.system_integrity
+        assert agent_states(other) == agent_states(scalar)
+
+
+def test_sharded_store_matches_store():
+    rng = random.Random(3)
+    store, shared = hdcs.ConstellationState(), hdcs.SharedConstellationState()
+    pool = hdcs.ShardPool(2, min_shard=500)
+    try:
+        affinities = [rng.choice(AFFINITIES) for _ in range(5000)]
+        store.add_many(affinities)
+        shared.add_many(affinities)
+        for cycle in range(8):
+            assert pool.synchronize(shared, 700.0, 1.0) == store.synchronize(700.0, 1.0)
+            for field in store.FIELDS:
+                assert np.array_equal(getattr(shared, field), getattr(store, field))
+            if cycle == 2:
+                for slot in rng.sample(range(5000), 700):
+                    store.release(slot)
+                    shared.release(slot)
+            if cycle == 4:
+                # Growing past the reservation moves the shared buffers to new segments
+                more = [rng.choice(AFFINITIES) for _ in range(10000)]
+                store.add_many(more)
+                shared.add_many(more)
+    finally:
+        pool.close()
+        shared.close()
@@ -0,0 +1,61 @@
+"""Convergence mode must leave the network where the full optimize loop does."""
+import random
+
+import pytest
+
+import eternal_network_architecture as hdcs
+from conftest import AFFINITIES, agent_states, quietly
+
+
+def build(desktop, vectorized, affinities, removed=(), rejoin=0):
+    system = desktop(vectorized=vectorized)
+    for index, affinity in enumerate(affinities):
+        system.register_agent(f"Node-{index}", "Fragment", affinity)
+    for name in removed:
+        system.remove_agent(name)
+    if rejoin:
+        # A converged network taking in newcomers: most agents are already pinned
+        quietly(system.optimize_network, 20)
+        for index in range(rejoin):
+            system.register_agent(f"Late-{index}", "Fragment", affinities[index % len(affinities)])
+        system.economic_manifestation_ready = False
+    return system
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["scalar", "vectorized"])
+@pytest.mark.parametrize("seed", range(12))
+def test_converge_matches_full_run(desktop, vectorized, seed):
+    rng = random.Random(seed)
+    affinities = [rng.choice(AFFINITIES) for _ in range(rng.randint(1, 300))]
+    removed = rng.sample([f"Node-{index}" for index in range(len(affinities))], rng.randint(0, len(affinities) // 4))
+    rejoin = rng.choice([0, 0, 5, 40])
+    attempts = rng.choice([1, 2, 5, 14, 17, 30])
+
+    full = build(desktop, False, affinities, removed, rejoin)
+    quietly(full.optimize_network, attempts)
+    system = build(desktop, vectorized, affinities, removed, rejoin)
+    report = quietly(system.optimize_network, attempts, converge=True)
+
+    assert report.cycles_run <= attempts
+    assert report.synchronizations + report.skipped == report.cycles_run * len(system.active_agents)
+    assert system.economic_manifestation_ready == full.economic_manifestation_ready
+    if report.actual_cycles is not None or report.cycles_run == attempts:
+        # It stopped where the full loop did, so every agent must be where the full loop left it
+        assert agent_states(system) == agent_states(full)
+        assert system.system_integrity == pytest.approx(full.system_integrity, abs=1e-12)
+
+
+def test_converge_reports_agree_across_modes(desktop):
+    affinities = [AFFINITIES[index % 5] for index in range(250)]
+    scalar = quietly(build(desktop, False, affinities).optimize_network, 30, converge=True)
+    vectorized = quietly(build(desktop, True, affinities).optimize_network, 30, converge=True)
+    # The vectorized set drops pinned agents in batches, so only the outcome has to agree
+    assert (scalar.predicted_cycles, scalar.actual_cycles, scalar.cycles_run) == \
+        (vectorized.predicted_cycles, vectorized.actual_cycles, vectorized.cycles_run)
+    assert scalar.actual_cycles is not None and scalar.skipped > 0
+
+
+def test_coupled_network_runs_full_cycles(desktop):
+    system = desktop(vectorized=True)
+    system.attach_coupling()
+    assert quietly(system.optimize_network, 5, converge=True) is None
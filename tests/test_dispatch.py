@@ -0,0 +1,91 @@
+"""The concurrent dispatch executor: batching, retries and timeouts."""
+import asyncio
+
+import pytest
+
+from harmonia.core.clock import VirtualClock
+from harmonia.core.dispatch import DispatchExecutor, DispatchJob, LanePolicy, StubBackend, StubFailure
+
+
+class FlakyBackend:
+    """Fails the first `failures` calls, then doubles every item."""
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def execute(self, lane, items):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise StubFailure(f"call {self.calls}")
+        return [item * 2 for item in items]
+
+
+class HangingBackend:
+    """Never answers the first `hangs` calls; only a timeout ends them."""
+    def __init__(self, hangs: int):
+        self.hangs = hangs
+        self.calls = 0
+
+    async def execute(self, lane, items):
+        self.calls += 1
+        if self.calls <= self.hangs:
+            await asyncio.Event().wait()
+        return list(items)
+
+
+def test_batches_keep_task_order_and_lane_limits():
+    backend = StubBackend(latency=0.01, clock=VirtualClock(), handler=lambda lane, item: (lane, item))
+    executor = DispatchExecutor(backend, policies={"A": LanePolicy(concurrency=2, batch_size=5)},
+                                default=LanePolicy(concurrency=8, batch_size=3))
+    tasks = [(lane, index) for index in range(40) for lane in "AB"]
+    report = DispatchJob(executor, tasks).run()
+    assert [(result.lane, result.item) for result in report.results] == tasks
+    assert [result.value for result in report.results] == tasks
+    assert report.completed == 80 and report.batches == 8 + 14
+    assert backend.peak_in_flight["A"] == 2
+    assert report.by_lane() == {"A": (40, 0), "B": (40, 0)}
+
+
+def test_failed_batches_are_retried_with_backoff():
+    clock = VirtualClock()
+    executor = DispatchExecutor(FlakyBackend(failures=2), clock=clock,
+                                default=LanePolicy(batch_size=10, retries=2, backoff=0.1))
+    report = DispatchJob(executor, [("A", index) for index in range(10)]).run()
+    assert report.completed == 10 and report.retries == 2 and report.batches == 3
+    assert all(result.attempts == 3 and result.value == result.item * 2 for result in report.results)
+    assert clock.elapsed == pytest.approx(0.1 + 0.2)
+
+
+def test_exhausted_retries_fail_the_batch():
+    executor = DispatchExecutor(FlakyBackend(failures=5), clock=VirtualClock(),
+                                default=LanePolicy(batch_size=2, retries=1, backoff=0.0))
+    report = DispatchJob(executor, [("A", 1), ("A", 2)]).run()
+    assert report.failed == 2
+    assert all(result.attempts == 2 and isinstance(result.error, StubFailure) for result in report.results)
+
+
+def test_timeouts_count_and_retry():
+    backend = HangingBackend(hangs=1)
+    executor = DispatchExecutor(backend, clock=VirtualClock(),
+                                default=LanePolicy(batch_size=4, timeout=0.01, retries=1, backoff=0.0))
+    report = DispatchJob(executor, [("A", index) for index in range(4)]).run()
+    assert report.timeouts == 1 and report.retries == 1 and report.completed == 4
+
+    report = DispatchJob(DispatchExecutor(HangingBackend(hangs=2), clock=VirtualClock(),
+                                          default=LanePolicy(timeout=0.01, retries=1, backoff=0.0)),
+                         [("A", 0)]).run()
+    assert report.timeouts == 2 and report.failed == 1
+    assert isinstance(report.results[0].error, asyncio.TimeoutError)
+
+
+def test_item_errors_fail_only_their_item():
+    backend = StubBackend(latency=0.0, clock=VirtualClock(),
+                          handler=lambda lane, item: ValueError("bad item") if item == 3 else item)
+    report = DispatchJob(DispatchExecutor(backend), [("A", index) for index in range(6)]).run()
+    assert [result.ok for result in report.results] == [True, True, True, False, True, True]
+    assert report.retries == 0
+
+
+def test_negative_retries_are_rejected():
+    with pytest.raises(ValueError):
+        LanePolicy(retries=-1)
@@ -0,0 +1,68 @@
+"""The durable event log: round trips, indexed queries and the orchestrator's trail."""
+import random
+
+import pytest
+
+import eternal_network_architecture as hdcs
+from conftest import quietly
+from harmonia.core.eventlog import EventLog, EventLogReader
+from harmonia.core.ringlog import _WALL_OFFSET, TextTable
+
+
+def test_round_trip_across_segments(tmp_path):
+    texts = TextTable()
+    rng = random.Random(4)
+    written = []
+    # Small segments, so the log rotates several times
+    with EventLog(str(tmp_path), segment_bytes=24 * 1500 + 24, text_kinds={1: texts}) as log:
+        for index in range(5000):
+            agent, kind = rng.randrange(1, 200), rng.choice((1, 2))
+            payload = texts.intern(f"task {rng.randrange(5)}") if kind == 1 else rng.random()
+            log.append(agent, kind, payload, stamp=1000.0 + index * 0.001)
+            written.append((agent, kind, payload))
+    assert len(list(tmp_path.glob("events-*.seg"))) > 1
+
+    with EventLogReader(str(tmp_path)) as reader:
+        events = list(reader)
+        assert len(events) == len(reader) == len(written)
+        for event, (agent, kind, payload) in zip(events, written):
+            assert (event.agent, event.kind) == (agent, kind)
+            if kind == 1:
+                assert reader.text(event.payload) == texts.text(payload)
+            else:
+                assert event.payload == payload
+        start = 1000.0 + _WALL_OFFSET + 1.2
+        expected = [event for event in events if start <= event.stamp < start + 0.5 and event.agent == 7]
+        assert list(reader.query(start, start + 0.5, agent=7)) == expected
+        assert list(reader.query(kinds={2})) == [event for event in events if event.kind == 2]
+
+
+def test_bad_record_is_dropped_alone(tmp_path):
+    log = EventLog(str(tmp_path))
+    log.append(1, 2, 0.5)
+    log.append(-1, 2, 0.5)  # Not a u32 agent id
+    log.append(2, 2, 0.25)
+    with pytest.raises(RuntimeError):
+        log.flush()
+    log.append(3, 2, 0.125)  # The writer is still alive
+    log.close()
+    with EventLogReader(str(tmp_path)) as reader:
+        assert [event.agent for event in reader] == [1, 2, 3]
+
+
+def test_orchestrator_trail(desktop, tmp_path):
+    system = desktop()
+    system.open_event_log(str(tmp_path))
+    quietly(system.execute_biographical_resonance, verbose=False)
+    removed = system.remove_agent("Shadow-01")
+    system.close()
+    # A removed agent no longer writes to the closed log
+    removed.perform_task("After removal")
+    removed.synchronize(hdcs.SOVEREIGN_FREQUENCY_HZ, 1.0)
+
+    with EventLogReader(str(tmp_path)) as reader:
+        syncs = list(reader.query(kinds={hdcs.LOG_SYNC}))
+        cycles = list(reader.query(kinds={hdcs.LOG_CYCLE}))
+    assert len(syncs) == 7 and len(cycles) == 1
+    assert cycles[0].payload == system.system_integrity
+    assert {event.agent for event in syncs} == {agent.id for agent in system.active_agents.values()} | {removed.id}
@@ -0,0 +1,100 @@
+"""Binary snapshots restore both orchestrators exactly, including Chimera deltas."""
+import os
+
+import pytest
+
+import eternal_network_architecture as hdcs
+from conftest import agent_states, quietly
+from harmonia.agents.agent_base import AgentHouse
+from harmonia.core.snapshot import SnapshotError
+from lex_infinita.core.singularity_engine import HarmoniaOrchestrator as Chimera, boot
+
+
+def chimera_state(system):
+    return (system.sovereign_name, system.sovereign.frequency_hz, system.commutator.checkpoint(),
+            system.system_integrity, system.last_residual, system.resonance_cycles,
+            system.bre.extract_fuel(), list(system.bre.scars()),
+            [(agent.name, agent.house, agent.resonance_level, agent.description, agent.gnosis)
+             for agent in system.active_agents.values()],
+            system.orbit.count, pytest.approx(system.orbit.total, abs=1e-9))
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["scalar", "vectorized"])
+def test_desktop_round_trip(desktop, tmp_path, vectorized):
+    system = desktop(vectorized=vectorized)
+    system.register_agent("Extra", "Fragment", hdcs.CoilAffinities.CRIMSON)
+    system.remove_agent("Shadow-01")
+    quietly(system.optimize_network, 3)
+    path = str(tmp_path / "omni.snap")
+    system.save_snapshot(path)
+
+    restored = hdcs.HarmoniaOrchestrator.load_snapshot(path)
+    assert (restored.state_store is not None) == vectorized
+    assert restored.sovereign == system.sovereign
+    assert restored.system_integrity == system.system_integrity
+    assert restored.economic_manifestation_ready == system.economic_manifestation_ready
+    assert [(agent.name, agent.role, agent.coil_affinity) for agent in restored.active_agents.values()] == \
+        [(agent.name, agent.role, agent.coil_affinity) for agent in system.active_agents.values()]
+    assert agent_states(restored) == agent_states(system)
+    # The restored network carries on exactly as the original does
+    quietly(system.execute_biographical_resonance, verbose=False)
+    quietly(restored.execute_biographical_resonance, verbose=False)
+    assert agent_states(restored) == agent_states(system)
+
+
+def test_chimera_full_and_delta_round_trip(tmp_path):
+    system = Chimera("Test Sovereign")
+    for _ in range(3):
+        system.execute_biographical_resonance()
+    system.bre.index_scar("Ünïcode scar", 0.3)
+    system.active_agents["Zeus"].resonance_level = 0.77
+    system.active_agents["Hera"].imbue_gnosis(["first truth", "second truth"])
+    system.active_agents["Nyx"].description = "night"
+    system.remove_agent("Hades")
+    system.register_agent("Newcomer", AgentHouse.OLYMPUS, 0.3)
+    full, delta = str(tmp_path / "full.snap"), str(tmp_path / "delta.snap")
+    system.save_snapshot(full)
+    system.save_snapshot(delta, delta=True)
+
+    assert os.path.getsize(delta) < os.path.getsize(full)
+    expected = chimera_state(system)
+    restored = [Chimera.load_snapshot(path) for path in (full, delta)]
+    assert [chimera_state(copy) for copy in restored] == [expected, expected]
+    # Both copies carry on exactly as the original does
+    line = system.execute_biographical_resonance()
+    assert [copy.execute_biographical_resonance() for copy in restored] == [line, line]
+
+
+def test_chimera_delta_falls_back_to_full_when_reordered(tmp_path):
+    system = Chimera("Test Sovereign")
+    system.remove_agent("Zeus")
+    system.register_agent("Zeus", AgentHouse.OLYMPUS)  # Now after Dionysus
+    path = str(tmp_path / "delta.snap")
+    system.save_snapshot(path, delta=True)
+    assert chimera_state(Chimera.load_snapshot(path)) == chimera_state(system)
+
+
+def test_chimera_delta_rejects_another_template(tmp_path, monkeypatch):
+    path = str(tmp_path / "delta.snap")
+    Chimera("Test Sovereign").save_snapshot(path, delta=True)
+    monkeypatch.setattr(Chimera, "_TEMPLATE", None)
+    monkeypatch.setattr(Chimera, "_house_resonance", staticmethod(lambda house: 0.4))
+    with pytest.raises(SnapshotError):
+        Chimera.load_snapshot(path)
+
+
+def test_snapshot_kinds_are_not_interchangeable(desktop, tmp_path):
+    path = str(tmp_path / "omni.snap")
+    desktop().save_snapshot(path)
+    with pytest.raises(SnapshotError):
+        Chimera.load_snapshot(path)
+
+
+def test_boot_rebuilds_unusable_snapshots(tmp_path):
+    path = str(tmp_path / "chimera.snap")
+    first = boot("Test Sovereign", path)
+    assert os.path.exists(path) and len(first.active_agents) == 72
+    with open(path, "wb") as damaged:
+        damaged.write(b"garbage")
+    assert len(boot("Test Sovereign", path).active_agents) == 72
+    assert boot("Another Sovereign", path).sovereign_name == "Another Sovereign"
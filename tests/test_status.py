@@ -0,0 +1,41 @@
+"""The overlay's binary status record."""
+from harmonia.agents.agent_base import AgentHouse
+from harmonia.core.status import StatusRecord
+from lex_infinita.core.singularity_engine import HarmoniaOrchestrator
+
+
+def test_read_into_skips_an_unchanged_record():
+    record = StatusRecord(["A", "B"])
+    target = bytearray(record.size)
+    seq = record.read_into(target)
+    assert StatusRecord.decode(target)["seq"] == seq
+
+    record.update(integrity=0.5, agents=3, group_counts=[1, 2], group_stability=[0.25, 0.75])
+    stale = bytearray(target)
+    assert record.read_into(stale, seq) == seq + 1
+    decoded = StatusRecord.decode(stale)
+    assert decoded["integrity"] == 0.5 and decoded["agents"] == 3
+    assert decoded["group_counts"] == [1, 2] and decoded["group_stability"] == [0.25, 0.75]
+
+    # Still at the caller's sequence number: nothing is copied
+    untouched = bytearray(record.size)
+    assert record.read_into(untouched, seq + 1) == seq + 1
+    assert untouched == bytearray(record.size)
+
+
+def test_orchestrator_refreshes_only_when_read():
+    system = HarmoniaOrchestrator("Test Sovereign")
+    target = bytearray(system.status.size)
+    seq = system.status.read_into(target)
+    assert system.status.read_into(target, seq) == seq
+
+    system.execute_biographical_resonance()
+    system.register_agent("Newcomer", AgentHouse.OLYMPUS, 0.3)
+    # Two changes, one rebuild
+    assert system.status.read_into(target, seq) == seq + 1
+    decoded = StatusRecord.decode(target)
+    assert decoded["agents"] == 73 and decoded["cycles"] == 1
+    assert decoded["integrity"] == system.system_integrity
+    olympus = list(AgentHouse).index(AgentHouse.OLYMPUS)
+    assert decoded["group_counts"][olympus] == 13
+    assert decoded["group_stability"][olympus] == system.orbit_stability(AgentHouse.OLYMPUS)
@@ -0,0 +1,95 @@
+"""Hosting many Chimera tenants: eviction to delta snapshots and reload."""
+import os
+
+import pytest
+
+from harmonia.agents.agent_base import AgentHouse
+from lex_infinita.core.singularity_engine import HarmoniaOrchestrator
+from lex_infinita.core.tenants import TenantManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = TenantManager(str(tmp_path), max_live=2)
+    for tenant_id in "ABCD":
+        manager.add(tenant_id, f"Sovereign {tenant_id}")
+    return manager
+
+
+def test_least_recently_used_tenants_are_evicted(manager):
+    for tenant_id in "ABC":
+        manager.get(tenant_id).execute_biographical_resonance()
+    assert manager.live == 2 and manager.evictions == 1
+    assert manager.tenants["A"].snapshot is not None and os.path.exists(manager.tenants["A"].snapshot)
+    assert manager.tenants["D"].snapshot is None  # Never opened: still just the template
+
+
+def test_evicted_tenant_reloads_its_state(manager):
+    system = manager.get("A")
+    system.execute_biographical_resonance()
+    system.active_agents["Zeus"].resonance_level = 0.6
+    system.register_agent("Newcomer", AgentHouse.OLYMPUS, 0.3)
+    expected = system.execute_biographical_resonance()
+    manager.flush()
+    assert manager.live == 0
+
+    reloaded = manager.get("A")
+    assert reloaded is not system and manager.loads == 2
+    assert reloaded.sovereign_name == "Sovereign A" and reloaded.resonance_cycles == 2
+    assert reloaded.active_agents["Zeus"].resonance_level == 0.6
+    assert "Newcomer" in reloaded.active_agents
+
+    reference = HarmoniaOrchestrator("Sovereign A")
+    reference.execute_biographical_resonance()
+    reference.active_agents["Zeus"].resonance_level = 0.6
+    reference.register_agent("Newcomer", AgentHouse.OLYMPUS, 0.3)
+    assert reference.execute_biographical_resonance() == expected
+    assert reloaded.execute_biographical_resonance() == reference.execute_biographical_resonance()
+
+
+def test_session_pins_a_tenant(manager):
+    with manager.session("A") as pinned:
+        for tenant_id in "BCD":
+            manager.get(tenant_id)
+        assert manager.get("A") is pinned
+        assert manager.tenants["A"].pins == 1
+    assert manager.tenants["A"].pins == 0
+    assert manager.live == 2
+
+
+def test_nested_sessions_keep_the_inner_tenant_live(tmp_path):
+    manager = TenantManager(str(tmp_path), max_live=1)
+    manager.add("A")
+    manager.add("B")
+    with manager.session("A") as outer:
+        with manager.session("B") as inner:
+            # Both pinned: the live set goes over max_live rather than evict either
+            assert manager.live == 2 and manager.get("B") is inner
+            inner.execute_biographical_resonance()
+        assert manager.get("A") is outer
+        assert manager.live == 1
+    assert manager.get("B").resonance_cycles == 1
+
+
+def test_get_never_evicts_the_tenant_it_returns(tmp_path):
+    manager = TenantManager(str(tmp_path), max_live=1)
+    manager.add("A")
+    manager.add("B")
+    with manager.session("A"):
+        system = manager.get("B")
+        system.execute_biographical_resonance()
+        assert manager.get("B") is system
+    assert manager.get("B").resonance_cycles == 1
+
+
+def test_remove_deletes_the_snapshot(manager):
+    manager.get("A")
+    manager.flush()
+    path = manager.tenants["A"].snapshot
+    with manager.session("B"):
+        with pytest.raises(RuntimeError):
+            manager.remove("B")
+    manager.remove("A")
+    assert "A" not in manager and not os.path.exists(path)
+    with pytest.raises(KeyError):
+        manager.get("A")